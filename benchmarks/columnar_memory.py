@@ -0,0 +1,79 @@
+# Memory of loaded semesters: Semester models vs source.columnar.ColumnarStore
+#
+# Builds the same seeded data (see datagen.py) both ways, from the saved JSON bytes, and
+# reports the memory each keeps alive (tracemalloc), scaled to 100k assignments:
+#   python benchmarks/columnar_memory.py -a 100000
+#   python benchmarks/columnar_memory.py -a 200000 --json
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+HERE = Path(__file__).resolve().parent
+SRC = HERE.parent / "src"
+PER = 100_000
+
+
+def measure(build: Callable[[], object]) -> dict:
+    """Bytes still allocated after `build()` (while its result is alive), and the time it took."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"bytes": current, "peak_bytes": peak, "seconds": seconds}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Memory per 100k assignments: models vs columnar store.")
+    parser.add_argument("-a", "--assignments", type=int, default=PER, help="total assignments (default: 100000)")
+    parser.add_argument("-m", "--subjects", type=int, default=8, help="subjects per semester")
+    parser.add_argument("-k", "--per-subject", type=int, default=50, help="assignments per subject")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(SRC))
+    sys.path.insert(0, str(HERE))
+    import datagen
+    from source.classes import Semester
+    from source.columnar import ColumnarStore
+    from source.jsonio import loads
+
+    n_semesters = max(1, -(-args.assignments // (args.subjects * args.per_subject)))
+    files: List[bytes] = [json.dumps(d).encode() for d in
+                          datagen.semester_dicts(n_semesters, args.subjects, args.per_subject, args.seed)]
+    total = n_semesters * args.subjects * args.per_subject
+    Semester.from_json_bytes(files[0])  # warm up pydantic before measuring
+
+    results = {
+        "models": measure(lambda: [Semester.from_json_bytes(b) for b in files]),
+        "columnar": measure(lambda: ColumnarStore.from_dicts(loads(b) for b in files)),
+    }
+    for r in results.values():
+        r["bytes_per_100k"] = r["bytes"] * PER / total
+    report = {"assignments": total, "semesters": n_semesters, "results": results,
+              "ratio": results["models"]["bytes"] / results["columnar"]["bytes"]}
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{total} assignments in {n_semesters} semesters")
+    print(f"{'store':<10}{'MB kept':>10}{'MB / 100k':>12}{'peak MB':>10}{'build s':>10}")
+    for name, r in results.items():
+        print(f"{name:<10}{r['bytes'] / 1e6:>10.1f}{r['bytes_per_100k'] / 1e6:>12.1f}"
+              f"{r['peak_bytes'] / 1e6:>10.1f}{r['seconds']:>10.2f}")
+    print(f"models use {report['ratio']:.1f}x the memory of the columnar store")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# Seeded synthetic planner data for the benchmarks
+#
+# generate(n, m, k, seed) builds n semesters of m subjects with k assignments each. The same
+# seed always gives the same names, credits, scores and done flags; deadlines are the same
+# offsets (-30..+30 days) from `now`, so every run has the same mix of overdue, near and
+# far deadlines.
+
+import random
+from datetime import datetime as dt, timedelta
+from typing import List, Optional
+
+SEASONS = ("Spring", "Summer", "Fall")
+CREDITS = (1.0, 2.0, 3.0, 3.0, 3.0, 4.0)
+DEADLINE_FORMAT = "%m/%d/%y %H:%M:%S"
+DEADLINE_SPREAD_DAYS = 30
+DONE_RATE = 0.6
+
+
+def semester_dicts(n_semesters: int, n_subjects: int, n_assignments: int, seed: int = 0,
+                   now: Optional[dt] = None) -> List[dict]:
+    """The generated semesters as plain dicts, in the saved-file layout."""
+    rng = random.Random(seed)
+    now = (now or dt.now()).replace(microsecond=0)
+    spread = DEADLINE_SPREAD_DAYS * 86400
+    semesters = []
+    for i in range(n_semesters):
+        year, season = str(2000 + i // len(SEASONS)), SEASONS[i % len(SEASONS)]
+        subjects = []
+        for j in range(n_subjects):
+            assignments = []
+            for a in range(n_assignments):
+                max_score = float(rng.choice((5, 10, 20, 25, 50, 100)))
+                done = rng.random() < DONE_RATE
+                deadline = now + timedelta(seconds=rng.randint(-spread, spread))
+                assignments.append({
+                    "name": f"Work {a + 1}",
+                    "max_score": max_score,
+                    "deadline": deadline.strftime(DEADLINE_FORMAT),
+                    "current_score": round(rng.uniform(0, max_score), 1) if done else 0.0,
+                    "isDone": done,
+                })
+            subjects.append({"name": f"Subject {i + 1}-{j + 1}", "course_code": f"{i + 1:03d}{j + 1:05d}",
+                             "credit": rng.choice(CREDITS), "assignments": assignments})
+        semesters.append({"year": year, "season": season, "subjects": subjects,
+                          "file_path": f"{year}_{season}.json"})
+    return semesters
+
+
+def generate(n_semesters: int, n_subjects: int, n_assignments: int, seed: int = 0,
+             now: Optional[dt] = None) -> list:
+    """The generated semesters as Semester models (source must be importable)."""
+    from source import Semester
+
+    return [Semester.from_dict(d) for d in semester_dicts(n_semesters, n_subjects, n_assignments, seed, now)]
+
+
+def scores(count: int, seed: int = 0) -> List[float]:
+    """Seeded subject scores for grade lookups, including out-of-range and boundary values."""
+    rng = random.Random(seed)
+    edges = [-1.0, 0.0, 50.0, 55.0, 60.0, 65.0, 70.0, 75.0, 80.0, 100.0, 105.0]
+    return [rng.choice(edges) if rng.random() < 0.1 else round(rng.uniform(0, 100), 2) for _ in range(count)]
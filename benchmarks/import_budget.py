@@ -0,0 +1,70 @@
+# Cold-start budget for the interactive app
+#
+# Imports app in fresh interpreters and fails (exit 1) when the median import time goes
+# over the budget, or when a module the main menu does not need (pydantic, the models,
+# platformdirs, ...) is imported at startup again. Run from anywhere:
+#   python benchmarks/import_budget.py [--budget-ms 60] [--runs 7]
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+DEFAULT_BUDGET_MS = 60.0
+DEFAULT_RUNS = 7
+
+# modules that must only load once a semester is opened, saved or the CLI is used
+DEFERRED = ("pydantic", "platformdirs", "source.classes", "orjson", "numpy", "sqlite3",
+            "concurrent.futures", "source.cli", "source.importer", "source.batch")
+
+_CHILD = f"""
+import json, sys, time
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {DEFERRED!r} if m in sys.modules]}}))
+"""
+
+
+def measure(runs: int) -> dict:
+    """Median `import app` time over `runs` fresh interpreters, and the deferred modules it loaded."""
+    subprocess.run([sys.executable, "-c", "import app"], cwd=SRC, check=True)  # warm .pyc files
+    times, loaded = [], set()
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _CHILD], cwd=SRC, check=True,
+                             capture_output=True, text=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        times.append(result["ms"])
+        loaded.update(result["loaded"])
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "max_ms": max(times),
+            "loaded": sorted(loaded)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fail if `import app` regresses past a time budget.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"allowed median import time (default: {DEFAULT_BUDGET_MS:g})")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    result = measure(args.runs)
+    result["budget_ms"] = args.budget_ms
+    ok = result["median_ms"] <= args.budget_ms and not result["loaded"]
+    if args.json:
+        json.dump(result | {"ok": ok}, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"import app: median {result['median_ms']:.1f} ms (min {result['min_ms']:.1f}, "
+              f"max {result['max_ms']:.1f}) over {args.runs} runs; budget {args.budget_ms:g} ms")
+        if result["loaded"]:
+            print("imported at startup but should be deferred: " + ", ".join(result["loaded"]))
+        print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
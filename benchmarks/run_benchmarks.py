@@ -0,0 +1,175 @@
+# Benchmarks for the planner's hot paths on seeded synthetic data
+#
+# Generates N semesters x M subjects x K assignments (see datagen.py) into a throw-away
+# saves folder and times loading, saving, GPA/GPAX, the deadline report, rendering and
+# grade lookups. Results can be written as JSON and compared against an earlier run:
+#   python benchmarks/run_benchmarks.py -n 20 -m 8 -k 40 -o results.json
+#   python benchmarks/run_benchmarks.py -o new.json --compare results.json
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime as dt
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+HERE = Path(__file__).resolve().parent
+SRC = HERE.parent / "src"
+RESULTS_VERSION = 1
+GRADE_LOOKUPS = 100_000
+WORKLOAD = ("seed", "semesters", "subjects", "assignments")
+
+# settings that would change what is measured; cleared so runs are comparable
+PINNED_ENV = ("STUDENT_PLANNER_BACKEND", "STUDENT_PLANNER_GRADING_SCALE", "STUDENT_PLANNER_TRUSTED_CACHE",
+              "STUDENT_PLANNER_CHECK_AGGREGATES", "STUDENT_PLANNER_SNAPSHOT")
+
+
+class Bench:
+    """One timed operation: `run` does `ops` units of work, `setup` (untimed) runs before each sample."""
+
+    def __init__(self, name: str, ops: int, run: Callable[[], object], setup: Optional[Callable[[], object]] = None):
+        self.name = name
+        self.ops = ops
+        self.run = run
+        self.setup = setup
+
+    def measure(self, repeat: int) -> dict:
+        samples = []
+        for _ in range(repeat):
+            if self.setup is not None:
+                self.setup()
+            start = time.perf_counter()
+            self.run()
+            samples.append(time.perf_counter() - start)
+        median = statistics.median(samples)
+        return {"ops": self.ops, "runs": repeat, "min_s": min(samples), "median_s": median,
+                "mean_s": statistics.fmean(samples), "ops_per_s": self.ops / median if median else None}
+
+
+def build(semesters: list, grade_scores: List[float]) -> List[Bench]:
+    from source import calculate_gpa, calculate_gpax, check_path, deadline_report, get_grade_point
+    from source import utils
+
+    subjects = [subject for s in semesters for subject in s.subjects]
+    n_assignments = sum(len(subject.assignments) for subject in subjects)
+
+    def save_all():
+        for s in semesters:
+            s.to_json()
+
+    def gpa_all():
+        for s in semesters:
+            calculate_gpa(s)
+
+    def report():
+        with redirect_stdout(io.StringIO()):
+            deadline_report(semesters)
+
+    def show_all():
+        for s in semesters:
+            s.show()
+
+    def drop_renders():
+        for subject in subjects:
+            subject._touch()
+
+    def grade_lookups():
+        for score in grade_scores:
+            get_grade_point(score)
+
+    return [
+        Bench("to_json", len(semesters), save_all),
+        Bench("check_path.cold", len(semesters), check_path, setup=utils._SEMESTER_CACHE.clear),
+        Bench("check_path.warm", len(semesters), check_path),
+        Bench("calculate_gpa", len(semesters), gpa_all),
+        Bench("calculate_gpax", len(semesters), lambda: calculate_gpax(semesters)),
+        Bench("deadline_report", n_assignments, report),
+        Bench("show.cold", len(semesters), show_all, setup=drop_renders),
+        Bench("show.warm", len(semesters), show_all),
+        Bench("get_grade_point", len(grade_scores), grade_lookups),
+    ]
+
+
+def run(args: argparse.Namespace, data_dir: str) -> dict:
+    # a private saves folder, set before source resolves saves_dir()
+    os.environ["XDG_DATA_HOME"] = data_dir
+    for name in PINNED_ENV:
+        os.environ.pop(name, None)
+    sys.path.insert(0, str(SRC))
+    sys.path.insert(0, str(HERE))
+    import datagen
+    from source import utils, version
+
+    # platformdirs ignores XDG_DATA_HOME on Windows and macOS: pin the folder itself too
+    saves = Path(data_dir).resolve() / "Student_Planner" / "Saves"
+    saves.mkdir(parents=True, exist_ok=True)
+    utils._SAVES_DIR = saves
+    if not utils.saves_dir().resolve().is_relative_to(Path(data_dir).resolve()):
+        raise RuntimeError(f"refusing to write benchmark data outside {data_dir}: {utils.saves_dir()}")
+
+    semesters = datagen.generate(args.semesters, args.subjects, args.assignments, args.seed)
+    for s in semesters:
+        s.to_json()  # the files check_path reads
+    results = {}
+    for bench in build(semesters, datagen.scores(GRADE_LOOKUPS, args.seed)):
+        if args.only and bench.name not in args.only:
+            continue
+        results[bench.name] = bench.measure(args.repeat)
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {"package_version": version, "python": platform.python_version(), "platform": platform.platform(),
+                 "date": dt.now().isoformat(timespec="seconds"), "seed": args.seed, "repeat": args.repeat,
+                 "semesters": args.semesters, "subjects": args.subjects, "assignments": args.assignments},
+        "results": results,
+    }
+
+
+def print_table(report: dict, baseline: Optional[dict] = None) -> None:
+    old: Dict[str, dict] = (baseline or {}).get("results", {})
+    if baseline:
+        differ = [key for key in WORKLOAD if baseline["meta"].get(key) != report["meta"][key]]
+        if differ:
+            print(f"warning: baseline was run with a different {', '.join(differ)}; timings are not comparable")
+    print(f"{'benchmark':<18}{'median ms':>12}{'ops/s':>14}" + (f"{'baseline ms':>14}{'speedup':>10}" if old else ""))
+    for name, r in report["results"].items():
+        line = f"{name:<18}{r['median_s'] * 1000:>12.3f}{r['ops_per_s'] or 0:>14.0f}"
+        if name in old:
+            before = old[name]["median_s"]
+            line += f"{before * 1000:>14.3f}{before / r['median_s'] if r['median_s'] else 0:>9.2f}x"
+        print(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time the planner's hot paths on seeded synthetic data.")
+    parser.add_argument("-n", "--semesters", type=int, default=12)
+    parser.add_argument("-m", "--subjects", type=int, default=8, help="subjects per semester")
+    parser.add_argument("-k", "--assignments", type=int, default=30, help="assignments per subject")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timed samples per benchmark")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="run only these benchmarks")
+    parser.add_argument("--data-dir", help="where to write the generated saves (default: a new temp folder)")
+    parser.add_argument("-o", "--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="results JSON of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    if args.data_dir:
+        report = run(args, args.data_dir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="planner-bench-") as data_dir:
+            report = run(args, data_dir)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print_table(report, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
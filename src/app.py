@@ -1,15 +1,41 @@
 # app.py
+#
+# Only what the main menu needs is imported up front; the models (and pydantic) load the
+# first time a semester file is read or created, the CLI only when arguments are given.
+
+from __future__ import annotations
 
 try:
-    from .source import *
+    from . import source
+    from .source.manifest import SemesterHeader, semester_headers, calculate_gpax_headers
+    from .source.savemanager import save_manager
+    from .source.deadlines import deadline_index
+    from .source.instrument import enable_from_argv, timed
+    from .source.watcher import save_watcher
+    from .source.journal import set_op, add_op, remove_op
+    from .source.terminal import read_line, pause, tui_requested, start_tui, stop_tui
+    from .source.utils import check_path, clear, deadline_report, last_load_errors, saves_dir
 except Exception:
-    from source import *
-
-from typing import Optional, Dict, List
-import time
+    import source
+    from source.manifest import SemesterHeader, semester_headers, calculate_gpax_headers
+    from source.savemanager import save_manager
+    from source.deadlines import deadline_index
+    from source.instrument import enable_from_argv, timed
+    from source.watcher import save_watcher
+    from source.journal import set_op, add_op, remove_op
+    from source.terminal import read_line, pause, tui_requested, start_tui, stop_tui
+    from source.utils import check_path, clear, deadline_report, last_load_errors, saves_dir
+
+from typing import TYPE_CHECKING, Optional, Dict, List
+import functools
 import os
+import sys
+
+if TYPE_CHECKING:
+    from source import Assignment, Semester, Subject
 
 PRINT_SECTION_SPACES_VALUES = 0
+MAIN_MENU_PAGE_SIZE = 5
 
 def print_section(section: str) -> None:
     """Print a boxed section title."""
@@ -37,9 +63,19 @@ def prompt_choice(raw: str, valid_map: Dict[str, List[str]]) -> str:
 
 def confirm(title: str, data: str) -> bool:
     """Simple yes/no confirm prompt."""
-    res = input(f"Confirm {title}?\n{data} (Y/N) --> ").lower().strip()
+    res = read_line(f"Confirm {title}?\n{data} (Y/N) --> ").lower().strip()
     return res in ("y", "yes")
 
+def flush_on_leave(menu):
+    """Write the edits a menu coalesced once the user leaves it."""
+    @functools.wraps(menu)
+    def wrapper(*args, **kwargs):
+        try:
+            return menu(*args, **kwargs)
+        finally:
+            save_manager.flush()
+    return wrapper
+
 def find_semester_for_subject(subject: Subject, semesters: List[Semester]) -> Optional[Semester]:
     for s in semesters:
         if subject in s.subjects:
@@ -47,23 +83,72 @@ def find_semester_for_subject(subject: Subject, semesters: List[Semester]) -> Op
     return None
 
 
+def reload_if_changed(semester: Semester) -> Optional[Semester]:
+    """
+    The semester as saved now if another program changed its file since it was loaded
+    (None if the file was removed or broken), else `semester`. Unsaved edits win.
+    """
+    if not semester.file_path or save_manager.is_dirty(semester):
+        return semester
+    updated = save_watcher.refresh()
+    path = saves_dir() / semester.file_path
+    return updated[path] if path in updated else semester
+
+
 # ---------------- Main loop & top-level menus ---------------- #
 
+def print_semester_page(headers: list, page: int, expanded: set) -> int:
+    """
+    Print one page of semester summaries from their manifest headers; expanded semesters
+    (by file name) are loaded and shown in full. Returns the page shown.
+    """
+    pages = max(1, -(-len(headers) // MAIN_MENU_PAGE_SIZE))
+    page = min(max(page, 0), pages - 1)
+    start = page * MAIN_MENU_PAGE_SIZE
+    for i, h in enumerate(headers[start:start + MAIN_MENU_PAGE_SIZE], start + 1):
+        if h.file_path in expanded:
+            print("\n# ---------------- Semester Break ---------------- #\n")
+            print(h.load().show())
+            print()
+        else:
+            print(f"({i}) {h.summary()}")
+    if pages > 1:
+        print(f"\nPage {page + 1}/{pages} | Next (n) | Previous (p)")
+    return page
+
+
+@timed("menu.main")
 def main_loop():
     """Main loop that repeatedly shows the top menu."""
+    page = 0
+    expanded = set()
     while True:
         clear()
-        semesters = check_path()
+        headers = semester_headers()
+        expanded &= {h.file_path for h in headers}
         print_section("Main Menu")
-        if semesters:
-            for s in semesters:
-                print("\n# ---------------- Semester Break ---------------- #\n")
-                print(s.show())
-        gpax = calculate_gpax(semesters)
+        skipped = last_load_errors()
+        if skipped:
+            print(f"Warning: {len(skipped)} save file(s) could not be fully loaded: "
+                  + ", ".join(p.name for p, _ in skipped) + "\n")
+        if headers:
+            page = print_semester_page(headers, page, expanded)
+        gpax = calculate_gpax_headers(headers)
         print()
         print_section(f"Cumulative GPAX : {gpax:.2f}")
         print("\nWhich option you wanted to choose?\n")
-        raw = input("Select Semester (1) | Add a Semester (2) | Check Deadline (3) | Quit (4)\n")
+        raw = read_line("Select Semester (1) | Add a Semester (2) | Check Deadline (3) | Quit (4)\n"
+                        "Expand/Collapse a semester (e<number>)\n")
+        cmd = raw.lower().strip()
+        if cmd in ("n", "next", "p", "prev", "previous"):
+            page += 1 if cmd.startswith("n") else -1
+            continue
+        if cmd.startswith("e") and cmd[1:].strip().isdigit():
+            n = int(cmd[1:].strip())
+            if 1 <= n <= len(headers):
+                expanded ^= {headers[n - 1].file_path}
+                page = (n - 1) // MAIN_MENU_PAGE_SIZE
+            continue
         opt = prompt_choice(raw, {
             "select_semester": ["1", "(1)", "select semester", "select"],
             "add_semester": ["2", "(2)", "add another semester", "add another", "add semester", "add"],
@@ -74,13 +159,13 @@ def main_loop():
         match opt:
 
             case "select_semester":
-                semester_menu(semesters)
+                semester_menu(headers)
             case "add_semester":
-                add_semester_flow(semesters)
+                add_semester_flow(headers)
             case "check_deadline":
                 clear()
-                deadline_report(semesters)
-                sub = input("Type anything to return to Main Menu | Quit (q)\n").lower().strip()
+                deadline_report(check_path())
+                sub = read_line("Type anything to return to Main Menu | Quit (q)\n").lower().strip()
                 if sub in ("q", "quit"):
                     clear()
                     return
@@ -90,38 +175,40 @@ def main_loop():
             case _:
                 clear()
                 print("Please type a proper option. Returning to Main Menu in 3 seconds...")
-                time.sleep(3)
+                pause(3)
 
 
 # ---------------- Semester-level flows ---------------- #
 
-def add_semester_flow(semesters: List[Semester]) -> None:
+@timed("menu.add_semester")
+def add_semester_flow(headers: list) -> None:
     clear()
-    year = input("Input new semester year (20xx) \n").strip()
+    year = read_line("Input new semester year (20xx) \n").strip()
     clear()
-    season = input("Input new semester season (Fall/Summer/etc.)\n").strip()
+    season = read_line("Input new semester season (Fall/Summer/etc.)\n").strip()
     clear()
     print("NOTE : IF A FILE WITH THE SAME NAME ALREADY EXIST, THIS ACTION WILL OVERWRITE THE FILE")
     if not confirm("Semester", f"{year}_{season}"):
         print("Canceled semester adding, returning to Main Menu in 3 seconds...")
-        time.sleep(3)
+        pause(3)
         return
     try:
-        new_semester = Semester(year=year, season=season)
-        new_semester.to_json()
-        semesters.append(new_semester)
+        new_semester = source.Semester(year=year, season=season)
+        new_semester.save()
+        headers.append(SemesterHeader.from_semester(new_semester))
         print("\nSemester Added! Returning to Main Menu in 3 seconds...")
     except Exception as e:
         print(f"Error Occurred : {e}")
-    time.sleep(3)
+    pause(3)
 
 def delete_semester(semester: Optional[Semester], semesters: List[Semester]) -> None:
     clear()
     if not confirm("Semester Deletion", f"{semester.year}_{semester.season}"):
         print("Canceled Semester Deletion.")
-        time.sleep(3)
+        pause(3)
         return
     try:
+        save_manager.flush(semester)
         if hasattr(semester, "delete"):
             try:
                 semester.delete()
@@ -143,24 +230,44 @@ def delete_semester(semester: Optional[Semester], semesters: List[Semester]) ->
         print("Semester deleted. Returning to Main Menu...")
     except Exception as e:
         print(f"Error deleting semester: {e}")
-    time.sleep(3)
+    pause(3)
 
 
-def semester_menu(semesters: List[Semester]) -> None:
-    """Choose a semester and operate on it."""
-    if not semesters:
+@timed("menu.semester")
+@flush_on_leave
+def semester_menu(headers: list) -> None:
+    """Choose a semester (from the manifest headers) and operate on it; only that one is fully loaded."""
+    if not headers:
         print("No semesters available. Returning to Main Menu...")
-        time.sleep(3)
+        pause(3)
         return
 
-    current = semester_selection_menu(semesters=semesters)
+    header = semester_selection_menu(semesters=headers)
+    if header is None:
+        return
+    try:
+        current = header.load()
+    except Exception as e:
+        print(f"Could not open semester: {e}")
+        pause(3)
+        return
+    semesters = [current]
 
     # semester operations loop
     while True:
+        fresh = reload_if_changed(current)
         clear()
-        print_section(current.info()[:-1])
+        if fresh is None:
+            print("This semester was deleted or damaged outside the planner. Returning to Main Menu...")
+            pause(3)
+            return
+        print_section(fresh.info()[:-1])
+        if fresh is not current:
+            current = fresh
+            semesters = [current]
+            print("(Reloaded: this semester was changed outside the planner.)\n")
         print(current.show().replace(current.info(), "") +"\n")
-        raw = input("Select Class (1) | Add a Class (2) | Edit Semester (3) | Back to Main Menu (4) | Quit (5)\n").lower().strip()
+        raw = read_line("Select Class (1) | Add a Class (2) | Edit Semester (3) | Back to Main Menu (4) | Quit (5)\n").lower().strip()
         opt = prompt_choice(raw, {
             "select_class": ["1", "(1)", "select class"],
             "add_class": ["2", "(2)", "add class", "add a class"],
@@ -181,7 +288,7 @@ def semester_menu(semesters: List[Semester]) -> None:
 
             case "edit_semester":
                 semester_edit_menu(current, semesters)
-                if current not in check_path():
+                if current.file_path not in {h.file_path for h in semester_headers()}:
                     return
 
             case "back":
@@ -193,10 +300,11 @@ def semester_menu(semesters: List[Semester]) -> None:
 
             case _:
                 print("Please type a proper option.")
-                time.sleep(3)
+                pause(3)
 
-def semester_selection_menu(semesters: List[Semester]) -> Optional[Semester]:
-    """Let user pick a semester."""
+@timed("menu.semester_selection")
+def semester_selection_menu(semesters: list):
+    """Let user pick a semester (or its manifest header)."""
     while True:
         clear()
         print_section("Semester Selection")
@@ -204,7 +312,7 @@ def semester_selection_menu(semesters: List[Semester]) -> Optional[Semester]:
         for i, sem in enumerate(semesters, start=1):
             print(f"{i} | {sem.info().strip()}\n")
 
-        opt = input("Please select your semester (Type a number) | Type back to go back to menu | Type quit to exit the program\n").lower().strip()
+        opt = read_line("Please select your semester (Type a number) | Type back to go back to menu | Type quit to exit the program\n").lower().strip()
 
         if opt in [str(i) for i in range(1, len(semesters) + 1)]:
             current = semesters[int(opt) - 1]
@@ -217,13 +325,14 @@ def semester_selection_menu(semesters: List[Semester]) -> Optional[Semester]:
             clear()
             exit(0)
         print("Please type a proper option.")
-        time.sleep(3)
+        pause(3)
 
+@timed("menu.semester_edit")
 def semester_edit_menu(semester: Semester, semesters: List[Semester]) -> None:
     clear()
     print_section("Edit Semester")
     print(semester.show() + "\n")
-    raw = input("Edit Year (1) | Edit Season (2) | Delete Semester (3) | Back (4) | Quit (5)\n").lower().strip()
+    raw = read_line("Edit Year (1) | Edit Season (2) | Delete Semester (3) | Back (4) | Quit (5)\n").lower().strip()
     opt = prompt_choice(raw, {
             "edit_year": ["1", "(1)", "edit year"],
             "edit_season": ["2", "(2)", "edit season"],
@@ -235,9 +344,10 @@ def semester_edit_menu(semester: Semester, semesters: List[Semester]) -> None:
     match opt:
         case "edit_year":
             clear()
-            new_year = input("Enter new year (20xx):\n").strip()
+            new_year = read_line("Enter new year (20xx):\n").strip()
             if confirm("Semester Year Editing", f"{semester.year}(Old) --> {new_year}(New)"):
                 try:
+                    save_manager.flush(semester)
                     if hasattr(semester, "delete"):
                         try:
                             semester.delete()
@@ -258,23 +368,24 @@ def semester_edit_menu(semester: Semester, semesters: List[Semester]) -> None:
 
                 except Exception as e:
                     print(f"Error deleting semester: {e}")
-                    time.sleep(3)
+                    pause(3)
 
                 semester.year = new_year
-                semester.to_json()
+                semester.save()
                 semesters.append(semester)
                 print("Successfully updated the semester season.")
             else:
                 print("Canceled.")
-                time.sleep(3)
+                pause(3)
                 return
             return
 
         case "edit_season":
             clear()
-            new_season = input("Enter new season (Fall/Summer/etc.):\n").strip()
+            new_season = read_line("Enter new season (Fall/Summer/etc.):\n").strip()
             if confirm("Semester Season Editing", f"{semester.season}(Old) --> {new_season}(New)"):
                 try:
+                    save_manager.flush(semester)
                     if hasattr(semester, "delete"):
                         try:
                             semester.delete()
@@ -295,15 +406,15 @@ def semester_edit_menu(semester: Semester, semesters: List[Semester]) -> None:
 
                 except Exception as e:
                     print(f"Error deleting semester: {e}")
-                    time.sleep(3)
+                    pause(3)
 
                 semester.season = new_season
-                semester.to_json()
+                semester.save()
                 semesters.append(semester)
                 print("Successfully updated the semester season.")
             else:
                 print("Canceled.")
-                time.sleep(3)
+                pause(3)
                 return
 
         case "delete_semester":
@@ -320,17 +431,18 @@ def semester_edit_menu(semester: Semester, semesters: List[Semester]) -> None:
         case _:
             clear()
             print("Please type a proper option.")
-            time.sleep(3)
+            pause(3)
             return
 
 
 # ---------------- Subject-level flows ---------------- #
 
+@timed("menu.subject_selection")
 def subject_selection_menu(semester: Semester) -> Optional[Subject]:
     """Let user pick a subject inside a semester."""
     if not semester.subjects:
         print("No subjects in this semester.")
-        time.sleep(3)
+        pause(3)
         return None
 
     while True:
@@ -338,7 +450,7 @@ def subject_selection_menu(semester: Semester) -> Optional[Subject]:
         print_section("Class Selection")
         for i, subj in enumerate(semester.subjects, start=1):
             print(f"{i} | {subj.info().strip()}\n")
-        opt = input("Please select your class (Type a number) | Type back to go back | Type quit to exit\n").lower().strip()
+        opt = read_line("Please select your class (Type a number) | Type back to go back | Type quit to exit\n").lower().strip()
         if opt in [str(i) for i in range(1, len(semester.subjects) + 1)]:
             return semester.subjects[int(opt) - 1]
         if opt in ("back", "b"):
@@ -347,40 +459,43 @@ def subject_selection_menu(semester: Semester) -> Optional[Subject]:
             clear()
             exit(0)
         print("Please type a proper option.")
-        time.sleep(3)
+        pause(3)
 
 
+@timed("menu.subject_adding")
 def subject_adding_menu(semester: Semester) -> None:
     clear()
-    name = input("Input Class name (Calculus 1/Linear algebra/etc.)\n").strip()
+    name = read_line("Input Class name (Calculus 1/Linear algebra/etc.)\n").strip()
     clear()
     try:
-        credit = float(input("Input Class credit (3.0/2.0/etc.)\n").strip())
+        credit = float(read_line("Input Class credit (3.0/2.0/etc.)\n").strip())
     except ValueError:
         print("Value Error, please enter a proper credit")
-        time.sleep(3)
+        pause(3)
         return
     clear()
-    course_code = input("Input course code (06066303/etc.) (Optional, leave blank)\n").strip() or None
+    course_code = read_line("Input course code (06066303/etc.) (Optional, leave blank)\n").strip() or None
 
     try:
-        subject = Subject(name=name, credit=credit, course_code=course_code)
+        subject = source.Subject(name=name, credit=credit, course_code=course_code)
         semester.subjects.append(subject)
-        semester.to_json()
+        save_manager.mark(semester, add_op(semester, subject))
         print("Successfully added the subject")
         print(subject.show().replace("No Current Assignment", "").strip())
     except Exception as e:
         print(f"Error Occurred : {e}")
-    time.sleep(3)
+    pause(3)
 
 
+@timed("menu.subject")
+@flush_on_leave
 def subject_menu(subject: Subject, semester: Semester, semesters: List[Semester]) -> None:
     """Operations for a single subject."""
     while True:
         clear()
         print_section(subject.info()[:-2])
         print(subject.show().replace(subject.info(), "") + "\n")
-        raw = input("Select Assignment (1) | Add Assignment (2) | Edit Class (3) | Delete Class (4) | Back to Semester Menu (5)\n").lower().strip()
+        raw = read_line("Select Assignment (1) | Add Assignment (2) | Edit Class (3) | Delete Class (4) | Back to Semester Menu (5)\n").lower().strip()
         opt = prompt_choice(raw, {
             "select_assignment": ["1", "(1)", "select assignment"],
             "add_assignment": ["2", "(2)", "add assignment"],
@@ -394,7 +509,7 @@ def subject_menu(subject: Subject, semester: Semester, semesters: List[Semester]
             case "select_assignment":
                 if not subject.assignments:
                     print("No assignments in this class. Returning...")
-                    time.sleep(3)
+                    pause(3)
                     return
                 assignment = assignment_selection_menu(subject)
                 if assignment:
@@ -406,25 +521,28 @@ def subject_menu(subject: Subject, semester: Semester, semesters: List[Semester]
             case "delete_class":
                 if not confirm("Class Deletion", f"{subject.name} | Credit : {subject.credit}"):
                     print("Canceled.")
-                    time.sleep(3)
+                    pause(3)
                     continue
                 try:
+                    op = remove_op(semester, subject)
                     semester.subjects.remove(subject)
-                    semester.to_json()
+                    save_manager.mark(semester, op)
+                    deadline_index.discard_subject(subject)
                     print("Successfully deleted the class.")
                 except Exception as e:
                     print(f"Error occurred while deleting: {e}")
-                time.sleep(3)
+                pause(3)
                 return
             case "back":
                 return
             case _:
                 print("Invalid option.")
-                time.sleep(3)
+                pause(3)
 
 
 # ---------------- Assignment-level flows ---------------- #
 
+@timed("menu.assignment_selection")
 def assignment_selection_menu(subject: Subject) -> Optional[Assignment]:
     if not subject.assignments:
         return None
@@ -433,7 +551,7 @@ def assignment_selection_menu(subject: Subject) -> Optional[Assignment]:
         print_section("Select Assignment")
         for i, a in enumerate(subject.assignments, start=1):
             print(f"{i} | {a.name} | Score : {a.current_score}/{a.max_score} | Status : {a.status} | Due : {a.deadline}")
-        opt = input("Please select your assignment (Type a number) | Type back to go back | Type quit to exit\n").lower().strip()
+        opt = read_line("Please select your assignment (Type a number) | Type back to go back | Type quit to exit\n").lower().strip()
 
         if opt in [str(i) for i in range(1, len(subject.assignments) + 1)]:
             return subject.assignments[int(opt) - 1]
@@ -446,42 +564,46 @@ def assignment_selection_menu(subject: Subject) -> Optional[Assignment]:
             exit(0)
 
         print("Invalid option. Try again.")
-        time.sleep(3)
+        pause(3)
 
 
+@timed("menu.assignment_adding")
 def assignment_adding_menu(subject: Subject, semester: Semester) -> None:
     clear()
-    name = input("Input Assignment name:\n").strip()
+    name = read_line("Input Assignment name:\n").strip()
     try:
-        max_score = float(input("Input Maximum score for this assignment (e.g. 15):\n").strip())
+        max_score = float(read_line("Input Maximum score for this assignment (e.g. 15):\n").strip())
     except ValueError:
         print("Invalid max score. Returning to Class Menu...")
-        time.sleep(3)
+        pause(3)
         return
 
     print("Input deadline in format : Month/Day/Year Hour:Minute (e.g. 04/24/25 13:55). Leave blank for no deadline.")
-    deadline = input("Deadline: ").strip() or None
+    deadline = read_line("Deadline: ").strip() or None
     if deadline:
         deadline += ":00"
 
     try:
-        new_assign = Assignment(name=name, max_score=max_score, deadline=deadline)
+        new_assign = source.Assignment(name=name, max_score=max_score, deadline=deadline)
         subject.assignments.append(new_assign)
-        semester.to_json()
+        save_manager.mark(semester, add_op(semester, new_assign))
+        deadline_index.update(new_assign, subject, semester)
         print("Successfully added assignment.")
         print(new_assign.show())
     except Exception as e:
         print(f"Error occurred while adding assignment: {e}")
-    time.sleep(3)
+    pause(3)
 
 
+@timed("menu.assignment_edit")
+@flush_on_leave
 def assignment_edit_menu(assignment: Assignment, subject: Subject, semester: Semester) -> None:
     """Looped assignment editor; returns when user chooses back."""
     while True:
         clear()
         print_section("Assignment Menu")
         print(assignment.show())
-        raw = input("Edit Name (1) | Edit Current Score (2) | Edit Max Score (3) | Edit Deadline (4) | Toggle Done (5) | Delete Assignment (6) | Back (7) | Quit (8)\n").lower().strip()
+        raw = read_line("Edit Name (1) | Edit Current Score (2) | Edit Max Score (3) | Edit Deadline (4) | Toggle Done (5) | Delete Assignment (6) | Back (7) | Quit (8)\n").lower().strip()
         opt = prompt_choice(raw, {
             "edit_name": ["1", "(1)", "edit name"],
             "edit_current_score": ["2", "(2)", "edit current score"],
@@ -495,84 +617,87 @@ def assignment_edit_menu(assignment: Assignment, subject: Subject, semester: Sem
         
         match opt:
             case "edit_name":
-                new_name = input("Please enter new assignment name:\n").strip()
+                new_name = read_line("Please enter new assignment name:\n").strip()
                 if confirm("Assignment Name Editing", f"{assignment.name}(Old) --> {new_name}(New)"):
                     assignment.name = new_name
-                    semester.to_json()
+                    save_manager.mark(semester, set_op(semester, assignment, name=new_name))
                     print("Successfully changed the assignment name.")
                 else:
                     print("Canceled.")
-                time.sleep(3)
+                pause(3)
                 
             case "edit_current_score":
                 try:
-                    new_score = float(input("Please enter current score (use exact number):\n").strip())
+                    new_score = float(read_line("Please enter current score (use exact number):\n").strip())
                 except ValueError:
                     print("Invalid number.")
-                    time.sleep(3)
+                    pause(3)
                     continue
                 if confirm("Assignment Current Score Editing", f"{assignment.current_score}(Old) --> {new_score}(New)"):
                     assignment.current_score = new_score
                     assignment.isDone = True
-                    semester.to_json()
+                    save_manager.mark(semester, set_op(semester, assignment, current_score=new_score, isDone=True))
                     print("Successfully changed the current score and marked as done.")
                 else:
                     print("Canceled.")
-                time.sleep(3)
+                pause(3)
 
             case "edit_max_score":
                 try:
-                    new_max = float(input("Please enter new max score:\n").strip())
+                    new_max = float(read_line("Please enter new max score:\n").strip())
                 except ValueError:
                     print("Invalid number.")
-                    time.sleep(3)
+                    pause(3)
                     continue
                 if confirm("Assignment Max Score Editing", f"{assignment.max_score}(Old) --> {new_max}(New)"):
                     assignment.max_score = new_max
-                    semester.to_json()
+                    save_manager.mark(semester, set_op(semester, assignment, max_score=new_max))
                     print("Successfully changed the max score.")
                 else:
                     print("Canceled.")
-                time.sleep(3)
+                pause(3)
 
             case "edit_deadline":
                 print("Input deadline in format : MM/DD/YY HH:MM:SS (e.g. 10/03/25 13:55:26). Leave blank to unset.")
-                new_deadline = input("New Deadline: ").strip() or None
+                new_deadline = read_line("New Deadline: ").strip() or None
                 if confirm("Assignment Deadline Editing", f"{assignment.deadline}(Old) --> {new_deadline}(New)"):
                     assignment.deadline = new_deadline
-                    semester.to_json()
+                    save_manager.mark(semester, set_op(semester, assignment, deadline=new_deadline))
+                    deadline_index.update(assignment, subject, semester)
                     print("Successfully changed the deadline.")
                 else:
                     print("Canceled.")
-                time.sleep(3)
+                pause(3)
 
             case "toggle_done":
                 assignment.isDone = not assignment.isDone
                 if assignment.isDone and assignment.current_score == 0:
                     try:
-                        new_score = input("Enter score achieved (or leave blank to keep 0):\n").strip()
+                        new_score = read_line("Enter score achieved (or leave blank to keep 0):\n").strip()
                         new_score = float(new_score) if new_score != "" else 0.0
                     except ValueError:
                         new_score = 0.0
                     assignment.current_score = new_score
-                semester.to_json()
+                save_manager.mark(semester, set_op(semester, assignment, isDone=assignment.isDone, current_score=assignment.current_score))
                 print(f"Toggled done -> {assignment.isDone}.")
-                time.sleep(3)
+                pause(3)
 
             case "delete_assignment":
                 if confirm("Assignment Deletion", f"{assignment.name} | Score : {assignment.current_score}/{assignment.max_score}"):
                     try:
+                        op = remove_op(semester, assignment)
                         subject.assignments.remove(assignment)
-                        semester.to_json()
+                        save_manager.mark(semester, op)
+                        deadline_index.discard(assignment)
                         print("Successfully deleted assignment.")
-                        time.sleep(3)
+                        pause(3)
                         return
                     except Exception as e:
                         print(f"Error deleting assignment: {e}")
-                        time.sleep(3)
+                        pause(3)
                 else:
                     print("Canceled.")
-                    time.sleep(3)
+                    pause(3)
 
             case "back":
                 return
@@ -583,12 +708,14 @@ def assignment_edit_menu(assignment: Assignment, subject: Subject, semester: Sem
 
             case _:
                 print("Please type a proper option.")
-                time.sleep(3)
+                pause(3)
 
+@timed("menu.subject_edit")
+@flush_on_leave
 def subject_edit_menu(subject: Subject, semesters: List[Semester]) -> None:
     """Edit subject metadata"""
     clear()
-    raw = input("Edit Course Code (1) | Edit Course Name (2) | Edit Credit (3) | Back (4)\n").lower().strip()
+    raw = read_line("Edit Course Code (1) | Edit Course Name (2) | Edit Credit (3) | Back (4)\n").lower().strip()
     opt = prompt_choice(raw, {
         "edit_course_code": ["1", "(1)", "edit course code"],
         "edit_course_name": ["2", "(2)", "edit course name"],
@@ -599,48 +726,48 @@ def subject_edit_menu(subject: Subject, semesters: List[Semester]) -> None:
 
     match opt:
         case "edit_course_code":
-            new_course_code = input("Please enter new Class's Course Code.\n").strip()
+            new_course_code = read_line("Please enter new Class's Course Code.\n").strip()
             if confirm("Class's Course Code Editing", f"{subject.course_code}(Old Course Code) --> {new_course_code}(New Course Code)"):
                 subject.course_code = new_course_code
                 semester = find_semester_for_subject(subject, semesters)
                 if semester:
-                    semester.to_json()
+                    save_manager.mark(semester, set_op(semester, subject, course_code=new_course_code))
                 print("Successfully changed the Class's Course code.")
             else:
                 print("Canceled Course Code Editing.")
-            time.sleep(3)
+            pause(3)
             return
 
         case "edit_course_name":
-            new_name = input("Please enter a new Name.\n").strip()
+            new_name = read_line("Please enter a new Name.\n").strip()
             if confirm("Class's Name Editing", f"{subject.name}(Old Name) --> {new_name}(New Name)"):
                 subject.name = new_name
                 semester = find_semester_for_subject(subject, semesters)
                 if semester:
-                    semester.to_json()
+                    save_manager.mark(semester, set_op(semester, subject, name=new_name))
                 print("Successfully changed the Class's Name.")
             else:
                 print("Canceled Class's Name.")
-            time.sleep(3)
+            pause(3)
             return
 
         case "edit_credit":
-            new_credit_raw = input("Please enter a new Course Credit.\n").strip()
+            new_credit_raw = read_line("Please enter a new Course Credit.\n").strip()
             try:
                 new_credit = float(new_credit_raw)
             except ValueError:
                 print("Invalid credit.")
-                time.sleep(3)
+                pause(3)
                 return
             if confirm("Class's Credit Editing", f"{subject.credit}(Old Credit) --> {new_credit}(New Credit)"):
                 subject.credit = new_credit
                 semester = find_semester_for_subject(subject, semesters)
                 if semester:
-                    semester.to_json()
+                    save_manager.mark(semester, set_op(semester, subject, credit=new_credit))
                 print("Successfully changed the Class's Credit.")
             else:
                 print("Canceled Class's Credit Editing.")
-            time.sleep(3)
+            pause(3)
             return
 
         case "back":
@@ -652,20 +779,34 @@ def subject_edit_menu(subject: Subject, semesters: List[Semester]) -> None:
 
         case _:
             print("Please type a proper option.")
-            time.sleep(3)
+            pause(3)
             return
 
 # ---------------- Entrypoint ---------------- #
 
-def main():
+def main(argv: Optional[List[str]] = None):
+    argv = enable_from_argv(sys.argv[1:] if argv is None else argv)
+    if [a for a in argv if a != "--tui"]:
+        try:
+            from .source import cli
+        except ImportError:
+            from source import cli
+        return cli.main(argv)
+    if tui_requested(argv) and not start_tui():
+        print("Full-screen mode needs curses and a terminal; using line mode.")
     try:
         main_loop()
     except KeyboardInterrupt:
         clear()
         print("\nExiting...")
+    finally:
+        save_manager.close()
+        stop_tui()
 
 if __name__ == "__main__":
-    print("Program Started...")
-    print("Saves directory:", saves_dir())
-    time.sleep(3)
-    main()
+    args = enable_from_argv(sys.argv[1:])
+    if not [a for a in args if a != "--tui"]:
+        print("Program Started...")
+        print("Saves directory:", saves_dir())
+        pause(3)
+    sys.exit(main(args))
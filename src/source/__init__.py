@@ -1,13 +1,51 @@
 
-try:
-    from .classes import Semester, Subject, Assignment
-    from .gradecal import get_grade_point, calculate_gpa, calculate_gpax
-    from .utils import check_path, compare_time, format_timedelta, clear, deadline_report, saves_dir
-    from ._version import version
-except Exception:
-    from classes import Semester, Subject, Assignment
-    from gradecal import get_grade_point, calculate_gpa, calculate_gpax
-    from utils import check_path, compare_time, format_timedelta, clear, deadline_report, saves_dir
-    from _version import version
-__all__ = ["Semester", "Subject", "Assignment", "get_grade_point", "calculate_gpa", "deadline_report",
-           "calculate_gpax", "check_path", "compare_time", "format_timedelta", "clear", "version", "saves_dir"]
+# Public names are imported from their submodule on first access (PEP 562), so importing
+# the package (or the light parts of it, like the manifest and terminal) does not pull in
+# pydantic and the models until something actually needs them.
+
+from importlib import import_module
+
+_EXPORTS = {
+    "Semester": "classes", "Subject": "classes", "Assignment": "classes",
+    "get_grade_point": "gradecal", "get_grade_points": "gradecal", "calculate_gpa": "gradecal",
+    "calculate_gpax": "gradecal", "GradingScale": "gradecal", "get_grading_scale": "gradecal",
+    "set_grading_scale": "gradecal",
+    "check_path": "utils", "compare_time": "utils", "format_timedelta": "utils", "clear": "utils",
+    "deadline_report": "utils", "saves_dir": "utils", "last_load_errors": "utils",
+    "get_backend": "storage", "set_backend": "storage", "migrate_json_to_sqlite": "storage",
+    "set_op": "journal", "add_op": "journal", "remove_op": "journal",
+    "SaveManager": "savemanager", "save_manager": "savemanager",
+    "DeadlineIndex": "deadlines", "deadline_index": "deadlines",
+    "ColumnarStore": "columnar",
+    "solve_gpa": "targets", "solve_gpax": "targets", "subject_target": "targets",
+    "SemesterHeader": "manifest", "semester_headers": "manifest", "calculate_gpax_headers": "manifest",
+    "read_line": "terminal", "pause": "terminal", "tui_requested": "terminal", "start_tui": "terminal",
+    "stop_tui": "terminal",
+    "version": "_version",
+}
+
+__all__ = ["Semester", "Subject", "Assignment", "get_grade_point", "get_grade_points", "calculate_gpa", "deadline_report",
+           "GradingScale", "get_grading_scale", "set_grading_scale",
+           "calculate_gpax", "check_path", "compare_time", "format_timedelta", "clear", "version", "saves_dir",
+           "get_backend", "set_backend", "migrate_json_to_sqlite", "set_op", "add_op", "remove_op",
+           "SaveManager", "save_manager", "DeadlineIndex", "deadline_index",
+           "read_line", "pause", "tui_requested", "start_tui", "stop_tui", "last_load_errors",
+           "SemesterHeader", "semester_headers", "calculate_gpax_headers", "ColumnarStore",
+           "solve_gpa", "solve_gpax", "subject_target"]
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    try:
+        value = getattr(import_module(f".{module}", __name__), name)
+    except ImportError:
+        value = getattr(import_module(module), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
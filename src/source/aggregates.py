@@ -0,0 +1,164 @@
+# Running totals for Subject.score and Semester.gpa
+#
+# Sums are kept as exact integers (multiples of 2**-1074, the smallest double), so adding
+# and later subtracting a score never leaves rounding drift behind and the result is the
+# same whatever order edits happen in. Converting back with int / int is correctly rounded.
+# Semester.gpa keeps each subject's exact (grade point * credit, credit) only to notice when
+# an edit changes it; the value itself is cached from calculate_gpa, so it stays bit for bit
+# what calculate_gpa returns.
+
+import math
+import os
+from typing import Iterable, List, Optional
+
+CHECK_ENV = "STUDENT_PLANNER_CHECK_AGGREGATES"
+CHECK_AGGREGATES = os.environ.get(CHECK_ENV, "") not in ("", "0")
+
+_SCALE = 1 << 1074
+
+
+def exact(x: float) -> Optional[int]:
+    """`x` as an exact integer multiple of 2**-1074, or None for inf/nan."""
+    try:
+        n, d = float(x).as_integer_ratio()
+    except (OverflowError, ValueError):
+        return None
+    return n * (_SCALE // d)
+
+
+def exact_sum(values: Iterable[float]) -> Optional[int]:
+    """Exact sum of `values`, or None if any of them is inf/nan."""
+    total = 0
+    for v in values:
+        e = exact(v)
+        if e is None:
+            return None
+        total += e
+    return total
+
+
+def to_float(n: int) -> float:
+    return n / _SCALE
+
+
+class AggregateMismatch(AssertionError):
+    """Raised in check mode when a running total disagrees with a full recompute."""
+
+
+def check(name: str, running: float, recomputed: float) -> None:
+    if running != recomputed and not (math.isnan(running) and math.isnan(recomputed)):
+        raise AggregateMismatch(f"{name}: running total {running!r} != recomputed {recomputed!r}")
+
+
+class Totals:
+    """
+    Back-references, running totals and the cached rendering of one model.
+    Kept in a private attribute; compares equal to any other Totals so it never
+    affects model equality (and never recurses through parent links).
+    """
+
+    __slots__ = ("parents", "done_sum", "contrib", "scale", "gpa", "rendered", "rendered_scale")
+
+    def __init__(self):
+        self.parents: List[object] = []   # subjects of an assignment / semesters of a subject
+        self.done_sum: Optional[int] = None     # Subject: exact sum of done scores (None = not computed)
+        self.contrib: Optional[dict] = None     # Semester: id(subject) -> [subject, gp*credit, credit, count]
+        self.scale = None                       # Semester: grading scale the totals were built with
+        self.gpa: Optional[float] = None        # Semester: calculate_gpa() while the totals are unchanged
+        self.rendered = None                    # Subject/Semester: (show() text, expiry epoch or None)
+        self.rendered_scale = None              # gradecal.scale_generation() the rendering was made with
+
+    def __eq__(self, other):
+        return isinstance(other, Totals)
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # links and totals are rebuilt by the owning model after unpickling
+        return Totals, ()
+
+    def unlink(self, parent) -> None:
+        for i, p in enumerate(self.parents):
+            if p is parent:
+                del self.parents[i]
+                return
+
+    def unlink_all(self, parent) -> None:
+        self.parents[:] = [p for p in self.parents if p is not parent]
+
+
+class TrackedList(list):
+    """A model's child list that reports additions and removals to its owner.
+
+    Changes to several items at once are reported in one `_children_replaced`
+    call, after the list already holds its new contents.
+    """
+
+    __slots__ = ("owner",)
+
+    def __init__(self, owner, items=()):
+        super().__init__(items)
+        self.owner = owner
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+    def append(self, item):
+        super().append(item)
+        self.owner._child_added(item)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self.owner._child_added(item)
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self.owner._children_replaced((), items)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, n):
+        items = list(self)
+        if n <= 0:
+            self.clear()
+        else:
+            self.extend(items * (n - 1))
+        return self
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.owner._children_reordered()
+
+    def reverse(self):
+        super().reverse()
+        self.owner._children_reordered()
+
+    def remove(self, item):
+        i = self.index(item)
+        removed = self[i]
+        super().__delitem__(i)
+        self.owner._child_removed(removed)
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self.owner._child_removed(item)
+        return item
+
+    def clear(self):
+        items = list(self)
+        super().clear()
+        self.owner._children_replaced(items, ())
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self.owner._children_replaced(removed, ())
+
+    def __setitem__(self, index, value):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        added = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, value)
+        self.owner._children_replaced(removed, added)
@@ -0,0 +1,184 @@
+# Batch GPAX report over many exported student save folders
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime as dt
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+try:
+    from .columnar import ColumnarStore
+    from .gradecal import calculate_gpa, calculate_gpax
+    from .storage import DB_NAME
+    from . import vectorized
+except Exception:
+    from columnar import ColumnarStore
+    from gradecal import calculate_gpa, calculate_gpax
+    from storage import DB_NAME
+    import vectorized
+
+CSV_FIELDS = ["student", "gpax", "semesters", "subjects", "overdue", "semester_gpa", "error"]
+CHUNK_SIZE = 32               # student folders per worker task
+VECTORIZE_MIN_SUBJECTS = 256  # subjects in a chunk below which the numpy setup costs more than the scalar loops
+
+
+def _save_folder(path: Path) -> Optional[Path]:
+    """Return the folder holding a student's saves (the folder itself or its Saves/), if any."""
+    for candidate in (path, path / "Saves"):
+        if candidate.is_dir() and (any(candidate.glob("*.json")) or (candidate / DB_NAME).exists()):
+            return candidate
+    return None
+
+
+def student_dirs(root: Path) -> Iterator[Path]:
+    """Yield the student folders directly under `root` that contain saves, in name order."""
+    with os.scandir(root) as it:
+        names = sorted(e.name for e in it if e.is_dir())
+    for name in names:
+        if _save_folder(root / name) is not None:
+            yield root / name
+
+
+def _gpas(students: List[List[object]]) -> Tuple[List[float], List[List[float]]]:
+    """
+    (GPAX of each student, GPA of each of their semesters), the same values calculate_gpax
+    and calculate_gpa give. With numpy installed and enough subjects in total, both come
+    from one vectorized pass over all the students.
+    """
+    flat = [semester for semesters in students for semester in semesters]
+    if vectorized.available() and sum(len(s.subjects) for s in flat) >= VECTORIZE_MIN_SUBJECTS:
+        gpax = vectorized.calculate_gpax_many(students).tolist()
+        gpa = iter(vectorized.calculate_gpa_many(flat).tolist())
+    else:
+        gpax = [calculate_gpax(semesters) for semesters in students]
+        gpa = iter([calculate_gpa(s) for s in flat])
+    return gpax, [[next(gpa) for _ in semesters] for semesters in students]
+
+
+def summarize_students(paths: List[str]) -> List[dict]:
+    """
+    Load a chunk of student folders and compute each one's GPAX, per-semester GPA and
+    overdue count. Runs in a worker process, so it takes and returns plain values. Each
+    folder is read into a ColumnarStore, which needs a fraction of the models' memory, and
+    the GPAs of the whole chunk are computed together (see _gpas). Save files that could not
+    be read are left out of the numbers and named in the row's error.
+    """
+    rows, loaded = [], []
+    for path in paths:
+        folder = Path(path)
+        row = {"student": folder.name, "gpax": None, "semesters": 0, "subjects": 0,
+               "overdue": 0, "semester_gpa": {}, "error": None}
+        rows.append(row)
+        try:
+            loaded.append((row, ColumnarStore.load(_save_folder(folder))))
+        except Exception as e:
+            row["error"] = f"{type(e).__name__}: {e}"
+    gpax, gpas = _gpas([store.semesters for _, store in loaded])
+    now = dt.now().timestamp()
+    for (row, store), student_gpax, semester_gpas in zip(loaded, gpax, gpas):
+        row["gpax"] = round(student_gpax, 4)
+        row["semesters"] = len(store.semesters)
+        for semester, gpa in zip(store.semesters, semester_gpas):
+            label = " ".join(x for x in (semester.year, semester.season) if x) or (semester.file_path or "?")
+            row["semester_gpa"][label] = round(gpa, 4)
+            row["subjects"] += len(semester.subjects)
+        row["overdue"] = store.count_overdue(now)
+        if store.errors:  # the numbers above leave these files out
+            row["error"] = "; ".join(f"{p.name}: {reason}" for p, reason in store.errors)
+    return rows
+
+
+def summarize_student(path: str) -> dict:
+    """summarize_students() for a single folder."""
+    return summarize_students([path])[0]
+
+
+def _chunks(paths: Iterator[Path], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for p in paths:
+        chunk.append(str(p))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _ordered_results(paths: Iterator[Path], workers: int) -> Iterator[dict]:
+    """
+    Run summarize_students over `paths` in chunks of CHUNK_SIZE folders, with at most
+    `workers * 2` chunks in flight, yielding rows in input order.
+    """
+    if workers <= 1:
+        for chunk in _chunks(paths, CHUNK_SIZE):
+            yield from summarize_students(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in _chunks(paths, CHUNK_SIZE):
+            in_flight.append(pool.submit(summarize_students, chunk))
+            if len(in_flight) >= workers * 2:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def batch_report(root: Path, out, fmt: str = "csv", workers: Optional[int] = None) -> int:
+    """
+    Write one report row per student folder under `root` to the text stream `out`.
+    Rows are streamed as they finish, so memory stays bounded by the worker window.
+
+    Returns:
+        int: number of students reported
+    """
+    workers = workers or os.cpu_count() or 1
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+    count = 0
+    for row in _ordered_results(student_dirs(Path(root)), workers):
+        if writer is not None:
+            writer.writerow(row | {"semester_gpa": ";".join(f"{k}={v}" for k, v in row["semester_gpa"].items()),
+                                   "error": row["error"] or ""})
+        else:
+            out.write(json.dumps(row) + "\n")
+        count += 1
+    return count
+
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    parser = parser or argparse.ArgumentParser(prog="student-planner-batch",
+                                               description="GPAX report over many student save folders.")
+    parser.add_argument("root", type=Path, help="folder containing one save folder per student")
+    parser.add_argument("-o", "--output", default="-", help="report file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"], help="report format (default: from --output suffix, else csv)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    fmt = args.format or ("jsonl" if str(args.output).endswith((".jsonl", ".ndjson")) else "csv")
+    if not Path(args.root).is_dir():
+        print(f"Not a directory: {args.root}", file=sys.stderr)
+        return 1
+    if args.output == "-":
+        count = batch_report(args.root, sys.stdout, fmt, args.workers)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            count = batch_report(args.root, f, fmt, args.workers)
+    print(f"Reported {count} students.", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return run(build_parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
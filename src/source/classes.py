@@ -1,27 +1,63 @@
 # Classes for the project
 
 import json
+import math
+import time
 from datetime import datetime as dt
 from typing import List, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_validator, model_validator
 
 try:
     from ._version import version
-    from .gradecal import calculate_gpa, get_grade_point
-    from .utils import compare_time, saves_dir
+    from .gradecal import calculate_gpa, get_grade_point, get_grading_scale, scale_generation
+    from . import aggregates
+    from .aggregates import Totals, TrackedList, exact, exact_sum, to_float
+    from .utils import compare_time, saves_dir, remember_semester, atomic_write_text
+    from .journal import last_seq, discard_journal
+    from .storage import get_backend
+    from .manifest import format_summary
+    from .instrument import timed
 except Exception:
-    from gradecal import calculate_gpa, get_grade_point
-    from utils import compare_time, saves_dir
+    from gradecal import calculate_gpa, get_grade_point, get_grading_scale, scale_generation
+    import aggregates
+    from aggregates import Totals, TrackedList, exact, exact_sum, to_float
+    from utils import compare_time, saves_dir, remember_semester, atomic_write_text
+    from journal import last_seq, discard_journal
+    from storage import get_backend
+    from manifest import format_summary
+    from instrument import timed
     try:
         from _version import version
     except Exception:
         version = "0.0.0"
 
 NUM_SPACES = 0
+DEADLINE_FORMAT = "%m/%d/%y %H:%M:%S"
+NEAR_DEADLINE_SECONDS = 7 * 24 * 3600
 
 def spaces(n: int) -> str:
     return " " * n
 
+def parse_deadline(text: str) -> dt:
+    """Parse a DEADLINE_FORMAT string; zero-padded values skip the (slow) strptime machinery."""
+    if (len(text) == 17 and text[2] == text[5] == "/" and text[8] == " " and text[11] == text[14] == ":"
+            and text.replace("/", "").replace(" ", "").replace(":", "").isdigit()):
+        year = int(text[6:8])
+        # same century rule as strptime's %y
+        return dt(year + (2000 if year < 69 else 1900), int(text[0:2]), int(text[3:5]),
+                  int(text[9:11]), int(text[12:14]), int(text[15:17]))
+    return dt.strptime(text, DEADLINE_FORMAT)
+
+def format_info(year, season, gpa) -> str:
+    """Semester title line (shared by Semester.info and manifest headers)."""
+    y = f" {year} " if year else ""
+    s = f" {season} " if season else ""
+    return f"{spaces(NUM_SPACES)}Semester{y}{s}| GPA : {gpa}\n"
+
+def _tree_totals(model) -> Totals:
+    # private attribute read without pydantic's __getattr__ fallback (hot when linking big trees)
+    return model.__pydantic_private__["_totals"]
+
 class Assignment(BaseModel):
     name: str
     max_score: float
@@ -33,6 +69,96 @@ class Assignment(BaseModel):
     version: str = Field(default=version, exclude=True)
     model_config = ConfigDict(extra="ignore")
 
+    # deadline parsed once, when validated or reassigned
+    _deadline_dt: Optional[dt] = PrivateAttr(default=None)
+    _deadline_invalid: bool = PrivateAttr(default=False)
+    # subjects holding this assignment, told when its done score changes
+    _totals: Totals = PrivateAttr(default_factory=Totals)
+
+    @field_validator("deadline", mode="before")
+    @classmethod
+    def _format_deadline(cls, value):
+        """Accept a datetime and store it in the saved string format."""
+        if isinstance(value, dt):
+            return value.strftime(DEADLINE_FORMAT)
+        return value
+
+    @model_validator(mode="after")
+    def _validate_deadline(self):
+        self._parse_deadline()
+        return self
+
+    def __copy__(self):
+        # a copy belongs to no subject until it is added to one
+        copied = super().__copy__()
+        copied.__pydantic_private__["_totals"] = Totals()
+        return copied
+
+    def __setattr__(self, name, value):
+        parents = self._totals.parents if not name.startswith("_") else None
+        if not parents:
+            super().__setattr__(name, value)
+            if name == "deadline":
+                self._parse_deadline()
+            return
+        old_done = self.done_score
+        unchanged = getattr(self, name, None) == value
+        super().__setattr__(name, value)
+        if name == "deadline":
+            self._parse_deadline()
+        if name in ("current_score", "isDone"):
+            new_done = self.done_score
+            counts = {}  # an assignment listed twice in a subject is one update of twice the size
+            for subject in parents:
+                counts[id(subject)] = (subject, counts.get(id(subject), (None, 0))[1] + 1)
+            for subject, times in counts.values():
+                subject._assignment_changed(old_done, new_done, times)
+        elif not unchanged:
+            for subject in list(parents):
+                subject._touch()
+
+    @property
+    def done_score(self) -> float:
+        """What this assignment adds to its subject's score."""
+        return self.current_score if self.isDone else 0.0
+
+    def _parse_deadline(self) -> None:
+        private = self.__pydantic_private__
+        private["_deadline_dt"] = None
+        private["_deadline_invalid"] = False
+        if self.deadline:
+            try:
+                private["_deadline_dt"] = parse_deadline(self.deadline)
+            except Exception:
+                private["_deadline_invalid"] = True
+
+    @property
+    def deadline_dt(self) -> Optional[dt]:
+        """Deadline as a datetime, or None when missing or invalid."""
+        return self._deadline_dt
+
+    @property
+    def deadline_ts(self) -> Optional[float]:
+        """Deadline as epoch seconds, or None when missing or invalid."""
+        return self._deadline_dt.timestamp() if self._deadline_dt else None
+
+    def status_expires(self, now: float) -> Optional[float]:
+        """Epoch at which update_deadline_status() would next give a different status, if ever."""
+        if self.isDone or self._deadline_dt is None:
+            return None
+        deadline = self._deadline_dt.timestamp()
+        if now < deadline - NEAR_DEADLINE_SECONDS:
+            return deadline - NEAR_DEADLINE_SECONDS
+        if now < deadline:
+            return deadline
+        return None
+
+    @property
+    def deadline_invalid(self) -> bool:
+        """True when a deadline is set but does not match '%m/%d/%y %H:%M:%S'."""
+        return self._deadline_invalid
+
+    @timed
     def update_deadline_status(self) -> None:
         """Set status field based on done flag and deadline relative to now."""
         if self.isDone:
@@ -43,13 +169,11 @@ class Assignment(BaseModel):
             self.status = "Not Done"
             return
 
-        try:
-            deadline_dt = dt.strptime(self.deadline, "%m/%d/%y %H:%M:%S")
-        except Exception:
+        if self._deadline_invalid:
             self.status = "Invalid Deadline"
             return
 
-        diff = compare_time(deadline_dt)
+        diff = compare_time(self._deadline_dt)
         total_minutes = diff.total_seconds() / 60.0
 
         if total_minutes < 0:
@@ -63,6 +187,7 @@ class Assignment(BaseModel):
         self.update_deadline_status()
         return self.model_dump(exclude={"version"}, exclude_none=True) | {"version": version}
 
+    @timed
     def show(self) -> str:
         self.update_deadline_status()
         return f"{spaces(NUM_SPACES + 4)}{self.name} | Score : {self.current_score}/{self.max_score}\n{spaces(NUM_SPACES + 4)}Status : {self.status} | Due : {self.deadline}\n"
@@ -76,10 +201,115 @@ class Subject(BaseModel):
     version: str = Field(default=version, exclude=True)
     model_config = ConfigDict(extra="ignore")
 
+    # running done-score sum and the semesters holding this subject
+    _totals: Totals = PrivateAttr(default_factory=Totals)
+
+    @model_validator(mode="after")
+    def _link_children(self):
+        # also runs again when this instance is passed into a Semester, so relink from scratch
+        self.__dict__["assignments"] = TrackedList(self, self.assignments)
+        for a in self.assignments:
+            _tree_totals(a).unlink_all(self)
+        for a in self.assignments:
+            _tree_totals(a).parents.append(self)
+        self._totals.done_sum = None
+        return self
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._link_children()
+
+    def __copy__(self):
+        copied = super().__copy__()
+        copied.__pydantic_private__["_totals"] = Totals()
+        copied._link_children()
+        return copied
+
+    def __deepcopy__(self, memo=None):
+        # the copied children come back as a plain list with fresh Totals (copy.deepcopy, model_copy)
+        copied = super().__deepcopy__(memo)
+        copied._link_children()
+        return copied
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+        if name == "assignments":
+            for a in self.assignments:
+                a._totals.unlink(self)
+            super().__setattr__(name, value)
+            self._link_children()
+            self._changed()
+            return
+        unchanged = getattr(self, name, None) == value
+        super().__setattr__(name, value)
+        if name == "credit":
+            self._changed()
+        elif not unchanged:
+            self._touch()
+
+    # ---- running total hooks ---- #
+
+    def _child_added(self, a) -> None:
+        a._totals.parents.append(self)
+        self._assignment_changed(0.0, a.done_score)
+
+    def _child_removed(self, a) -> None:
+        a._totals.unlink(self)
+        self._assignment_changed(a.done_score, 0.0)
+
+    def _children_replaced(self, removed, added) -> None:
+        for a in removed:
+            a._totals.unlink(self)
+        for a in added:
+            a._totals.parents.append(self)
+        totals = self._totals
+        if totals.done_sum is not None:
+            lost = exact_sum(a.done_score for a in removed)
+            gained = exact_sum(a.done_score for a in added)
+            totals.done_sum = None if lost is None or gained is None else totals.done_sum + gained - lost
+        self._changed()
+
+    def _children_reordered(self) -> None:
+        self._touch()  # the score does not depend on the order, only the rendering does
+
+    def _assignment_changed(self, old: float, new: float, times: int = 1) -> None:
+        totals = self._totals
+        if totals.done_sum is not None:
+            old_e, new_e = exact(old), exact(new)
+            if old_e is None or new_e is None:
+                totals.done_sum = None
+            else:
+                totals.done_sum += (new_e - old_e) * times
+        self._changed()
+
+    def _changed(self) -> None:
+        self._totals.rendered = None
+        for semester in self._totals.parents:
+            semester._subject_changed(self)
+
+    def _touch(self) -> None:
+        """Drop the cached rendering of this subject and the semesters holding it."""
+        self._totals.rendered = None
+        for semester in self._totals.parents:
+            semester._touch()
+
+    def _recompute_score(self) -> Optional[int]:
+        return exact_sum(a.current_score for a in self.assignments if a.isDone)
+
     @property
     def score(self) -> float:
-        """Compute score as sum of current_score for assignments marked done."""
-        return sum(a.current_score for a in self.assignments if a.isDone)
+        """Compute score as sum of current_score for assignments marked done (kept as a running total)."""
+        totals = self._totals
+        if totals.done_sum is None:
+            totals.done_sum = self._recompute_score()
+            if totals.done_sum is None:  # an inf/nan score, nothing exact to keep
+                return sum(a.current_score for a in self.assignments if a.isDone)
+        value = to_float(totals.done_sum)
+        if aggregates.CHECK_AGGREGATES:
+            aggregates.check(f"{self.name}.score", value, math.fsum(a.current_score for a in self.assignments if a.isDone))
+        return value
 
     @property
     def grade(self):
@@ -92,14 +322,35 @@ class Subject(BaseModel):
         gp = get_grade_point(self.score)
         return f"{spaces(NUM_SPACES + 2)}{self.course_code or ''} {self.name} | Score : {self.score}/100 | Grade : {gp[1]} | Credit : {self.credit}\n\n"
 
+    @timed
     def show(self) -> str:
-        out = self.info()
+        text, _ = self._render(time.time())
+        return text
+
+    def _render(self, now: float):
+        """
+        Return (show() text, expiry); cached until this subject changes, a status would flip
+        or the grading scale is replaced.
+        """
+        cached = self._totals.rendered
+        generation = scale_generation()
+        if (cached is not None and (cached[1] is None or now < cached[1])
+                and self._totals.rendered_scale == generation):
+            return cached
+        parts = [self.info()]
+        expires = None
         if self.assignments:
             for a in self.assignments:
-                out += a.show() + "\n"
+                parts.append(a.show())
+                parts.append("\n")
+                t = a.status_expires(now)
+                if t is not None and (expires is None or t < expires):
+                    expires = t
         else:
-            out += f"{spaces(NUM_SPACES + 4)}No Current Assignment\n"
-        return out.rstrip("\n")
+            parts.append(f"{spaces(NUM_SPACES + 4)}No Current Assignment\n")
+        self._totals.rendered = ("".join(parts).rstrip("\n"), expires)
+        self._totals.rendered_scale = generation
+        return self._totals.rendered
 
 class Semester(BaseModel):
     year: Optional[str] = None
@@ -107,51 +358,231 @@ class Semester(BaseModel):
     subjects: List[Subject] = Field(default_factory=list)
     gpa: float = 0.0
     file_path: str = None
+    journal_seq: Optional[int] = None  # last journal record folded into this snapshot
 
     version: str = Field(default=version, exclude=True)
     model_config = ConfigDict(extra="ignore")
 
+    # running credit and grade-point totals
+    _totals: Totals = PrivateAttr(default_factory=Totals)
+
+    @model_validator(mode="after")
+    def _link_children(self):
+        self.__dict__["subjects"] = TrackedList(self, self.subjects)
+        for subject in self.subjects:
+            _tree_totals(subject).unlink_all(self)
+        for subject in self.subjects:
+            _tree_totals(subject).parents.append(self)
+        self._totals.contrib = None
+        return self
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._link_children()
+
+    def __copy__(self):
+        copied = super().__copy__()
+        copied.__pydantic_private__["_totals"] = Totals()
+        copied._link_children()
+        return copied
+
+    def __deepcopy__(self, memo=None):
+        # the copied children come back as a plain list with fresh Totals (copy.deepcopy, model_copy)
+        copied = super().__deepcopy__(memo)
+        copied._link_children()
+        return copied
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+        if name == "subjects":
+            for subject in self.subjects:
+                subject._totals.unlink(self)
+            super().__setattr__(name, value)
+            self._link_children()
+            self._touch()
+            return
+        unchanged = getattr(self, name, None) == value
+        super().__setattr__(name, value)
+        if not unchanged:
+            self._touch()
+
+    def _touch(self) -> None:
+        """Drop the cached rendering of this semester."""
+        self._totals.rendered = None
+
+    # ---- running total hooks ---- #
+
+    @staticmethod
+    def _contribution(subject, scale):
+        """Exact (grade point * credit, credit) of one subject, or None if not finite."""
+        credit = subject.credit or 0.0
+        gp, _ = scale.lookup(subject.score)
+        weighted, credit_e = exact(gp * credit), exact(credit)
+        if weighted is None or credit_e is None:
+            return None
+        return weighted, credit_e
+
+    def _build_totals(self) -> bool:
+        totals = self._totals
+        scale = get_grading_scale()
+        if totals.contrib is not None and totals.scale is scale:
+            return True
+        contrib = {}
+        for subject in self.subjects:
+            c = self._contribution(subject, scale)
+            if c is None:
+                totals.contrib = None
+                return False
+            entry = contrib.get(id(subject))
+            if entry is None:
+                contrib[id(subject)] = [subject, c[0], c[1], 1]
+            else:
+                entry[3] += 1
+        totals.contrib, totals.scale = contrib, scale
+        totals.gpa = None
+        return True
+
+    def _adjust(self, subject, count_delta: int) -> None:
+        totals = self._totals
+        if totals.contrib is None:
+            return
+        entry = totals.contrib.get(id(subject))
+        count = (entry[3] if entry else 0) + count_delta
+        if count <= 0:
+            totals.contrib.pop(id(subject), None)
+            totals.gpa = None
+            return
+        c = self._contribution(subject, totals.scale)
+        if c is None:
+            totals.contrib = None
+            return
+        if count_delta or entry is None or (entry[1], entry[2]) != c:
+            totals.gpa = None  # a score change that keeps the grade keeps the cached GPA
+        totals.contrib[id(subject)] = [subject, c[0], c[1], count]
+
+    def _child_added(self, subject) -> None:
+        subject._totals.parents.append(self)
+        self._adjust(subject, 1)
+        self._touch()
+
+    def _child_removed(self, subject) -> None:
+        subject._totals.unlink(self)
+        self._adjust(subject, -1)
+        self._touch()
+
+    def _subject_changed(self, subject) -> None:
+        self._adjust(subject, 0)
+        self._touch()
+
+    def _children_replaced(self, removed, added) -> None:
+        for subject in removed:
+            self._child_removed(subject)
+        for subject in added:
+            self._child_added(subject)
+
+    def _children_reordered(self) -> None:
+        self._totals.gpa = None  # calculate_gpa adds the subjects up in list order
+        self._touch()
+
+    def _running_gpa(self) -> float:
+        if not self._build_totals():
+            return calculate_gpa(self)
+        totals = self._totals
+        if totals.gpa is None:
+            totals.gpa = calculate_gpa(self)
+        elif aggregates.CHECK_AGGREGATES:
+            aggregates.check(f"{self.year} {self.season} gpa", totals.gpa, calculate_gpa(self))
+        if aggregates.CHECK_AGGREGATES:
+            for subject, weighted, credit, _ in totals.contrib.values():
+                gp, _ = get_grade_point(subject.score)
+                aggregates.check(f"{subject.name} grade point * credit", to_float(weighted), gp * (subject.credit or 0.0))
+                aggregates.check(f"{subject.name} credit", to_float(credit), subject.credit or 0.0)
+        return totals.gpa
+
     def to_dict(self) -> dict:
         self.update_gpa()
         return self.model_dump(exclude={"version"}, exclude_none=True) | {"version": version}
 
+    @timed
     def to_json(self) -> None:
-        """Save semester to Saves directory with a sensible filename."""
+        """
+        Save semester to Saves directory with a sensible filename.
+        Writes a full snapshot atomically and folds away any pending journal.
+        """
         self.update_gpa()
         save_path = saves_dir()
         if self.year and self.season:
             self.file_path = f"{self.year}_{self.season}.json"
+        elif self.file_path:
+            pass
         else:
             i = 1
             while (save_path / f"Semester_{i}.json").exists():
                 i += 1
             self.file_path = f"Semester_{i}.json"
-        with (save_path / self.file_path).open("w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
-        
+        target = save_path / self.file_path
+        self.journal_seq = last_seq(target, self) or None
+        atomic_write_text(target, json.dumps(self.to_dict(), indent=2))
+        discard_journal(target)
+        remember_semester(target, self)
+
+    def save(self, *ops: dict) -> None:
+        """
+        Persist the semester through the active storage backend (JSON files by default).
+        `ops` are journal records (see journal.set_op/add_op/remove_op) describing the edit;
+        without them the whole semester is written.
+        """
+        get_backend().save(self, *ops)
+
     def delete(self) -> None:
-        save_path = saves_dir()
-        target = save_path / self.file_path if self.file_path else None
-        if target and target.exists():
-            target.unlink()
+        get_backend().delete(self)
 
     def info(self) -> str:
         self.update_gpa()
-        y = f" {self.year} " if self.year else ""
-        s = f" {self.season} " if self.season else ""
-        return f"{spaces(NUM_SPACES)}Semester{y}{s}| GPA : {self.gpa}\n"
+        return format_info(self.year, self.season, self.gpa)
 
+    @timed
     def show(self) -> str:
-        out = self.info()
+        text, _ = self._render(time.time())
+        return text
+
+    def _render(self, now: float):
+        """Return (show() text, expiry); cached until the semester or one of its subjects changes."""
+        info = self.info()  # refreshes gpa first; an unchanged gpa keeps the cache
+        cached = self._totals.rendered
+        generation = scale_generation()
+        if (cached is not None and (cached[1] is None or now < cached[1])
+                and self._totals.rendered_scale == generation):
+            return cached
+        parts = [info]
+        expires = None
         if self.subjects:
             for subject in self.subjects:
-                out += subject.show() + "\n\n"
+                text, t = subject._render(now)
+                parts.append(text)
+                parts.append("\n\n")
+                if t is not None and (expires is None or t < expires):
+                    expires = t
         else:
-            out += f"\n\n{spaces(NUM_SPACES + 2)}No On Going Classes\n\n"
-        return out.rstrip("\n")
+            parts.append(f"\n\n{spaces(NUM_SPACES + 2)}No On Going Classes\n\n")
+        self._totals.rendered = ("".join(parts).rstrip("\n"), expires)
+        self._totals.rendered_scale = generation
+        return self._totals.rendered
+
+    def summary(self) -> str:
+        """One-line overview used by the main menu: GPA, classes and assignments done."""
+        self.update_gpa()
+        total = done = 0
+        for subject in self.subjects:
+            total += len(subject.assignments)
+            done += sum(1 for a in subject.assignments if a.isDone)
+        return format_summary(self.year, self.season, self.gpa, len(self.subjects), done, total)
 
+    @timed
     def update_gpa(self) -> None:
-        self.gpa = calculate_gpa(self)
+        self.gpa = self._running_gpa()
     
 
     @classmethod
@@ -159,6 +590,89 @@ class Semester(BaseModel):
         # pydantic will convert nested dicts to models when possible
         return cls(**data)
 
+    @classmethod
+    def from_json_bytes(cls, data: bytes):
+        """Validate a saved semester straight from its JSON bytes, without building dicts first."""
+        return cls.model_validate_json(data)
+
+    @staticmethod
+    def has_model_types(data) -> bool:
+        """
+        True when every field of the semester dict `data` already has the type the models
+        store (numbers for floats, real bools, strings), so from_trusted_dict builds the same
+        semester validation would. Data relying on lax coercion ("isDone": "false") is not.
+        """
+        def fields_ok(obj, kinds) -> bool:
+            return isinstance(obj, dict) and all(k not in obj or type(obj[k]) in t for k, t in kinds.items())
+
+        if not fields_ok(data, _SEMESTER_TYPES) or not isinstance(data.get("subjects", []), list):
+            return False
+        for s in data.get("subjects", ()):
+            if not fields_ok(s, _SUBJECT_TYPES) or not isinstance(s.get("assignments", []), list):
+                return False
+            if not all(fields_ok(a, _ASSIGNMENT_TYPES) for a in s.get("assignments", ())):
+                return False
+        return True
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict):
+        """
+        Build a semester from data that already passed validation unchanged (the trusted
+        load cache), skipping pydantic validation. Only the coercions validation would do on
+        saved data (numbers to float) and the after-validator hooks are repeated here, so
+        `data` must pass has_model_types().
+        """
+        subjects = []
+        for s in data.get("subjects", ()):
+            assignments = []
+            for a in s.get("assignments", ()):
+                a = dict(a, max_score=float(a["max_score"]), current_score=float(a.get("current_score", 0.0)))
+                assignment = _construct(Assignment, a, {"_deadline_dt": None, "_deadline_invalid": False,
+                                                        "_totals": Totals()})
+                assignment._parse_deadline()
+                assignments.append(assignment)
+            subject = _construct(Subject, dict(s, credit=float(s["credit"]), assignments=assignments),
+                                 {"_totals": Totals()})
+            subject._link_children()
+            subjects.append(subject)
+        semester = _construct(cls, dict(data, gpa=float(data.get("gpa", 0.0)), subjects=subjects),
+                              {"_totals": Totals()})
+        semester._link_children()
+        return semester
+
+# JSON types each saved field may have for Semester.has_model_types (None only where optional)
+_NUMBER = (int, float)
+_TEXT = (str, type(None))
+_SEMESTER_TYPES = {"year": _TEXT, "season": _TEXT, "gpa": _NUMBER, "file_path": _TEXT,
+                   "journal_seq": (int, type(None))}
+_SUBJECT_TYPES = {"name": (str,), "credit": _NUMBER, "course_code": _TEXT}
+_ASSIGNMENT_TYPES = {"name": (str,), "max_score": _NUMBER, "deadline": _TEXT, "current_score": _NUMBER,
+                     "isDone": (bool,), "status": _TEXT}
+
+# model class -> its non-factory field defaults / field names, for _construct
+_DEFAULTS: dict = {}
+_FIELD_NAMES: dict = {}
+
+def _construct(cls, values: dict, private: dict):
+    """
+    BaseModel.model_construct without its per-field default resolution: unknown keys are
+    dropped (extra="ignore") and missing fields take their precomputed defaults.
+    Callers pass every default_factory field explicitly, plus the private attributes.
+    """
+    defaults = _DEFAULTS.get(cls)
+    if defaults is None:
+        defaults = _DEFAULTS[cls] = {name: f.default for name, f in cls.model_fields.items()
+                                     if f.default_factory is None}
+        _FIELD_NAMES[cls] = frozenset(cls.model_fields)
+    names = _FIELD_NAMES[cls]
+    given = {k: v for k, v in values.items() if k in names}
+    obj = cls.__new__(cls)
+    object.__setattr__(obj, "__dict__", defaults | given)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(given))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", private)
+    return obj
+
 if __name__ == "__main__":
     # Save path for the semester.json file
     save_path = saves_dir()
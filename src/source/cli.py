@@ -0,0 +1,359 @@
+# Non-interactive subcommands for scripts and cron jobs
+#
+# Each command loads only what it needs (one semester file for edits), never sleeps or
+# asks for confirmation, and reports through its exit code:
+#   0 success, 1 not found / invalid data, 2 bad usage (argparse).
+
+import argparse
+import json
+import sys
+from datetime import datetime as dt, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+try:
+    from .classes import Assignment
+    from .gradecal import calculate_gpa, calculate_gpax
+    from .journal import add_op, set_op
+    from .storage import get_backend
+    from .utils import check_path, compare_time, format_timedelta, last_load_errors
+    from .deadlines import DeadlineIndex
+    from .importer import DEFAULT_MAX_SCORE, import_assignments
+    from .notifier import (DEFAULT_THRESHOLDS, CommandSink, LogFileSink, StdoutSink, format_threshold,
+                           parse_threshold, run_notifier)
+    from .targets import check_target, solve_gpa, solve_gpax, subject_target
+    from . import batch, snapshot
+except Exception:
+    from classes import Assignment
+    from gradecal import calculate_gpa, calculate_gpax
+    from journal import add_op, set_op
+    from storage import get_backend
+    from utils import check_path, compare_time, format_timedelta, last_load_errors
+    from deadlines import DeadlineIndex
+    from importer import DEFAULT_MAX_SCORE, import_assignments
+    from notifier import (DEFAULT_THRESHOLDS, CommandSink, LogFileSink, StdoutSink, format_threshold,
+                          parse_threshold, run_notifier)
+    from targets import check_target, solve_gpa, solve_gpax, subject_target
+    import batch
+    import snapshot
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+
+
+class CommandError(Exception):
+    """A command could not be carried out; the message is printed to stderr."""
+
+
+def semester_file_name(key: str) -> str:
+    """Normalize "2025 Fall", "2025_Fall" or "2025_Fall.json" to the saved file name."""
+    key = key.strip()
+    if key.endswith(".json"):
+        return key
+    return "_".join(key.split()) + ".json"
+
+
+def semester_label(semester) -> str:
+    return " ".join(x for x in (semester.year, semester.season) if x) or (semester.file_path or "?")
+
+
+def load_all_semesters() -> list:
+    semesters = check_path()
+    for path, reason in last_load_errors():
+        print(f"warning: {path.name}: {reason}", file=sys.stderr)
+    return semesters
+
+
+def load_semester(key: str):
+    semester = get_backend().load_one(semester_file_name(key))
+    if semester is None:
+        raise CommandError(f"No semester {key!r}")
+    return semester
+
+
+def find_subject(semester, key: str):
+    """Subject whose course code or name equals `key` (case-insensitive)."""
+    key = key.strip().lower()
+    for subject in semester.subjects:
+        if (subject.course_code or "").lower() == key or subject.name.lower() == key:
+            return subject
+    raise CommandError(f"No class {key!r} in semester {semester_label(semester)}")
+
+
+def find_assignment(subject, name: str):
+    name = name.strip().lower()
+    for a in subject.assignments:
+        if a.name.lower() == name:
+            return a
+    raise CommandError(f"No assignment {name!r} in class {subject.name}")
+
+
+# ---------------- commands ---------------- #
+
+def cmd_add_assignment(args: argparse.Namespace) -> int:
+    semester = load_semester(args.semester)
+    subject = find_subject(semester, args.subject)
+    if any(a.name.lower() == args.name.strip().lower() for a in subject.assignments):
+        raise CommandError(f"Assignment {args.name!r} already exists in class {subject.name}")
+    try:
+        assignment = Assignment(name=args.name, max_score=args.max_score, deadline=args.deadline,
+                                current_score=args.score, isDone=args.done)
+    except ValidationError as e:
+        raise CommandError(f"Invalid assignment: {e.errors()[0]['msg']}")
+    if assignment.deadline_invalid:
+        raise CommandError(f"Invalid deadline {args.deadline!r}, expected MM/DD/YY HH:MM:SS")
+    subject.assignments.append(assignment)
+    semester.save(add_op(semester, assignment))
+    print(f"Added {assignment.name} to {subject.name} ({semester_label(semester)})")
+    return EXIT_OK
+
+
+def cmd_set_score(args: argparse.Namespace) -> int:
+    semester = load_semester(args.semester)
+    subject = find_subject(semester, args.subject)
+    assignment = find_assignment(subject, args.assignment)
+    fields = {"current_score": args.score}
+    assignment.current_score = args.score
+    if args.done is not None:
+        fields["isDone"] = assignment.isDone = args.done
+    semester.save(set_op(semester, assignment, **fields))
+    print(f"{subject.name} / {assignment.name}: {assignment.current_score}/{assignment.max_score}"
+          f"{' (done)' if assignment.isDone else ''}")
+    return EXIT_OK
+
+
+def cmd_list_deadlines(args: argparse.Namespace) -> int:
+    semesters = [load_semester(args.semester)] if args.semester else load_all_semesters()
+    index = DeadlineIndex()
+    index.sync(semesters)
+    now = dt.now()
+    entries = index.overdue(now) if args.overdue else index.due_within(timedelta(days=args.days), now)
+    if args.json:
+        json.dump([{"semester": semester_label(e.semester), "subject": e.subject.name,
+                    "course_code": e.subject.course_code, "assignment": e.assignment.name,
+                    "deadline": e.deadline_dt.isoformat(timespec="seconds")} for e in entries],
+                  sys.stdout, indent=2)
+        print()
+        return EXIT_OK
+    for e in entries:
+        _, (days, hours, minutes) = format_timedelta(compare_time(e.deadline_dt))
+        print(f"{e.deadline}\t{semester_label(e.semester)}\t{e.subject.name}\t{e.assignment.name}"
+              f"\t{days}d {hours}h {minutes}m")
+    return EXIT_OK
+
+
+def cmd_gpax(args: argparse.Namespace) -> int:
+    semesters = load_all_semesters()
+    gpax = calculate_gpax(semesters)
+    if args.json:
+        json.dump({"gpax": gpax,
+                   "semesters": [{"semester": semester_label(s), "gpa": calculate_gpa(s),
+                                  "credits": sum(subject.credit for subject in s.subjects)}
+                                 for s in semesters]},
+                  sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{gpax:.2f}")
+    return EXIT_OK
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    if not args.file.is_file():
+        raise CommandError(f"No such file: {args.file}")
+    semesters = [load_semester(args.semester)] if args.semester else load_all_semesters()
+    result = import_assignments(args.file, semesters, args.format, args.max_score, args.dry_run)
+    if args.json:
+        json.dump(result.to_dict(), sys.stdout, indent=2)
+        print()
+    else:
+        for line, reason in result.rejected:
+            print(f"{args.file}:{line}: {reason}", file=sys.stderr)
+        saved = ", ".join(semester_label(s) for s in result.semesters) or "nothing"
+        print(f"{result.added} added, {result.updated} updated, {len(result.rejected)} rejected; "
+              f"{'would save' if args.dry_run else 'saved'} {saved}")
+    return EXIT_ERROR if result.rejected else EXIT_OK
+
+
+def cmd_notify(args: argparse.Namespace) -> int:
+    try:
+        thresholds = [parse_threshold(t) for t in args.before] if args.before else list(DEFAULT_THRESHOLDS)
+    except ValueError as e:
+        raise CommandError(str(e))
+    sinks = [] if args.quiet else [StdoutSink()]
+    sinks += [LogFileSink(path) for path in args.log]
+    sinks += [CommandSink(command) for command in args.exec]
+    if not sinks:
+        raise CommandError("Nothing to notify: --quiet needs --log or --exec")
+    print(f"Watching deadlines; reminders {', '.join(format_threshold(t) for t in thresholds)} before. "
+          "Ctrl+C to stop.", file=sys.stderr)
+    run_notifier(sinks, thresholds)
+    return EXIT_OK
+
+
+def _format_target(t) -> str:
+    label = f"{t.subject.course_code + ' ' if t.subject.course_code else ''}{t.subject.name}"
+    if t.needed <= 0:
+        return f"{label}: {t.option.letter} (already reached, score {t.score:g})"
+    return (f"{label}: {t.option.letter} needs {t.needed:g} more of the {t.remaining:g} points left "
+            f"({t.fraction:.0%} of each remaining assignment)")
+
+
+def cmd_target(args: argparse.Namespace) -> int:
+    try:
+        goal = float(args.goal)
+    except ValueError:
+        goal = None
+    if goal is None:  # a letter grade for one class
+        if not (args.semester and args.subject):
+            raise CommandError("A letter grade target needs --semester and --subject")
+        semester = load_semester(args.semester)
+        subject = find_subject(semester, args.subject)
+        try:
+            target = subject_target(subject, args.goal.strip().upper(), semester)
+        except ValueError as e:
+            raise CommandError(str(e))
+        if args.json:
+            json.dump(target.to_dict() if target else None, sys.stdout, indent=2)
+            print()
+        elif target is not None:
+            print(_format_target(target))
+        if target is None:
+            raise CommandError(f"{args.goal} can no longer be reached in {subject.name}")
+        return EXIT_OK
+    if args.subject:
+        raise CommandError("--subject needs a letter grade target, e.g. B+")
+    try:
+        check_target(goal)
+    except ValueError as e:
+        raise CommandError(str(e))
+    if args.semester:
+        plan = solve_gpa(load_semester(args.semester), goal)
+    else:
+        plan = solve_gpax(load_all_semesters(), goal)
+    what = "GPA" if args.semester else "GPAX"
+    if args.json:
+        json.dump(plan.to_dict(), sys.stdout, indent=2)
+        print()
+        return EXIT_OK if plan.feasible else EXIT_ERROR
+    if not plan.feasible:
+        raise CommandError(f"{what} {goal:g} can not be reached; the best still possible is {plan.gpa:.2f}")
+    for t in plan.subjects:
+        if t.needed > 0:
+            print(f"{semester_label(t.semester)}\t{_format_target(t)}")
+    print(f"{what} {plan.gpa:.2f} with {plan.needed:g} more points in total")
+    return EXIT_OK
+
+
+def cmd_snapshot(args: argparse.Namespace) -> int:
+    if args.action == "build":
+        count = snapshot.build(args.dir)
+        print(f"Snapshot written with {count} semester(s).")
+        return EXIT_OK
+    problems = snapshot.verify(args.dir)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    if problems:
+        return EXIT_ERROR
+    print("Snapshot matches the JSON saves.")
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="student-planner",
+                                     description="Student Planner. Run without arguments for the interactive menu.")
+    parser.add_argument("--tui", action="store_true", help="full-screen interactive menu")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    p = sub.add_parser("add-assignment", help="add an assignment to a class")
+    p.add_argument("semester", help='semester, e.g. "2025_Fall" or "2025 Fall"')
+    p.add_argument("subject", help="class name or course code")
+    p.add_argument("name", help="assignment name")
+    p.add_argument("--max-score", type=float, required=True)
+    p.add_argument("--deadline", help="MM/DD/YY HH:MM:SS")
+    p.add_argument("--score", type=float, default=0.0)
+    p.add_argument("--done", action="store_true")
+    p.set_defaults(func=cmd_add_assignment)
+
+    p = sub.add_parser("set-score", help="set an assignment's score")
+    p.add_argument("semester")
+    p.add_argument("subject")
+    p.add_argument("assignment")
+    p.add_argument("score", type=float)
+    done = p.add_mutually_exclusive_group()
+    done.add_argument("--done", dest="done", action="store_const", const=True, default=None)
+    done.add_argument("--not-done", dest="done", action="store_const", const=False)
+    p.set_defaults(func=cmd_set_score)
+
+    p = sub.add_parser("list-deadlines", help="unfinished assignments due soon")
+    p.add_argument("--semester", help="only this semester (loads just its file)")
+    p.add_argument("--days", type=float, default=7, help="look-ahead window in days (default: 7)")
+    p.add_argument("--overdue", action="store_true", help="list overdue assignments instead")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_list_deadlines)
+
+    p = sub.add_parser("gpax", help="cumulative GPAX")
+    p.add_argument("--json", action="store_true", help="also per-semester GPA, as JSON")
+    p.set_defaults(func=cmd_gpax)
+
+    p = sub.add_parser("import", help="bulk import assignments from a CSV or .ics export",
+                       description="Exits with 1 if any row was rejected (the accepted rows are still saved).")
+    p.add_argument("file", type=Path)
+    p.add_argument("--semester", help="only match classes in this semester")
+    p.add_argument("--format", choices=["csv", "ics"], help="default: from the file suffix")
+    p.add_argument("--max-score", type=float, default=DEFAULT_MAX_SCORE,
+                   help=f"max score for rows without one (default: {DEFAULT_MAX_SCORE:g})")
+    p.add_argument("--dry-run", action="store_true", help="report only, save nothing")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("notify", help="run in the background and remind about upcoming deadlines",
+                       description="Sends each reminder once, at its time, and picks up edits to the saves.")
+    p.add_argument("--before", nargs="+", metavar="TIME",
+                   help="when to remind before a deadline, e.g. 7d 1d 1h (the default) or 30m")
+    p.add_argument("--log", action="append", default=[], type=Path, metavar="FILE",
+                   help="also append reminders to FILE")
+    p.add_argument("--exec", action="append", default=[], metavar="COMMAND",
+                   help="also run COMMAND per reminder (JSON on stdin, STUDENT_PLANNER_NOTE_* variables)")
+    p.add_argument("--quiet", action="store_true", help="do not print reminders to stdout")
+    p.set_defaults(func=cmd_notify)
+
+    p = sub.add_parser("target", help="fewest remaining points for a goal GPA, GPAX or class grade",
+                       description="GOAL is a GPA (e.g. 3.25: the semester's GPA with --semester, else GPAX) "
+                                   "or a letter grade for one class (with --semester and --subject). "
+                                   "Exits with 1 if the goal can no longer be reached.")
+    p.add_argument("goal")
+    p.add_argument("--semester", help='semester, e.g. "2025_Fall"')
+    p.add_argument("--subject", help="class name or course code (for a letter grade goal)")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(func=cmd_target)
+
+    p = sub.add_parser("snapshot", help="rebuild or verify the binary snapshot of the saves",
+                       description="The snapshot is kept up to date while STUDENT_PLANNER_SNAPSHOT=1 is set. "
+                                   "verify exits with 1 if any record is missing, stale or differs from its JSON file.")
+    p.add_argument("action", choices=["build", "verify"])
+    p.add_argument("--dir", type=Path, help="save folder (default: the planner's own)")
+    p.set_defaults(func=cmd_snapshot)
+
+    p = sub.add_parser("batch", help="GPAX report over many student save folders")
+    batch.build_parser(p)
+    p.set_defaults(func=batch.run)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "func", None) is None:
+        print("No command given.", file=sys.stderr)
+        return EXIT_USAGE
+    try:
+        return args.func(args)
+    except CommandError as e:
+        print(e, file=sys.stderr)
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
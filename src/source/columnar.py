@@ -0,0 +1,362 @@
+# Read-only columnar store of loaded semesters, for analytics over many students
+#
+# A Semester model tree costs a pydantic instance (with its own version string, status and
+# private state) per assignment. ColumnarStore keeps the same assignments as parallel
+# arrays instead: score, max score and deadline epoch as doubles, done flags as bytes and
+# names as indices into one table of interned strings, with each subject's assignments a
+# contiguous range. Semesters and subjects are small view objects over those columns that
+# expose what calculate_gpa, calculate_gpax and deadline_report read (subject.score and
+# .credit, assignment.isDone, .deadline_dt, ...); assignment views are made on access.
+# The store does not support edits: load the models for that.
+# benchmarks/columnar_memory.py compares its memory use per 100k assignments with the models'.
+
+import sys
+from array import array
+from datetime import datetime as dt
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .aggregates import exact_sum, to_float
+    from .gradecal import get_grade_point
+    from .jsonio import loads
+    from . import utils
+except Exception:
+    from aggregates import exact_sum, to_float
+    from gradecal import get_grade_point
+    from jsonio import loads
+    import utils
+
+_NO_DEADLINE = float("nan")
+
+
+class AssignmentView:
+    """One assignment of a ColumnarStore (made on access, not kept)."""
+
+    __slots__ = ("_store", "_i")
+
+    def __init__(self, store: "ColumnarStore", i: int):
+        self._store = store
+        self._i = i
+
+    @property
+    def name(self) -> str:
+        return self._store.names[self._store.assignment_name[self._i]]
+
+    @property
+    def current_score(self) -> float:
+        return self._store.current_score[self._i]
+
+    @property
+    def max_score(self) -> float:
+        return self._store.max_score[self._i]
+
+    @property
+    def isDone(self) -> bool:
+        return bool(self._store.done[self._i])
+
+    @property
+    def done_score(self) -> float:
+        return self.current_score if self.isDone else 0.0
+
+    @property
+    def deadline_ts(self) -> Optional[float]:
+        """Deadline as epoch seconds, or None when missing or invalid."""
+        epoch = self._store.deadline[self._i]
+        return None if epoch != epoch else epoch
+
+    @property
+    def deadline_dt(self) -> Optional[dt]:
+        epoch = self.deadline_ts
+        return None if epoch is None else dt.fromtimestamp(epoch)
+
+    @property
+    def deadline(self) -> Optional[str]:
+        """The deadline in the saved format (an invalid saved deadline reads as None)."""
+        try:
+            from .classes import DEADLINE_FORMAT
+        except ImportError:
+            from classes import DEADLINE_FORMAT
+        when = self.deadline_dt
+        return None if when is None else when.strftime(DEADLINE_FORMAT)
+
+    def __repr__(self) -> str:
+        return f"AssignmentView({self.name!r}, {self.current_score}/{self.max_score}, done={self.isDone})"
+
+
+class _AssignmentRange:
+    """A subject's assignments: a sequence of AssignmentView over rows start..stop."""
+
+    __slots__ = ("_store", "_start", "_stop")
+
+    def __init__(self, store: "ColumnarStore", start: int, stop: int):
+        self._store, self._start, self._stop = store, start, stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [AssignmentView(self._store, i) for i in range(self._start, self._stop)[index]]
+        return AssignmentView(self._store, range(self._start, self._stop)[index])
+
+    def __iter__(self) -> Iterator[AssignmentView]:
+        store = self._store
+        return (AssignmentView(store, i) for i in range(self._start, self._stop))
+
+
+class SubjectView:
+    __slots__ = ("_store", "_i")
+
+    def __init__(self, store: "ColumnarStore", i: int):
+        self._store = store
+        self._i = i
+
+    @property
+    def name(self) -> str:
+        return self._store.names[self._store.subject_name[self._i]]
+
+    @property
+    def course_code(self) -> Optional[str]:
+        code = self._store.subject_code[self._i]
+        return self._store.names[code] if code >= 0 else None
+
+    @property
+    def credit(self) -> float:
+        return self._store.credit[self._i]
+
+    @property
+    def score(self) -> float:
+        """Sum of the done assignments' scores, computed once when the store was built."""
+        return self._store.score[self._i]
+
+    @property
+    def grade(self):
+        return get_grade_point(self.score)
+
+    @property
+    def assignments(self) -> _AssignmentRange:
+        store = self._store
+        return _AssignmentRange(store, store.assignment_start[self._i], store.assignment_start[self._i + 1])
+
+    def __repr__(self) -> str:
+        return f"SubjectView({self.name!r}, score={self.score}, credit={self.credit})"
+
+
+class SemesterView:
+    __slots__ = ("year", "season", "file_path", "subjects")
+
+    def __init__(self, year: Optional[str], season: Optional[str], file_path: Optional[str],
+                 subjects: List[SubjectView]):
+        self.year = year
+        self.season = season
+        self.file_path = file_path
+        self.subjects = subjects
+
+    @property
+    def gpa(self) -> float:
+        try:
+            from .gradecal import calculate_gpa
+        except ImportError:
+            from gradecal import calculate_gpa
+        return calculate_gpa(self)
+
+    def __repr__(self) -> str:
+        return f"SemesterView({self.year!r}, {self.season!r}, {len(self.subjects)} subjects)"
+
+
+class ColumnarStore:
+    """
+    Semesters in columns. Build one with from_semesters() (loaded models), from_dicts()
+    (semester dicts in the saved layout) or load() (a save folder, mostly without building
+    models); `semesters` then holds SemesterView objects in the same order.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []                 # interned names and course codes
+        self._name_ids: Dict[str, int] = {}
+        # assignment columns
+        self.assignment_name = array("I")
+        self.current_score = array("d")
+        self.max_score = array("d")
+        self.deadline = array("d")                 # epoch seconds, NaN when missing or invalid
+        self.done = bytearray()
+        # subject columns; subject i owns assignments assignment_start[i]:assignment_start[i + 1]
+        self.subject_name = array("I")
+        self.subject_code = array("i")             # -1: no course code
+        self.credit = array("d")
+        self.score = array("d")
+        self.assignment_start = array("I", [0])
+        self.semesters: List[SemesterView] = []
+        self.errors: List[Tuple[Path, str]] = []   # files load() had to skip, as (path, reason)
+
+    def __len__(self) -> int:
+        return len(self.current_score)
+
+    def _name(self, text: str) -> int:
+        i = self._name_ids.get(text)
+        if i is None:
+            i = self._name_ids[text] = len(self.names)
+            self.names.append(sys.intern(text))
+        return i
+
+    # ---- building ---- #
+
+    def _add_subject(self, name: str, course_code: Optional[str], credit: float,
+                     rows: Iterable[Tuple[str, float, float, bool, float]]) -> SubjectView:
+        done_scores = []
+        for a_name, current, max_score, is_done, epoch in rows:
+            self.assignment_name.append(self._name(a_name))
+            self.current_score.append(current)
+            self.max_score.append(max_score)
+            self.done.append(1 if is_done else 0)
+            self.deadline.append(epoch)
+            if is_done:
+                done_scores.append(current)
+        total = exact_sum(done_scores)  # same value as Subject.score
+        self.score.append(sum(done_scores) if total is None else to_float(total))
+        self.subject_name.append(self._name(name))
+        self.subject_code.append(-1 if course_code is None else self._name(course_code))
+        self.credit.append(credit)
+        self.assignment_start.append(len(self.current_score))
+        return SubjectView(self, len(self.credit) - 1)
+
+    def add_semester(self, semester) -> SemesterView:
+        """Append a loaded Semester model."""
+        subjects = []
+        for subject in semester.subjects:
+            rows = ((a.name, a.current_score, a.max_score, a.isDone,
+                     _NO_DEADLINE if a.deadline_ts is None else a.deadline_ts) for a in subject.assignments)
+            subjects.append(self._add_subject(subject.name, subject.course_code, subject.credit, rows))
+        view = SemesterView(semester.year, semester.season, semester.file_path, subjects)
+        self.semesters.append(view)
+        return view
+
+    def add_dict(self, data: dict) -> SemesterView:
+        """
+        Append a semester dict in the saved layout. Values must already have the types the
+        models store (numbers, bools, strings); anything else raises TypeError, so callers
+        can fall back to validating the data with the models.
+        """
+        try:
+            from .classes import parse_deadline
+        except ImportError:
+            from classes import parse_deadline
+
+        def number(value) -> float:
+            if type(value) not in (float, int):
+                raise TypeError(f"expected a number, got {value!r}")
+            return float(value)
+
+        def text(value) -> Optional[str]:
+            if value is not None and type(value) is not str:
+                raise TypeError(f"expected a string, got {value!r}")
+            return value
+
+        def epoch(deadline) -> float:
+            if not text(deadline):
+                return _NO_DEADLINE
+            try:
+                return parse_deadline(deadline).timestamp()
+            except (ValueError, OverflowError):
+                return _NO_DEADLINE  # the models keep an invalid deadline but never use it
+
+        def rows(assignments):
+            for a in assignments:
+                is_done = a.get("isDone", False)
+                if type(is_done) is not bool or type(a["name"]) is not str:
+                    raise TypeError(f"invalid assignment {a!r}")
+                yield (a["name"], number(a.get("current_score", 0.0)), number(a["max_score"]), is_done,
+                       epoch(a.get("deadline")))
+
+        year, season, file_path = text(data.get("year")), text(data.get("season")), text(data.get("file_path"))
+        n_assignments, n_subjects = len(self), len(self.credit)
+        subjects = []
+        try:
+            for s in data.get("subjects", ()):
+                if type(s["name"]) is not str:
+                    raise TypeError(f"invalid subject name {s['name']!r}")
+                subjects.append(self._add_subject(s["name"], text(s.get("course_code")), number(s["credit"]),
+                                                  rows(s.get("assignments", ()))))
+        except (KeyError, AttributeError) as e:
+            self._truncate(n_assignments, n_subjects)
+            raise TypeError(f"invalid semester data: {e!r}") from None
+        except Exception:
+            self._truncate(n_assignments, n_subjects)
+            raise
+        view = SemesterView(year, season, file_path, subjects)
+        self.semesters.append(view)
+        return view
+
+    def _truncate(self, n_assignments: int, n_subjects: int) -> None:
+        """Drop the rows of a semester that failed halfway through add_dict."""
+        for column in (self.assignment_name, self.current_score, self.max_score, self.deadline, self.done):
+            del column[n_assignments:]
+        for column in (self.subject_name, self.subject_code, self.credit, self.score):
+            del column[n_subjects:]
+        del self.assignment_start[n_subjects + 1:]
+
+    @classmethod
+    def from_semesters(cls, semesters: Iterable[object]) -> "ColumnarStore":
+        store = cls()
+        for semester in semesters:
+            store.add_semester(semester)
+        return store
+
+    @classmethod
+    def from_dicts(cls, semesters: Iterable[dict]) -> "ColumnarStore":
+        store = cls()
+        for data in semesters:
+            store.add_dict(data)
+        return store
+
+    @classmethod
+    def load(cls, folder: Path) -> "ColumnarStore":
+        """
+        Load a save folder's semesters into a new store, in file name order. Files without a
+        journal and with plainly typed data are read straight into the columns; the others
+        (and folders keeping their saves in planner.db) go through the models as usual.
+        Files that can not be loaded are skipped and listed in `errors`.
+        """
+        try:
+            from .storage import load_directory
+        except ImportError:
+            from storage import load_directory
+
+        folder = Path(folder)
+        found = utils.scan_semester_files(folder)
+        store = cls()
+        if not found:
+            for semester in load_directory(folder):
+                store.add_semester(semester)
+            return store
+        for path, fingerprint in found.items():
+            try:
+                if fingerprint[2] is None:  # no journal to replay
+                    try:
+                        data = loads(path.read_bytes())
+                        if not data.get("file_path"):
+                            data["file_path"] = path.name
+                        store.add_dict(data)
+                        continue
+                    except (TypeError, ValueError, AttributeError):
+                        pass  # let the models validate (and coerce) it
+                store.add_semester(utils.load_semester_file(path, cache=False, fingerprint=fingerprint))
+            except Exception as e:
+                store.errors.append((path, utils.summarize_error(e)))
+        return store
+
+    # ---- queries ---- #
+
+    def count_overdue(self, now: Optional[float] = None) -> int:
+        """Unfinished assignments whose deadline has passed."""
+        now = dt.now().timestamp() if now is None else now
+        done = self.done
+        return sum(1 for i, epoch in enumerate(self.deadline) if epoch < now and not done[i])
+
+    def nbytes(self) -> int:
+        """Memory held by the columns and the name table (not the view objects)."""
+        columns = (self.assignment_name, self.current_score, self.max_score, self.deadline,
+                   self.subject_name, self.subject_code, self.credit, self.score, self.assignment_start)
+        total = sum(c.itemsize * len(c) for c in columns) + len(self.done)
+        return total + sum(sys.getsizeof(name) for name in self.names)
@@ -0,0 +1,122 @@
+# Sorted deadline index over loaded assignments
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime as dt, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class DeadlineEntry:
+    """One indexed assignment together with the subject and semester it belongs to."""
+
+    __slots__ = ("assignment", "subject", "semester", "deadline", "epoch")
+
+    def __init__(self, assignment, subject, semester, deadline: str, epoch: float):
+        self.assignment = assignment
+        self.subject = subject
+        self.semester = semester
+        self.deadline = deadline
+        self.epoch = epoch
+
+    @property
+    def deadline_dt(self) -> dt:
+        return self.assignment.deadline_dt or dt.fromtimestamp(self.epoch)
+
+
+class DeadlineIndex:
+    """
+    Assignments with a valid deadline, kept sorted by deadline epoch.
+
+    Whole semesters are indexed the first time sync() sees them and dropped when they are
+    no longer loaded; edits inside an indexed semester are reported with update()/discard().
+    Queries are bisect lookups over the sorted keys; done assignments stay indexed and are
+    skipped at query time, so toggling done needs no update.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[float, int]] = []          # sorted (epoch, id(assignment))
+        self._entries: Dict[int, DeadlineEntry] = {}      # id(assignment) -> entry
+        self._semesters: Dict[int, object] = {}           # id(semester) -> semester
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---- maintenance ---- #
+
+    def sync(self, semesters: List[object]) -> None:
+        """Index semesters not seen before and drop the ones no longer in `semesters`."""
+        current = {id(s): s for s in semesters}
+        for key in [k for k in self._semesters if k not in current]:
+            self._drop_semester(self._semesters.pop(key))
+        for key, semester in current.items():
+            if self._semesters.get(key) is not semester:
+                self._semesters[key] = semester
+                for subject in semester.subjects:
+                    for assignment in subject.assignments:
+                        self.update(assignment, subject, semester)
+
+    def _drop_semester(self, semester) -> None:
+        for key in [k for k, e in self._entries.items() if e.semester is semester]:
+            self._remove(key)
+
+    def update(self, assignment, subject, semester) -> None:
+        """(Re)index one assignment after it was added or its deadline changed."""
+        entry = self._entries.get(id(assignment))
+        if entry is not None and entry.assignment is assignment and entry.deadline == assignment.deadline:
+            entry.subject, entry.semester = subject, semester
+            return
+        self.discard(assignment)
+        epoch = assignment.deadline_ts
+        if epoch is None:
+            return
+        self._entries[id(assignment)] = DeadlineEntry(assignment, subject, semester, assignment.deadline, epoch)
+        insort(self._keys, (epoch, id(assignment)))
+
+    def discard(self, assignment) -> None:
+        """Remove one assignment from the index (no-op if it is not indexed)."""
+        entry = self._entries.get(id(assignment))
+        if entry is not None and entry.assignment is assignment:
+            self._remove(id(assignment))
+
+    def discard_subject(self, subject) -> None:
+        for assignment in subject.assignments:
+            self.discard(assignment)
+
+    def _remove(self, key: int) -> None:
+        entry = self._entries.pop(key)
+        i = bisect_left(self._keys, (entry.epoch, key))
+        if i < len(self._keys) and self._keys[i] == (entry.epoch, key):
+            del self._keys[i]
+
+    # ---- queries ---- #
+
+    def _iter(self, start: int, stop: int) -> Iterator[DeadlineEntry]:
+        for _, key in self._keys[start:stop]:
+            entry = self._entries[key]
+            if not entry.assignment.isDone:
+                yield entry
+
+    def due_within(self, window: timedelta, now: Optional[dt] = None) -> List[DeadlineEntry]:
+        """Unfinished assignments due after `now` and no later than `now + window`, soonest first."""
+        now_ts = (now or dt.now()).timestamp()
+        start = bisect_right(self._keys, (now_ts, float("inf")))
+        stop = bisect_right(self._keys, (now_ts + window.total_seconds(), float("inf")))
+        return list(self._iter(start, stop))
+
+    def overdue(self, now: Optional[dt] = None) -> List[DeadlineEntry]:
+        """Unfinished assignments whose deadline has passed, oldest first."""
+        now_ts = (now or dt.now()).timestamp()
+        return list(self._iter(0, bisect_left(self._keys, (now_ts, -1))))
+
+    def next_due(self, n: int, now: Optional[dt] = None) -> List[DeadlineEntry]:
+        """The next `n` unfinished assignments due after `now`."""
+        now_ts = (now or dt.now()).timestamp()
+        out = []
+        for entry in self._iter(bisect_right(self._keys, (now_ts, float("inf"))), len(self._keys)):
+            if len(out) >= n:
+                break
+            out.append(entry)
+        return out
+
+
+# process-wide index used by deadline_report and the menus
+deadline_index = DeadlineIndex()
@@ -1,6 +1,13 @@
 # Grade calculation functions
 
-from typing import Tuple
+import json
+import os
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SCALE_ENV = "STUDENT_PLANNER_GRADING_SCALE"
+SCALES_DIR_NAME = "scales"  # saves_dir()/scales/<name>.json, kept out of the *.json semester glob
 
 def get_default_thresholds():
     """
@@ -17,18 +24,11 @@ def get_default_thresholds():
         'F': 0
     }
 
-def get_grade_point(score: float) -> Tuple[float, str]:
+def get_default_grade_points():
     """
-    Convert raw score to (grade_point, letter_grade).
-    If score is None or not a number, treat as 0 (F).
+    Return default grade points for each letter grade.
     """
-    try:
-        s = float(score)
-    except Exception:
-        s = 0.0
-
-    thresholds = get_default_thresholds()
-    grade_points = {
+    return {
         'A': 4.0,
         'B+': 3.5,
         'B': 3.0,
@@ -39,11 +39,122 @@ def get_grade_point(score: float) -> Tuple[float, str]:
         'F': 0.0
     }
 
-    # iterate thresholds in descending order by min_score
-    for grade, min_score in sorted(thresholds.items(), key=lambda x: x[1], reverse=True):
-        if s >= min_score:
-            return grade_points[grade], grade
-    return 0.0, 'F'
+class GradingScale:
+    """
+    Letter-grade cutoffs compiled once into parallel ascending arrays
+    (minimum score, grade point, letter) so a score resolves with one bisect.
+    """
+
+    __slots__ = ("name", "mins", "points", "letters")
+
+    def __init__(self, thresholds: Dict[str, float], grade_points: Dict[str, float], name: str = "default"):
+        missing = [g for g in thresholds if g not in grade_points]
+        if missing:
+            raise ValueError(f"No grade point for {missing} in grading scale {name!r}")
+        self.name = name
+        self.mins: List[float] = []
+        self.points: List[float] = []
+        self.letters: List[str] = []
+        # ascending by minimum score; on equal minimums the first listed grade wins
+        for grade, min_score in sorted(thresholds.items(), key=lambda x: x[1]):
+            if self.mins and self.mins[-1] == float(min_score):
+                continue
+            self.mins.append(float(min_score))
+            self.points.append(float(grade_points[grade]))
+            self.letters.append(grade)
+
+    def lookup(self, score: float) -> Tuple[float, str]:
+        """
+        Convert raw score to (grade_point, letter_grade).
+        If score is None or not a number, treat as 0 (F).
+        """
+        try:
+            s = float(score)
+        except Exception:
+            s = 0.0
+        if s != s:  # NaN
+            return 0.0, 'F'
+        i = bisect_right(self.mins, s) - 1
+        if i < 0:
+            return 0.0, 'F'
+        return self.points[i], self.letters[i]
+
+    def lookup_many(self, scores: Iterable[float]) -> List[Tuple[float, str]]:
+        """Resolve many scores in one call."""
+        lookup = self.lookup
+        return [lookup(score) for score in scores]
+
+    def thresholds(self) -> Dict[str, float]:
+        """Return the cutoffs in descending order, like get_default_thresholds()."""
+        return {g: m for g, m in zip(reversed(self.letters), reversed(self.mins))}
+
+    def grade_points(self) -> Dict[str, float]:
+        return {g: p for g, p in zip(reversed(self.letters), reversed(self.points))}
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "thresholds": self.thresholds(), "grade_points": self.grade_points()}
+
+    @classmethod
+    def from_dict(cls, data: dict, name: Optional[str] = None):
+        return cls(data["thresholds"], data.get("grade_points") or get_default_grade_points(),
+                   name=name or data.get("name", "custom"))
+
+    @classmethod
+    def load(cls, name: str, directory: Optional[Path] = None):
+        """
+        Load a custom scale from saves_dir()/scales/<name>.json, e.g.
+        {"thresholds": {"A": 85, "B": 70, "C": 55, "D": 40, "F": 0},
+         "grade_points": {"A": 4.0, "B": 3.0, "C": 2.0, "D": 1.0, "F": 0.0}}
+        """
+        if directory is None:
+            try:
+                from .utils import saves_dir
+            except ImportError:
+                from utils import saves_dir
+            directory = saves_dir() / SCALES_DIR_NAME
+        path = Path(directory) / f"{name}.json"
+        with path.open("r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f), name=name)
+
+DEFAULT_SCALE = GradingScale(get_default_thresholds(), get_default_grade_points())
+_active_scale: Optional[GradingScale] = None
+_scale_generation = 0  # bumped by set_grading_scale(); cached renderings compare it
+
+def scale_generation() -> int:
+    """Changes whenever the grading scale in use is replaced, so caches of grades can tell."""
+    return _scale_generation
+
+def get_grading_scale() -> GradingScale:
+    """
+    Return the grading scale in use: the custom scale named by STUDENT_PLANNER_GRADING_SCALE
+    (loaded from saves_dir()/scales) if set and readable, else the default scale.
+    """
+    global _active_scale
+    if _active_scale is None:
+        name = os.environ.get(SCALE_ENV)
+        try:
+            _active_scale = GradingScale.load(name) if name else DEFAULT_SCALE
+        except Exception:
+            _active_scale = DEFAULT_SCALE
+    return _active_scale
+
+def set_grading_scale(scale) -> GradingScale:
+    """Use a GradingScale (or the name of a saved one) for all grade calculations."""
+    global _active_scale, _scale_generation
+    _active_scale = scale if isinstance(scale, GradingScale) else GradingScale.load(scale)
+    _scale_generation += 1
+    return _active_scale
+
+def get_grade_point(score: float) -> Tuple[float, str]:
+    """
+    Convert raw score to (grade_point, letter_grade).
+    If score is None or not a number, treat as 0 (F).
+    """
+    return get_grading_scale().lookup(score)
+
+def get_grade_points(scores: Iterable[float]) -> List[Tuple[float, str]]:
+    """Batch version of get_grade_point."""
+    return get_grading_scale().lookup_many(scores)
 
 def calculate_gpa(semester) -> float:
     """
@@ -77,34 +188,12 @@ def calculate_gpax(all_semesters: list) -> float:
     return total_grade_points / total_credits
 
 if __name__ == "__main__":
-    import os
-    import json
-    from classes import Semester
-
-    save_path = os.path.dirname(os.path.realpath(__file__))
-    save_path = fr"{save_path:s}\..\Saves"
-    
-    names = [name for name in os.listdir(save_path)]
-    
-    semesters = []
-
-    for name in names:
-        with open(f"{save_path}\\{name}", "r") as f:
-            data = json.load(f)
-            loaded_semester = Semester.from_dict(data)
-            semesters.append(loaded_semester)
-
-            # Print loaded data
-            print(loaded_semester.show())
-
-    semester1 = semesters[0]
-    semester2 = semesters[1]
-    
-    gpa1 = calculate_gpa(semester1)
-    gpa2 = calculate_gpa(semester2)
-    
-    gpax = calculate_gpax([semester1, semester2])
-    
-    print(f"GPA Semester 1: {gpa1:.2f}")
-    print(f"GPA Semester 2: {gpa2:.2f}")
-    print(f"GPAX: {gpax:.2f}")
\ No newline at end of file
+    from utils import check_path
+
+    # every saved semester (the OS user-data Saves folder, see utils.saves_dir)
+    semesters = check_path()
+    for i, semester in enumerate(semesters, 1):
+        print(semester.show())
+        print(f"GPA Semester {i}: {calculate_gpa(semester):.2f}")
+
+    print(f"GPAX: {calculate_gpax(semesters):.2f}")
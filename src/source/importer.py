@@ -0,0 +1,332 @@
+# Bulk import of assignments from LMS exports (CSV or iCalendar)
+#
+# Files are read one record at a time and validated against Assignment in batches of
+# BATCH_SIZE; each record is mapped to a subject by course code (or class name). Nothing
+# is written until the whole file has been read, then every affected semester is saved once.
+
+import csv
+import re
+from datetime import datetime as dt, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+try:
+    from .classes import Assignment, DEADLINE_FORMAT
+except Exception:
+    from classes import Assignment, DEADLINE_FORMAT
+
+BATCH_SIZE = 500
+DEFAULT_MAX_SCORE = 100.0
+
+# accepted CSV headers (lowercased) for each Assignment field
+CSV_COLUMNS = {
+    "course_code": ("course_code", "course code", "course", "class", "subject"),
+    "name": ("name", "assignment", "title", "summary"),
+    "max_score": ("max_score", "max score", "points", "points possible"),
+    "deadline": ("deadline", "due", "due date", "due_at"),
+    "current_score": ("current_score", "score"),
+    "isDone": ("isdone", "done", "completed"),
+}
+DEADLINE_INPUT_FORMATS = (DEADLINE_FORMAT, "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S",
+                          "%Y-%m-%dT%H:%M", "%m/%d/%Y %H:%M", "%m/%d/%y %H:%M", "%Y-%m-%d")
+
+_list_adapter = TypeAdapter(List[Assignment])
+
+
+class Record:
+    """One assignment read from a feed, with the line it started on."""
+
+    __slots__ = ("line", "course", "fields", "error")
+
+    def __init__(self, line: int, course: str, fields: dict, error: Optional[str] = None):
+        self.line = line
+        self.course = course
+        self.fields = fields
+        self.error = error
+
+
+class ImportResult:
+    def __init__(self):
+        self.added = 0
+        self.updated = 0
+        self.rejected: List[Tuple[int, str]] = []   # (line number, reason)
+        self.semesters: List[object] = []           # semesters that were (or would be) saved
+
+    def to_dict(self) -> dict:
+        return {"added": self.added, "updated": self.updated,
+                "rejected": [{"line": line, "reason": reason} for line, reason in self.rejected],
+                "semesters": [s.file_path for s in self.semesters]}
+
+
+# ---------------- readers ---------------- #
+
+def normalize_deadline(value: Optional[str]) -> Optional[str]:
+    """Deadline in the saved MM/DD/YY HH:MM:SS format; raises ValueError if no known format matches."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        parsed = dt.fromisoformat(value)
+    except ValueError:
+        for fmt in DEADLINE_INPUT_FORMATS:
+            try:
+                parsed = dt.strptime(value, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            raise ValueError(f"unrecognised deadline {value!r}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    elif len(value) == 10:  # date only: due at the end of the day
+        parsed = parsed.replace(hour=23, minute=59, second=0)
+    return parsed.strftime(DEADLINE_FORMAT)
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "y", "done", "x")
+
+
+def read_csv(path: Path) -> Iterator[Record]:
+    """Yield one Record per CSV row; the header names the columns (see CSV_COLUMNS)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        lowered = [h.strip().lower() for h in header]
+        columns = {}
+        for field, names in CSV_COLUMNS.items():
+            for name in names:
+                if name in lowered:
+                    columns[field] = lowered.index(name)
+                    break
+        line = reader.line_num
+        for row in reader:
+            start, line = line + 1, reader.line_num
+            if not any(cell.strip() for cell in row):
+                continue
+            get = lambda field: row[columns[field]].strip() if field in columns and columns[field] < len(row) else ""
+            fields = {"name": get("name")}
+            try:
+                if get("deadline"):
+                    fields["deadline"] = normalize_deadline(get("deadline"))
+                for field in ("max_score", "current_score"):
+                    if get(field):
+                        fields[field] = get(field)
+                if get("isDone"):
+                    fields["isDone"] = _parse_bool(get("isDone"))
+            except ValueError as e:
+                yield Record(start, get("course_code"), fields, str(e))
+                continue
+            yield Record(start, get("course_code"), fields)
+
+
+def _unfolded_lines(f) -> Iterator[Tuple[int, str]]:
+    """iCalendar content lines with folding undone, paired with the line they start on."""
+    pending, start = None, 0
+    for number, raw in enumerate(f, 1):
+        raw = raw.rstrip("\r\n")
+        if raw[:1] in (" ", "\t") and pending is not None:
+            pending += raw[1:]
+            continue
+        if pending is not None:
+            yield start, pending
+        pending, start = raw, number
+    if pending is not None:
+        yield start, pending
+
+
+def _ics_unescape(value: str) -> str:
+    return re.sub(r"\\([,;\\nN])", lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+_ICS_PARAM = re.compile(r';([^=;:]*)=("[^"]*"|[^;:]*)')
+
+
+def _ics_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """
+    Split a content line into (NAME, {PARAM: value}, value). Parameter values may be quoted
+    (TZID="America/New_York"); quotes are removed, and ';' or ':' inside them is kept.
+    """
+    name_end = re.match(r"[^;:]*", line).end()
+    name, params, i = line[:name_end].upper(), {}, name_end
+    while i < len(line) and line[i] == ";":
+        match = _ICS_PARAM.match(line, i)
+        if match is None:
+            break
+        params[match.group(1).upper()] = match.group(2).strip('"')
+        i = match.end()
+    _, _, value = line[i:].partition(":")
+    return name, params, value
+
+
+def _ics_datetime(value: str, params: Dict[str, str]) -> str:
+    value = value.strip()
+    if len(value) == 8:  # DATE: due at the end of the day
+        return dt.strptime(value, "%Y%m%d").replace(hour=23, minute=59).strftime(DEADLINE_FORMAT)
+    parsed = dt.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    elif "TZID" in params and ZoneInfo is not None:
+        try:
+            parsed = parsed.replace(tzinfo=ZoneInfo(params["TZID"]))
+        except Exception:
+            pass
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.strftime(DEADLINE_FORMAT)
+
+
+def read_ics(path: Path) -> Iterator[Record]:
+    """
+    Yield one Record per VEVENT/VTODO. The course code comes from CATEGORIES, or from a
+    trailing "[CODE]" in SUMMARY (the usual LMS calendar export); the deadline from DUE,
+    else DTSTART. Feeds carry no scores, so new assignments get the importer's default max score.
+    """
+    with open(path, encoding="utf-8-sig") as f:
+        props, start = None, 0
+        for number, line in _unfolded_lines(f):
+            name, params, value = _ics_content_line(line)
+            if name == "BEGIN" and value.upper() in ("VEVENT", "VTODO"):
+                props, start = {}, number
+            elif name == "END" and value.upper() in ("VEVENT", "VTODO") and props is not None:
+                yield _ics_record(start, props)
+                props = None
+            elif props is not None and name not in props:
+                props[name] = (value, params)
+
+
+def _ics_record(line: int, props: dict) -> Record:
+    summary = _ics_unescape(props.get("SUMMARY", ("", {}))[0]).strip()
+    course = _ics_unescape(props.get("CATEGORIES", ("", {}))[0]).split(",")[0].strip()
+    if not course:
+        match = re.match(r"^(.*?)\s*\[([^\]]+)\]\s*$", summary)
+        if match:
+            summary, course = match.group(1), match.group(2).strip()
+    fields = {"name": summary}
+    value, params = props.get("DUE") or props.get("DTSTART") or ("", {})
+    if value:
+        try:
+            fields["deadline"] = _ics_datetime(value, params)
+        except ValueError:
+            return Record(line, course, fields, f"unrecognised date {value!r}")
+    return Record(line, course, fields)
+
+
+def read_records(path: Path, fmt: Optional[str] = None) -> Iterator[Record]:
+    fmt = fmt or ("ics" if Path(path).suffix.lower() in (".ics", ".ical", ".ifb") else "csv")
+    if fmt == "ics":
+        return read_ics(path)
+    return read_csv(path)
+
+
+# ---------------- import ---------------- #
+
+def _subject_index(semesters: List[object]) -> Dict[str, List[Tuple[object, object]]]:
+    """course code and class name (lowercased) -> [(semester, subject)]"""
+    index: Dict[str, List[Tuple[object, object]]] = {}
+    for semester in semesters:
+        for subject in semester.subjects:
+            keys = {subject.name.strip().lower()}
+            if subject.course_code:
+                keys.add(subject.course_code.strip().lower())
+            for key in keys:
+                index.setdefault(key, []).append((semester, subject))
+    return index
+
+
+def _validate_batch(batch: List[Record], max_score: float, result: ImportResult) -> List[Tuple[Record, Assignment]]:
+    """Validate a batch in one pydantic call; rejected rows are reported with their line number."""
+    try:
+        models = _list_adapter.validate_python([{"max_score": max_score} | r.fields for r in batch])
+        return list(zip(batch, models))
+    except ValidationError as e:
+        bad: Dict[int, str] = {}
+        for err in e.errors():
+            i = err["loc"][0]
+            field = ".".join(str(x) for x in err["loc"][1:])
+            bad.setdefault(i, f"{field}: {err['msg']}" if field else err["msg"])
+    for i, reason in sorted(bad.items()):
+        result.rejected.append((batch[i].line, reason))
+    good = [r for i, r in enumerate(batch) if i not in bad]
+    return list(zip(good, _list_adapter.validate_python([{"max_score": max_score} | r.fields for r in good])))
+
+
+def _apply(record: Record, assignment: Assignment, index, result: ImportResult, touched: dict) -> None:
+    if not record.fields.get("name"):
+        result.rejected.append((record.line, "missing assignment name"))
+        return
+    matches = index.get(record.course.strip().lower(), []) if record.course else []
+    if not matches:
+        result.rejected.append((record.line, f"no class with course code {record.course!r}" if record.course
+                                else "missing course code"))
+        return
+    if len(matches) > 1:
+        result.rejected.append((record.line, f"course code {record.course!r} is in several semesters; pick one"))
+        return
+    semester, subject = matches[0]
+    existing = next((a for a in subject.assignments if a.name.lower() == assignment.name.lower()), None)
+    if existing is None:
+        subject.assignments.append(assignment)
+        result.added += 1
+    else:
+        changed = False
+        for field in record.fields:  # only what the feed actually gave
+            value = getattr(assignment, field)
+            if field != "name" and getattr(existing, field) != value:
+                setattr(existing, field, value)
+                changed = True
+        if not changed:
+            return
+        result.updated += 1
+    touched[id(semester)] = semester
+
+
+def import_assignments(path: Path, semesters: List[object], fmt: Optional[str] = None,
+                       max_score: float = DEFAULT_MAX_SCORE, dry_run: bool = False) -> ImportResult:
+    """
+    Import the assignments in `path` into the matching subjects of `semesters`.
+    Assignments whose name already exists in the subject are updated instead of duplicated.
+    Every changed semester is saved once at the end. With dry_run nothing is saved and
+    `semesters` are left untouched: the import runs on copies, returned in result.semesters.
+    """
+    if dry_run:
+        semesters = [s.model_copy(deep=True) for s in semesters]
+    result = ImportResult()
+    index = _subject_index(semesters)
+    touched: Dict[int, object] = {}
+    batch: List[Record] = []
+
+    def drain():
+        for record, assignment in _validate_batch(batch, max_score, result):
+            if assignment.deadline_invalid:
+                result.rejected.append((record.line, f"invalid deadline {assignment.deadline!r}"))
+                continue
+            _apply(record, assignment, index, result, touched)
+        batch.clear()
+
+    for record in read_records(path, fmt):
+        if record.error:
+            result.rejected.append((record.line, record.error))
+            continue
+        batch.append(record)
+        if len(batch) >= BATCH_SIZE:
+            drain()
+    drain()
+
+    result.rejected.sort()
+    result.semesters = list(touched.values())
+    if not dry_run:
+        for semester in result.semesters:
+            semester.save()
+    return result
@@ -0,0 +1,218 @@
+# Opt-in timing of the planner's hot paths and menu screens
+#
+# Functions marked with @timed are left untouched unless stats are on, so there is no cost
+# when they are off. Turn them on with STUDENT_PLANNER_STATS=1 (summary on stderr at exit)
+# or STUDENT_PLANNER_STATS=<file.json>, or with app's --stats flag; --profile FILE (or
+# STUDENT_PLANNER_PROFILE=FILE) writes a cProfile of the whole session instead.
+# Time spent waiting for the user (read_line, pause) is not counted against any timer.
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+STATS_ENV = "STUDENT_PLANNER_STATS"
+PROFILE_ENV = "STUDENT_PLANNER_PROFILE"
+PERCENTILES = (50, 90, 99)
+
+_stats_target = os.environ.get(STATS_ENV, "")
+ENABLED = _stats_target not in ("", "0")
+
+_samples: Dict[str, array] = {}               # timer name -> durations in seconds
+_registered: List[Tuple[str, Callable]] = []  # (name, original) of every @timed function, for enable()
+_idle_marked: List[Callable] = []             # originals marked with @waiting
+_state = threading.local()                    # .idle: seconds this thread spent waiting for the user
+_report_registered = False
+_profiler = None
+
+
+def _record(name: str, seconds: float) -> None:
+    samples = _samples.get(name)
+    if samples is None:
+        samples = _samples.setdefault(name, array("d"))
+    samples.append(seconds)
+
+
+def _timer(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        idle = getattr(_state, "idle", 0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - start - (getattr(_state, "idle", 0.0) - idle))
+    return wrapper
+
+
+def _idle(func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _state.idle = getattr(_state, "idle", 0.0) + time.perf_counter() - start
+    return wrapper
+
+
+def timed(name=None):
+    """
+    Mark a function or method for timing, as @timed or @timed("name") (default: its qualified
+    name). While stats are off the function itself is returned, so calls cost nothing extra.
+    """
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__qualname__
+        _registered.append((label, func))
+        return _timer(label, func) if ENABLED else func
+
+    if callable(name):
+        func, name = name, None
+        return decorate(func)
+    return decorate
+
+
+def waiting(func: Callable) -> Callable:
+    """Mark a function that blocks on the user; its time is left out of every running timer."""
+    _idle_marked.append(func)
+    return _idle(func) if ENABLED else func
+
+
+def _replace_everywhere(func: Callable, wrapper: Callable) -> None:
+    """Swap `func` for `wrapper` where it was defined and wherever it was imported by name."""
+    owner = sys.modules.get(func.__module__)
+    path = func.__qualname__.split(".")
+    for part in path[:-1]:
+        owner = getattr(owner, part, None)
+    if owner is not None and getattr(owner, path[-1], None) is func:
+        setattr(owner, path[-1], wrapper)
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if namespace is None:
+            continue
+        for key, value in list(namespace.items()):
+            if value is func:
+                namespace[key] = wrapper
+
+
+def enable(target: Optional[str] = None) -> None:
+    """
+    Turn stats on for the rest of the process (already imported functions are wrapped in place).
+    The summary goes to `target` (a JSON file) at exit, or to stderr when it is None or "1".
+    """
+    global ENABLED, _stats_target
+    if target is not None:
+        _stats_target = target
+    if not ENABLED:
+        ENABLED = True
+        for label, func in _registered:
+            _replace_everywhere(func, _timer(label, func))
+        for func in _idle_marked:
+            _replace_everywhere(func, _idle(func))
+    _register_report()
+
+
+def start_profile(path: str) -> None:
+    """Profile the rest of the session with cProfile and write the stats to `path` at exit."""
+    global _profiler
+    if _profiler is not None:
+        return
+    import cProfile
+
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+
+    def dump():
+        _profiler.disable()
+        _profiler.dump_stats(path)
+    atexit.register(dump)
+
+
+def enable_from_argv(argv: List[str]) -> List[str]:
+    """Act on app's --stats and --profile FILE flags; returns the remaining arguments."""
+    rest = []
+    args = iter(argv)
+    profile = None
+    for arg in args:
+        if arg == "--stats":
+            enable()
+        elif arg == "--profile":
+            profile = next(args, None)
+        elif arg.startswith("--profile="):
+            profile = arg.split("=", 1)[1]
+        else:
+            rest.append(arg)
+    if profile:
+        start_profile(profile)
+    return rest
+
+
+# ---------------- report ---------------- #
+
+def _percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    k = max(0, min(len(ordered) - 1, -(-len(ordered) * p // 100) - 1))
+    return ordered[int(k)]
+
+
+def stats() -> Dict[str, dict]:
+    """name -> calls, total/mean/max and percentile times (ms) of every timer that ran."""
+    out = {}
+    for name, samples in sorted(_samples.items()):
+        ordered = sorted(samples)
+        if not ordered:
+            continue
+        total = sum(ordered)
+        entry = {"calls": len(ordered), "total_ms": total * 1000, "mean_ms": total * 1000 / len(ordered)}
+        for p in PERCENTILES:
+            entry[f"p{p}_ms"] = _percentile(ordered, p) * 1000
+        entry["max_ms"] = ordered[-1] * 1000
+        out[name] = entry
+    return out
+
+
+def reset() -> None:
+    _samples.clear()
+
+
+def format_stats(data: Optional[Dict[str, dict]] = None) -> str:
+    data = stats() if data is None else data
+    if not data:
+        return "No timed calls recorded."
+    width = max(len(name) for name in data)
+    columns = ["calls", "total_ms", "mean_ms"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+    lines = [f"{'timer':<{width}}" + "".join(f"{c:>12}" for c in columns)]
+    for name, entry in sorted(data.items(), key=lambda item: -item[1]["total_ms"]):
+        lines.append(f"{name:<{width}}{entry['calls']:>12}"
+                     + "".join(f"{entry[c]:>12.3f}" for c in columns[1:]))
+    return "\n".join(lines)
+
+
+def report() -> None:
+    """Write the summary to the configured JSON file, or print it to stderr."""
+    if _stats_target in ("", "0", "1"):
+        print("\n" + format_stats(), file=sys.stderr)
+        return
+    try:
+        with open(_stats_target, "w", encoding="utf-8") as f:
+            json.dump(stats(), f, indent=2)
+    except OSError as e:
+        print(f"Could not write stats to {_stats_target}: {e}", file=sys.stderr)
+
+
+def _register_report() -> None:
+    global _report_registered
+    if not _report_registered:
+        _report_registered = True
+        atexit.register(report)
+
+
+if ENABLED:
+    _register_report()
+if os.environ.get(PROFILE_ENV):
+    start_profile(os.environ[PROFILE_ENV])
@@ -0,0 +1,271 @@
+# Append-only edit journal for JSON semester saves
+#
+# Each semester snapshot (saves_dir()/<name>.json) may have a <name>.json.journal next to it
+# holding one JSON operation record per line. An edit appends a few bytes instead of
+# rewriting the whole semester; every COMPACT_EVERY records the journal is folded back
+# into the snapshot. Records carry a sequence number and the snapshot stores the last
+# one it contains (Semester.journal_seq), so a crash between writing the snapshot and
+# removing the journal never applies an edit twice. Appends take an exclusive lock on the
+# journal and pick up records other processes appended since, so two planners sharing a
+# saves folder never hand out the same sequence number.
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    from .utils import journal_path
+    from .jsonio import loads
+except Exception:
+    from utils import journal_path
+    from jsonio import loads
+
+COMPACT_EVERY = 50
+
+# snapshot path -> (records in journal, last sequence number seen, journal bytes those cover)
+_STATE: Dict[Path, Tuple[int, int, int]] = {}
+# snapshot path -> why some of its journal records were not applied by the last replay
+_SKIPPED: Dict[Path, str] = {}
+
+
+# ---------------- Operation records ---------------- #
+
+def locate(semester, obj) -> List[int]:
+    """Return the index path of a subject ([i]) or assignment ([i, j]) inside a semester ([] for itself)."""
+    if obj is semester:
+        return []
+    for i, subject in enumerate(semester.subjects):
+        if subject is obj:
+            return [i]
+        for j, assignment in enumerate(subject.assignments):
+            if assignment is obj:
+                return [i, j]
+    raise ValueError("object does not belong to this semester")
+
+
+def set_op(semester, obj, **fields) -> dict:
+    """Record field changes on the semester, one of its subjects or one of its assignments."""
+    return {"op": "set", "at": locate(semester, obj), "fields": fields}
+
+
+def add_op(semester, obj) -> dict:
+    """Record a subject or assignment that was just appended to the semester."""
+    at = locate(semester, obj)
+    return {"op": "add", "at": at[:-1], "value": obj.to_dict()}
+
+
+def remove_op(semester, obj) -> dict:
+    """Record a subject or assignment removal. Call before removing it from its list."""
+    return {"op": "remove", "at": locate(semester, obj)}
+
+
+def apply_op(semester, op: dict) -> None:
+    """Apply one operation record to an in-memory semester."""
+    try:
+        from .classes import Subject, Assignment
+    except ImportError:
+        from classes import Subject, Assignment
+
+    at = op.get("at", [])
+    kind = op.get("op")
+    if kind == "set":
+        target = semester
+        if len(at) >= 1:
+            target = semester.subjects[at[0]]
+        if len(at) == 2:
+            target = target.assignments[at[1]]
+        for key, value in op["fields"].items():
+            setattr(target, key, value)
+    elif kind == "add":
+        if not at:
+            semester.subjects.append(Subject(**op["value"]))
+        else:
+            semester.subjects[at[0]].assignments.append(Assignment(**op["value"]))
+    elif kind == "remove":
+        if len(at) == 1:
+            del semester.subjects[at[0]]
+        else:
+            del semester.subjects[at[0]].assignments[at[1]]
+    else:
+        raise ValueError(f"unknown journal op {kind!r}")
+
+
+# ---------------- Journal files ---------------- #
+
+def _parse(data: bytes) -> Tuple[List[dict], int]:
+    """Records in journal bytes, and how many bytes the complete lines cover. Bad lines are ignored."""
+    end = data.rfind(b"\n") + 1
+    records = []
+    for line in data[:end].splitlines():
+        try:
+            records.append(loads(line))
+        except ValueError:
+            continue
+    return records, end
+
+
+def read_journal(path: Path) -> List[dict]:
+    """
+    Return the records in the journal of snapshot `path`.
+    A torn trailing line (crash during append) is ignored.
+    """
+    try:
+        return _parse(journal_path(path).read_bytes())[0]
+    except FileNotFoundError:
+        return []
+
+
+def replay_journal(path: Path, semester) -> int:
+    """
+    Apply the journal of snapshot `path` to a freshly loaded semester. Records already
+    folded into the snapshot are skipped quietly (left behind when a save stopped between
+    writing the snapshot and discarding the journal); records that no longer fit are
+    skipped and reported by skipped_records().
+
+    Returns:
+        int: number of records applied
+    """
+    try:
+        records, size = _parse(journal_path(path).read_bytes())
+    except FileNotFoundError:
+        records, size = [], 0
+    base = semester.journal_seq or 0
+    last = base
+    applied = 0
+    failed: List[str] = []
+    for rec in records:
+        seq = rec.get("seq", 0)
+        last = max(last, seq)
+        if seq <= base:
+            continue
+        try:
+            apply_op(semester, rec)
+            applied += 1
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            failed.append(f"#{seq} {rec.get('op')} ({type(e).__name__})")
+    _STATE[path] = (len(records), last, size)
+    if failed:
+        _SKIPPED[path] = f"{len(failed)} journal edit(s) could not be applied: {', '.join(failed)}"
+    else:
+        _SKIPPED.pop(path, None)
+    return applied
+
+
+def skipped_records(path: Path) -> Optional[str]:
+    """Why some journal records of `path` were not applied when it was last loaded (None: all were)."""
+    return _SKIPPED.get(path)
+
+
+def _saved_seq(path: Path) -> int:
+    """journal_seq of the snapshot file as it is on disk (0 if it can not be read)."""
+    try:
+        return loads(path.read_bytes()).get("journal_seq") or 0
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _refresh(path: Path) -> Tuple[int, int, int]:
+    """
+    (records, last sequence number, size) of the journal as it is on disk now. Only the
+    bytes appended since the last look are read; a journal that shrank or vanished was
+    compacted, possibly by another process, whose snapshot then holds the latest number.
+    """
+    jp = journal_path(path)
+    try:
+        size = jp.stat().st_size
+    except FileNotFoundError:
+        size = 0
+    count, seq, known = _STATE.get(path, (0, 0, -1))
+    if size == known:
+        return count, seq, known
+    if size < known:  # rewritten behind our back
+        count, known, seq = 0, 0, max(seq, _saved_seq(path))
+    elif known < 0:
+        count, known = 0, 0
+    if size > known:
+        with jp.open("rb") as f:
+            f.seek(known)
+            records, end = _parse(f.read(size - known))
+        count += len(records)
+        seq = max([seq] + [r.get("seq", 0) for r in records])
+        known += end
+    _STATE[path] = (count, seq, known)
+    return count, seq, known
+
+
+def _state(path: Path, semester) -> Tuple[int, int]:
+    count, seq, _ = _refresh(path)
+    return count, max(seq, semester.journal_seq or 0)
+
+
+def last_seq(path: Path, semester) -> int:
+    """Return the sequence number of the last record written to the journal of `path`."""
+    return _state(path, semester)[1]
+
+
+def _lock(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        import msvcrt
+
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def append_ops(path: Path, semester, ops: List[dict]) -> int:
+    """
+    Append operation records to the journal of snapshot `path` and fsync it. The journal
+    is locked while its tail is re-read and the records are numbered and written.
+
+    Returns:
+        int: number of records now in the journal
+    """
+    jp = journal_path(path)
+    with jp.open("a+b") as f:  # O_APPEND: every write lands at the current end
+        _lock(f)
+        try:
+            count, seq = _state(path, semester)
+            lines = []
+            for op in ops:
+                seq += 1
+                lines.append(json.dumps(op | {"seq": seq}, separators=(",", ":")))
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")  # finish a torn line so it stays isolated
+            f.write(("\n".join(lines) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            _STATE[path] = (count + len(ops), seq, f.tell())
+        finally:
+            _unlock(f)
+    return count + len(ops)
+
+
+def discard_journal(path: Path) -> None:
+    """Remove the journal of `path` once its records are part of the snapshot."""
+    try:
+        journal_path(path).unlink()
+    except FileNotFoundError:
+        pass
+    _SKIPPED.pop(path, None)
+    if path in _STATE:
+        _STATE[path] = (0, _STATE[path][1], 0)
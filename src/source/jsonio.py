@@ -0,0 +1,39 @@
+# JSON decoding with an optional faster parser
+#
+# orjson is used for decoding when it is installed (pip install student-planner[fast]).
+# It is imported on the first large document (see FAST_MIN_BYTES).
+# Snapshots and journal records are still written with the standard json module, whose
+# output orjson can not always read back (NaN/Infinity), so loads() falls back to json.
+
+import json
+from typing import Any, Union
+
+# orjson pulls in uuid, zoneinfo and platform (~10 ms), more than it saves on small documents
+# like the manifest, so it is only imported once something this big has to be decoded.
+FAST_MIN_BYTES = 16 * 1024
+
+_orjson = None
+_orjson_tried = False
+
+
+def _fast_parser(size: int):
+    global _orjson, _orjson_tried
+    if not _orjson_tried and size >= FAST_MIN_BYTES:
+        _orjson_tried = True
+        try:
+            import orjson
+        except ImportError:  # optional dependency
+            orjson = None
+        _orjson = orjson
+    return _orjson
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON text or bytes; raises ValueError on invalid input."""
+    orjson = _fast_parser(len(data))
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by json.dumps; let json decide
+    return json.loads(data)
@@ -0,0 +1,227 @@
+# Header-only manifest of the semesters in saves_dir()
+#
+# Menus that only list semesters need year, season, GPA and a few counts, not every
+# subject and assignment. saves_dir()/.manifest keeps one small header per semester file,
+# rewritten whenever a whole semester file is written (Semester.to_json, which is also how
+# the journal is compacted); each header carries the fingerprint of the file it describes,
+# so a file changed since (by a journal append, or behind our back) is re-read once and its
+# header refreshed the next time the semesters are listed. A full Semester is only loaded when opened, and
+# nothing here imports the models (or pydantic) until then, so the main menu starts fast.
+
+import hashlib
+import json
+import threading
+from bisect import bisect_right
+from datetime import datetime as dt
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .gradecal import get_grading_scale
+    from .jsonio import loads
+    from .utils import (atomic_write_text, _fingerprint, load_semester_file, saves_dir, scan_semester_files,
+                        set_load_errors, summarize_error, journal_problems)
+except Exception:
+    from gradecal import get_grading_scale
+    from jsonio import loads
+    from utils import (atomic_write_text, _fingerprint, load_semester_file, saves_dir, scan_semester_files,
+                       set_load_errors, summarize_error, journal_problems)
+
+MANIFEST_NAME = ".manifest"  # JSON, but not *.json so the semester loader never picks it up
+MANIFEST_VERSION = 1
+
+_lock = threading.RLock()
+_MANIFESTS: Dict[Path, Dict[str, "SemesterHeader"]] = {}  # folder -> file name -> header
+
+
+def format_summary(year, season, gpa, classes: int, done: int, total: int) -> str:
+    """The main menu's one-line semester overview (shared by Semester and manifest headers)."""
+    y = f" {year}" if year else ""
+    s = f" {season}" if season else ""
+    return f"Semester{y}{s} | GPA : {gpa} | {classes} classes | {done}/{total} assignments done"
+
+
+def scale_key(scale=None) -> str:
+    """Short digest of a grading scale; headers built under another scale are refreshed."""
+    scale = scale or get_grading_scale()
+    return hashlib.sha1(json.dumps(scale.to_dict(), sort_keys=True).encode()).hexdigest()[:16]
+
+
+class SemesterHeader:
+    """What the menus need to list one semester, without its subjects and assignments."""
+
+    FIELDS = ("file_path", "year", "season", "gpa", "credits", "subjects", "assignments", "done",
+              "overdue", "next_deadline", "pending", "weights", "scale", "fingerprint")
+    __slots__ = FIELDS + ("semester",)
+
+    def __init__(self, data: dict, semester=None):
+        for name in self.FIELDS:
+            setattr(self, name, data.get(name))
+        self.pending = data.get("pending") or []   # sorted epochs of unfinished assignments' deadlines
+        self.weights = data.get("weights") or []   # [grade point * credit, credit] per subject, in order
+        fp = data.get("fingerprint")  # (mtime_ns, size, journal (mtime_ns, size) or None), lists once in JSON
+        self.fingerprint = (fp[0], fp[1], tuple(fp[2]) if fp[2] else None) if fp else None
+        self.semester = semester                   # the full Semester, once loaded
+
+    @classmethod
+    def from_semester(cls, semester, fingerprint: Optional[tuple] = None) -> "SemesterHeader":
+        scale = get_grading_scale()
+        now = dt.now().timestamp()
+        total = done = 0
+        pending = []
+        weights = []
+        for subject in semester.subjects:
+            credit = subject.credit or 0.0
+            weights.append([scale.lookup(subject.score)[0] * credit, credit])
+            for a in subject.assignments:
+                total += 1
+                if a.isDone:
+                    done += 1
+                elif a.deadline_ts is not None:
+                    pending.append(a.deadline_ts)
+        pending.sort()
+        overdue = bisect_right(pending, now)
+        return cls({
+            "file_path": semester.file_path, "year": semester.year, "season": semester.season,
+            "gpa": semester._running_gpa(), "credits": sum(w[1] for w in weights),
+            "subjects": len(semester.subjects), "assignments": total, "done": done,
+            "overdue": overdue,
+            "next_deadline": dt.fromtimestamp(pending[overdue]).isoformat() if overdue < len(pending) else None,
+            "pending": pending, "weights": weights, "scale": scale_key(scale),
+            "fingerprint": list(fingerprint) if fingerprint else None,
+        }, semester)
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def overdue_count(self, now: Optional[dt] = None) -> int:
+        """Unfinished assignments past their deadline at `now` (the stored count ages, this does not)."""
+        return bisect_right(self.pending, (now or dt.now()).timestamp())
+
+    def next_due(self, now: Optional[dt] = None) -> Optional[dt]:
+        i = self.overdue_count(now)
+        return dt.fromtimestamp(self.pending[i]) if i < len(self.pending) else None
+
+    def info(self) -> str:
+        try:
+            from .classes import format_info
+        except ImportError:
+            from classes import format_info
+        return format_info(self.year, self.season, self.gpa)
+
+    def summary(self) -> str:
+        return format_summary(self.year, self.season, self.gpa, self.subjects, self.done, self.assignments)
+
+    def load(self):
+        """The full Semester (loaded on first use, then kept)."""
+        if self.semester is None:
+            try:
+                from .storage import get_backend
+            except ImportError:
+                from storage import get_backend
+            self.semester = get_backend().load_one(self.file_path)
+            if self.semester is None:
+                raise FileNotFoundError(f"semester file {self.file_path} is gone")
+        return self.semester
+
+
+def _entries(folder: Path) -> Dict[str, SemesterHeader]:
+    entries = _MANIFESTS.get(folder)
+    if entries is None:
+        try:
+            data = loads((folder / MANIFEST_NAME).read_bytes())
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            data = {}
+        entries = _MANIFESTS[folder] = {name: SemesterHeader(h) for name, h in data.get("semesters", {}).items()}
+    return entries
+
+
+def _write(folder: Path) -> None:
+    entries = _MANIFESTS.get(folder, {})
+    data = {"version": MANIFEST_VERSION, "semesters": {name: h.to_dict() for name, h in sorted(entries.items())}}
+    try:
+        atomic_write_text(folder / MANIFEST_NAME, json.dumps(data))
+    except OSError:
+        pass  # only an index; headers are rebuilt from the files
+
+
+def record(path: Path, semester) -> None:
+    """Refresh the header of the semester just written in full to `path` (called by Semester.to_json)."""
+    with _lock:
+        try:
+            header = SemesterHeader.from_semester(semester, _fingerprint(path))
+        except OSError:
+            return
+        _entries(path.parent)[path.name] = header
+        _write(path.parent)
+
+
+def forget(path: Path) -> None:
+    """Drop the header of a deleted semester file."""
+    with _lock:
+        if _entries(path.parent).pop(path.name, None) is not None:
+            _write(path.parent)
+
+
+def semester_headers(folder: Optional[Path] = None) -> List[SemesterHeader]:
+    """
+    Headers of every semester file in `folder` (default saves_dir()), in file name order.
+    With a backend other than JSON files, headers are built from its loaded semesters.
+    Headers whose file changed since they were written (or that are missing) are rebuilt
+    by loading that one file; unreadable files are skipped and reported by last_load_errors().
+    """
+    if folder is None:
+        try:
+            from .storage import get_backend
+        except ImportError:
+            from storage import get_backend
+        backend = get_backend()
+        if backend.name != "json":
+            return headers_from_semesters(backend.load_all())
+    folder = saves_dir() if folder is None else Path(folder)
+    key = scale_key()
+    out: List[SemesterHeader] = []
+    errors: List[Tuple[Path, str]] = []
+    with _lock:
+        entries = _entries(folder)
+        changed = False
+        found = scan_semester_files(folder)
+        for p, fingerprint in found.items():
+            try:
+                header = entries.get(p.name)
+                if header is None or header.fingerprint != fingerprint or header.scale != key:
+                    header = SemesterHeader.from_semester(load_semester_file(p, fingerprint=fingerprint),
+                                                          fingerprint)
+                    entries[p.name] = header
+                    changed = True
+                out.append(header)
+            except Exception as e:
+                errors.append((p, summarize_error(e)))
+        names = {p.name for p in found}
+        for name in [n for n in entries if n not in names]:
+            del entries[name]
+            changed = True
+        if changed:
+            _write(folder)
+    set_load_errors(errors + journal_problems(p for p in found if p not in dict(errors)))
+    return out
+
+
+def headers_from_semesters(semesters: List[object]) -> List[SemesterHeader]:
+    """Headers for already loaded semesters (backends without a manifest, e.g. SQLite)."""
+    return [SemesterHeader.from_semester(s) for s in semesters]
+
+
+def calculate_gpax_headers(headers: List[SemesterHeader]) -> float:
+    """calculate_gpax() over the semesters behind `headers`, from their stored per-subject weights."""
+    total_grade_points = 0.0
+    total_credits = 0.0
+    for header in headers:
+        for grade_points, credit in header.weights:
+            total_grade_points += grade_points
+            total_credits += credit
+    if total_credits == 0:
+        return 0.0
+    return total_grade_points / total_credits
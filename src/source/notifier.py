@@ -0,0 +1,283 @@
+# Background deadline notifier
+#
+# `student-planner notify` keeps a heap of the moments a reminder is due (by default 7 days,
+# 1 day and 1 hour before each unfinished assignment's deadline) and sleeps until the
+# earliest one instead of rescanning the semesters on a timer. Save-file changes are
+# picked up through watcher.SaveWatcher (inotify on Linux, else a scandir every
+# WATCH_INTERVAL seconds); the changed files are reloaded and the heap is rebuilt.
+# Reminders already sent are not sent again.
+# Notifications go to one or more sinks: stdout, a log file or a local command.
+
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import re
+import shlex
+import signal
+import sys
+import time
+from datetime import datetime as dt, timedelta
+from pathlib import Path
+from typing import List, Optional, Sequence, Set, Tuple
+
+try:
+    from .utils import check_path, format_timedelta
+    from .watcher import SaveWatcher
+except Exception:
+    from utils import check_path, format_timedelta
+    from watcher import SaveWatcher
+
+DEFAULT_THRESHOLDS = (timedelta(days=7), timedelta(days=1), timedelta(hours=1))
+WATCH_INTERVAL = 2.0   # seconds between scans of the save folder when inotify is not available
+MAX_SLEEP = 60.0       # re-read the wall clock at least this often (suspend, clock changes)
+HOOK_TIMEOUT = 30.0
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([wdhm])\s*$", re.IGNORECASE)
+_UNITS = {"w": "weeks", "d": "days", "h": "hours", "m": "minutes"}
+
+
+def parse_threshold(text: str) -> timedelta:
+    """"7d", "1d", "12h", "30m" or "2w" as a timedelta; raises ValueError otherwise."""
+    match = _DURATION.match(text)
+    if not match:
+        raise ValueError(f"invalid reminder time {text!r}, expected e.g. 7d, 1h or 30m")
+    return timedelta(**{_UNITS[match.group(2).lower()]: float(match.group(1))})
+
+
+def format_threshold(threshold: timedelta) -> str:
+    seconds = int(threshold.total_seconds())
+    for unit, size in (("w", 604800), ("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds % size == 0:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+
+class Notification:
+    """One reminder: `assignment` is due at `deadline`, reminded `threshold` before it."""
+
+    __slots__ = ("semester", "subject", "assignment", "deadline", "threshold")
+
+    def __init__(self, semester, subject, assignment, deadline: dt, threshold: timedelta):
+        self.semester = semester
+        self.subject = subject
+        self.assignment = assignment
+        self.deadline = deadline
+        self.threshold = threshold
+
+    @property
+    def semester_label(self) -> str:
+        s = self.semester
+        return " ".join(x for x in (s.year, s.season) if x) or (s.file_path or "?")
+
+    def message(self, now: Optional[dt] = None) -> str:
+        _, (days, hours, minutes) = format_timedelta(self.deadline - (now or dt.now()))
+        return (f"Due in {days}d {hours}h {minutes}m: {self.subject.name} / {self.assignment.name} "
+                f"({self.semester_label}) at {self.assignment.deadline}")
+
+    def to_dict(self) -> dict:
+        return {"semester": self.semester_label, "subject": self.subject.name,
+                "course_code": self.subject.course_code, "assignment": self.assignment.name,
+                "deadline": self.deadline.isoformat(timespec="seconds"),
+                "threshold": format_threshold(self.threshold)}
+
+
+# ---------------- sinks ---------------- #
+
+class StdoutSink:
+    async def emit(self, note: Notification) -> None:
+        print(f"[{dt.now():%Y-%m-%d %H:%M}] {note.message()}", flush=True)
+
+
+class LogFileSink:
+    """Appends one line per reminder to `path`."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    async def emit(self, note: Notification) -> None:
+        line = f"{dt.now().isoformat(timespec='seconds')}\t{note.message()}\n"
+        await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: str) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line)
+
+
+class CommandSink:
+    """
+    Runs a local command per reminder (no shell). The reminder is passed as JSON on stdin
+    and as STUDENT_PLANNER_NOTE_* environment variables, e.g. for notify-send wrappers.
+    """
+
+    def __init__(self, command: str, timeout: float = HOOK_TIMEOUT):
+        self.argv = shlex.split(command)
+        self.timeout = timeout
+
+    async def emit(self, note: Notification) -> None:
+        data = note.to_dict()
+        env = dict(os.environ, STUDENT_PLANNER_NOTE_MESSAGE=note.message(),
+                   **{f"STUDENT_PLANNER_NOTE_{k.upper()}": str(v or "") for k, v in data.items()})
+        try:
+            proc = await asyncio.create_subprocess_exec(*self.argv, stdin=asyncio.subprocess.PIPE, env=env)
+            await asyncio.wait_for(proc.communicate(json.dumps(data).encode()), self.timeout)
+        except asyncio.TimeoutError:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass  # exited just as the timeout hit
+            await proc.wait()  # reap it, or it stays a zombie until the daemon exits
+            print(f"notify hook {self.argv[0]} timed out", file=sys.stderr)
+        except OSError as e:
+            print(f"notify hook {self.argv[0]} failed: {e}", file=sys.stderr)
+
+
+# ---------------- daemon ---------------- #
+
+class DeadlineNotifier:
+    """
+    Sends each reminder once, at its time. If the notifier starts (or a deadline is moved)
+    after some reminders' times have passed, only the latest of them is sent, right away.
+    """
+
+    def __init__(self, sinks: Sequence[object], thresholds: Sequence[timedelta] = DEFAULT_THRESHOLDS,
+                 folder: Optional[Path] = None, watch_interval: float = WATCH_INTERVAL):
+        self.sinks = list(sinks)
+        self.thresholds = sorted(set(thresholds), reverse=True)
+        self.folder = Path(folder) if folder else None
+        self.watch_interval = watch_interval
+        self._heap: List[Tuple[float, int, Tuple, Notification]] = []   # (fire epoch, seq, key, note)
+        self._sent: Set[Tuple] = set()     # keys of reminders already sent (or skipped as superseded)
+        self._seq = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+
+    @staticmethod
+    def _key(semester, subject, assignment, threshold: timedelta) -> Tuple:
+        # stable across reloads; a moved deadline gives new keys and so new reminders
+        return (semester.file_path, subject.course_code or subject.name, assignment.name,
+                assignment.deadline, threshold.total_seconds())
+
+    def schedule(self, semesters: List[object], now: Optional[float] = None) -> None:
+        """Rebuild the heap from `semesters` (called at start and after every change)."""
+        now = time.time() if now is None else now
+        heap = []
+        keep: Set[Tuple] = set()
+        for semester in semesters:
+            for subject in semester.subjects:
+                for a in subject.assignments:
+                    deadline = a.deadline_ts
+                    if a.isDone or deadline is None or deadline <= now:
+                        continue
+                    due_now = None
+                    for threshold in self.thresholds:  # longest first
+                        key = self._key(semester, subject, a, threshold)
+                        keep.add(key)
+                        if key in self._sent:
+                            continue
+                        fire = deadline - threshold.total_seconds()
+                        if fire <= now:
+                            if due_now is not None:
+                                self._sent.add(due_now[2])  # superseded by a closer reminder
+                            due_now = (now, threshold, key)
+                            continue
+                        note = Notification(semester, subject, a, a.deadline_dt, threshold)
+                        heap.append((fire, next(self._seq), key, note))
+                    if due_now is not None:
+                        note = Notification(semester, subject, a, a.deadline_dt, due_now[1])
+                        heap.append((due_now[0], next(self._seq), due_now[2], note))
+        heapq.heapify(heap)
+        self._heap = heap
+        self._sent &= keep  # forget reminders of deadlines that passed or were removed
+
+    def next_fire(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def due(self, now: Optional[float] = None) -> List[Notification]:
+        """Pop every reminder whose time has come."""
+        now = time.time() if now is None else now
+        out = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key, note = heapq.heappop(self._heap)
+            self._sent.add(key)
+            if not note.assignment.isDone:
+                out.append(note)
+        return out
+
+    async def emit(self, note: Notification) -> None:
+        for sink in self.sinks:
+            try:
+                await sink.emit(note)
+            except Exception as e:  # one broken sink must not stop the others
+                print(f"notify: {type(sink).__name__} failed: {e}", file=sys.stderr)
+
+    # ---- change detection ---- #
+
+    async def _watch(self) -> None:
+        """Set the change event whenever a save file changes (inotify where available, else scans)."""
+        watcher = SaveWatcher(self.folder)
+        try:
+            fd = watcher.fileno()
+            if fd is not None:
+                loop = asyncio.get_running_loop()
+                loop.add_reader(fd, lambda: watcher.poll() and self._changed.set())
+                try:
+                    await asyncio.Event().wait()  # until cancelled
+                finally:
+                    loop.remove_reader(fd)
+            watcher.poll()  # baseline
+            while True:
+                await asyncio.sleep(self.watch_interval)
+                if await asyncio.to_thread(watcher.poll):
+                    self._changed.set()
+        finally:
+            watcher.close()
+
+    def load(self) -> List[object]:
+        return check_path(self.folder)
+
+    async def run(self) -> None:
+        """Send reminders until cancelled."""
+        self._changed = asyncio.Event()
+        watcher = asyncio.create_task(self._watch())
+        watcher.add_done_callback(lambda _: self._changed.set())  # wake up to report a failed watch
+        try:
+            self.schedule(await asyncio.to_thread(self.load))
+            while True:
+                if watcher.done():
+                    watcher.result()  # raises what stopped the watch instead of missing every later change
+                for note in self.due():
+                    await self.emit(note)
+                fire = self.next_fire()
+                timeout = MAX_SLEEP if fire is None else min(MAX_SLEEP, max(0.0, fire - time.time()))
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    continue
+                self._changed.clear()
+                try:
+                    self.schedule(await asyncio.to_thread(self.load))
+                except Exception as e:  # e.g. a file caught mid-write; the next change retries
+                    print(f"notify: could not reload saves: {e}", file=sys.stderr)
+        finally:
+            watcher.cancel()
+
+
+def run_notifier(sinks: Sequence[object], thresholds: Sequence[timedelta] = DEFAULT_THRESHOLDS,
+                 folder: Optional[Path] = None) -> None:
+    """Run the notifier in the foreground until Ctrl+C (or SIGTERM)."""
+    async def main():
+        task = asyncio.current_task()
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+        except (NotImplementedError, AttributeError):  # Windows
+            pass
+        try:
+            await DeadlineNotifier(sinks, thresholds, folder).run()
+        except asyncio.CancelledError:
+            pass
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,119 @@
+# Deferred, coalesced saving of semesters
+
+import threading
+from typing import Dict, List, Optional
+
+try:
+    from .storage import get_backend
+    from .journal import COMPACT_EVERY
+except Exception:
+    from storage import get_backend
+    from journal import COMPACT_EVERY
+
+DEBOUNCE_SECONDS = 2.0
+
+
+class _Pending:
+    __slots__ = ("semester", "ops", "full")
+
+    def __init__(self, semester):
+        self.semester = semester
+        self.ops: List[dict] = []
+        self.full = False  # whole snapshot must be rewritten (no journal record, or compaction due)
+
+
+class SaveManager:
+    """
+    Tracks dirty semesters and writes them in batches instead of once per edit.
+
+    mark() records an edit; pending journal records are appended by a debounce timer
+    DEBOUNCE_SECONDS after the last edit, and everything (full saves, compaction) is
+    written by flush(), which the app calls when leaving a menu and on exit.
+    Snapshots are only ever rewritten from flush(), through Semester.to_json()'s
+    temp-file + atomic rename, never from the timer thread, so an edit that is being
+    applied while the timer fires can not end up in both the snapshot and the journal.
+    """
+
+    def __init__(self, delay: float = DEBOUNCE_SECONDS):
+        self.delay = delay
+        self._lock = threading.RLock()
+        self._pending: Dict[int, _Pending] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    def mark(self, semester, *ops: dict) -> None:
+        """Record that `semester` changed; `ops` are its journal records (none means a full save)."""
+        with self._lock:
+            entry = self._pending.get(id(semester))
+            if entry is None:
+                entry = self._pending[id(semester)] = _Pending(semester)
+            if ops and not entry.full:
+                for op in ops:
+                    last = entry.ops[-1] if entry.ops else None
+                    if last and op["op"] == last["op"] == "set" and op["at"] == last["at"]:
+                        # repeated edits of the same object collapse into one record
+                        last["fields"] = last["fields"] | op["fields"]
+                    else:
+                        entry.ops.append(dict(op))
+            else:
+                entry.full = True
+                entry.ops.clear()  # the full snapshot already contains them
+            self._schedule()
+
+    def is_dirty(self, semester=None) -> bool:
+        with self._lock:
+            if semester is None:
+                return bool(self._pending)
+            return id(semester) in self._pending
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.delay is None:
+            return
+        self._timer = threading.Timer(self.delay, self._flush_journals)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_journals(self) -> None:
+        """
+        Debounce callback: append pending journal records, leave snapshot rewrites to flush().
+        Backends without journals (SQLite) keep every edit pending until flush() saves it.
+        """
+        backend = get_backend()
+        if not hasattr(backend, "append"):
+            return
+        with self._lock:
+            for entry in self._pending.values():
+                if entry.full or not entry.ops:
+                    continue
+                count = backend.append(entry.semester, *entry.ops)
+                if count is None or count >= COMPACT_EVERY:
+                    entry.full = True
+                entry.ops.clear()
+            for key in [k for k, e in self._pending.items() if not e.full and not e.ops]:
+                del self._pending[key]
+
+    def flush(self, semester=None) -> None:
+        """Write pending changes now, for one semester or all of them."""
+        with self._lock:
+            if self._timer is not None and (semester is None or len(self._pending) <= 1):
+                self._timer.cancel()
+                self._timer = None
+            if semester is None:
+                entries = list(self._pending.values())
+                self._pending.clear()
+            else:
+                entry = self._pending.pop(id(semester), None)
+                entries = [entry] if entry else []
+            for entry in entries:
+                if entry.full:
+                    entry.semester.save()
+                elif entry.ops:
+                    entry.semester.save(*entry.ops)
+
+    def close(self) -> None:
+        """Flush everything; call on exit."""
+        self.flush()
+
+
+save_manager = SaveManager()
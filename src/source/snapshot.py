@@ -0,0 +1,260 @@
+# Compact binary snapshot of the whole planner, next to the JSON saves
+#
+# With STUDENT_PLANNER_SNAPSHOT=1 every full save (Semester.to_json, which also compacts
+# the journal) also updates Saves/.snapshot: one record per semester file, holding that
+# semester (journal already applied) as marshal-encoded tuples with a string table, so
+# repeated subject names, course codes, deadlines and statuses are stored once. Journal
+# appends leave the snapshot alone. At startup a file whose snapshot record was taken from
+# exactly the bytes now on disk (same fingerprint as utils.scan_semester_files gives) is
+# rebuilt from the record, skipping JSON parsing, validation and journal replay; anything
+# newer (e.g. a file with journal records since) is read from JSON as usual and its record
+# refreshed. The JSON files stay the canonical format: the
+# snapshot is only a cache, thrown away whenever the models or the Python version change.
+# `student-planner snapshot verify` checks that every record decodes to what its JSON file holds.
+
+import marshal
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from . import utils
+except Exception:
+    import utils
+
+SNAPSHOT_FILE = ".snapshot"  # not *.json, so the loader's glob never picks it up
+MAGIC = b"SPSNAP\x00\x01"
+FORMAT = 1
+
+# field order of the encoded rows; missing (None) values are left out of the decoded dicts,
+# like model_dump(exclude_none=True) leaves them out of the JSON files
+SEMESTER_FIELDS = ("year", "season", "gpa", "file_path", "journal_seq", "version")
+SUBJECT_FIELDS = ("name", "credit", "course_code", "version")
+ASSIGNMENT_FIELDS = ("name", "max_score", "deadline", "current_score", "isDone", "status", "version")
+STRING_FIELDS = frozenset({"year", "season", "file_path", "version", "name", "course_code", "deadline", "status"})
+
+_lock = threading.Lock()
+_SNAPSHOTS: Dict[Path, "Snapshot"] = {}
+
+
+# ---------------- encoding ---------------- #
+
+def _encoder(fields: Tuple[str, ...], strings: Dict[str, int]):
+    def row(data: dict) -> tuple:
+        out = []
+        for field in fields:
+            value = data.get(field)
+            if field in STRING_FIELDS and value is not None:
+                value = strings.setdefault(value, len(strings))
+            out.append(value)
+        return tuple(out)
+    return row
+
+
+def _decoder(fields: Tuple[str, ...], table: List[str]):
+    def row(values: tuple) -> dict:
+        out = {}
+        for field, value in zip(fields, values):
+            if value is not None:
+                out[field] = table[value] if field in STRING_FIELDS else value
+        return out
+    return row
+
+
+def encode_semester(data: dict) -> bytes:
+    """One semester's to_dict() as marshal bytes: (string table, semester row, ((subject row, assignment rows), ...))."""
+    strings: Dict[str, int] = {}
+    semester_row = _encoder(SEMESTER_FIELDS, strings)
+    subject_row = _encoder(SUBJECT_FIELDS, strings)
+    assignment_row = _encoder(ASSIGNMENT_FIELDS, strings)
+    subjects = tuple((subject_row(s), tuple(assignment_row(a) for a in s.get("assignments", ())))
+                     for s in data.get("subjects", ()))
+    top = semester_row(data)
+    return marshal.dumps((tuple(strings), top, subjects))
+
+
+def decode_semester(blob: bytes) -> dict:
+    """Inverse of encode_semester: the semester as the dict its JSON file holds."""
+    table, top, subjects = marshal.loads(blob)
+    semester_row = _decoder(SEMESTER_FIELDS, table)
+    subject_row = _decoder(SUBJECT_FIELDS, table)
+    assignment_row = _decoder(ASSIGNMENT_FIELDS, table)
+    data = semester_row(top)
+    data["subjects"] = [dict(subject_row(s), assignments=[assignment_row(a) for a in rows])
+                        for s, rows in subjects]
+    return data
+
+
+# ---------------- the snapshot file ---------------- #
+
+class Snapshot:
+    """The records of one saves folder: file name -> (fingerprint, encoded semester)."""
+
+    def __init__(self, folder: Path, read: bool = True):
+        self.folder = folder
+        self.path = folder / SNAPSHOT_FILE
+        self.records: Dict[str, Tuple[tuple, bytes]] = {}
+        self.dirty = not read
+        if read:
+            self._read()
+
+    @staticmethod
+    def _stamp() -> tuple:
+        try:
+            from .classes import version
+        except ImportError:
+            from classes import version
+        # records are only reused by the same models and the same marshal format
+        return (FORMAT, version, marshal.version, sys.version_info[:2])
+
+    def _read(self) -> None:
+        try:
+            raw = self.path.read_bytes()
+        except OSError:
+            return
+        if not raw.startswith(MAGIC):
+            return
+        try:
+            stamp, records = marshal.loads(raw[len(MAGIC):])
+        except (EOFError, ValueError, TypeError):
+            return  # torn or foreign file; rebuilt by the next saves
+        if stamp == self._stamp() and isinstance(records, dict):
+            self.records = records
+
+    def lookup(self, name: str, fingerprint: tuple) -> Optional[bytes]:
+        record = self.records.get(name)
+        return record[1] if record is not None and record[0] == fingerprint else None
+
+    def put(self, name: str, fingerprint: tuple, blob: bytes) -> None:
+        self.records[name] = (fingerprint, blob)
+        self.dirty = True
+
+    def drop(self, name: str) -> None:
+        if self.records.pop(name, None) is not None:
+            self.dirty = True
+
+    def write(self) -> None:
+        if not self.dirty:
+            return
+        self.dirty = False
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(MAGIC)
+                f.write(marshal.dumps((self._stamp(), self.records)))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # only a cache
+
+
+def _snapshot(folder: Path) -> Snapshot:
+    snap = _SNAPSHOTS.get(folder)
+    if snap is None:
+        snap = _SNAPSHOTS[folder] = Snapshot(folder)
+    return snap
+
+
+def lookup(path: Path, fingerprint: tuple) -> Optional[dict]:
+    """The semester dict recorded for `path`, if it was taken from the file with this fingerprint."""
+    with _lock:
+        blob = _snapshot(path.parent).lookup(path.name, fingerprint)
+    if blob is None:
+        return None
+    try:
+        return decode_semester(blob)
+    except (EOFError, ValueError, TypeError, IndexError):
+        return None
+
+
+def record(path: Path, semester, fingerprint: tuple, defer: bool = False) -> None:
+    """
+    Store `semester` as the record of `path` whose file (and journal) has `fingerprint`.
+    With `defer`, the snapshot file is only written by the next flush().
+    """
+    blob = encode_semester(semester.to_dict())
+    with _lock:
+        snap = _snapshot(path.parent)
+        snap.put(path.name, fingerprint, blob)
+        if not defer:
+            snap.write()
+
+
+def forget(path: Path) -> None:
+    with _lock:
+        snap = _snapshot(path.parent)
+        snap.drop(path.name)
+        snap.write()
+
+
+def flush(folder: Path) -> None:
+    """Write the records deferred by record(..., defer=True), dropping those of files no longer in `folder`."""
+    with _lock:
+        snap = _snapshot(folder)
+        if snap.dirty:
+            for name in [n for n in snap.records if not (folder / n).exists()]:
+                snap.drop(name)
+        snap.write()
+
+
+# ---------------- maintenance ---------------- #
+
+def build(folder: Optional[Path] = None) -> int:
+    """Rewrite the snapshot of `folder` (default saves_dir()) from its JSON files; returns the record count."""
+    folder = utils.saves_dir() if folder is None else Path(folder)
+    found = utils.scan_semester_files(folder)
+    with _lock:
+        snap = _SNAPSHOTS[folder] = Snapshot(folder, read=False)
+    for path, fingerprint in found.items():
+        try:
+            semester = utils.load_semester_file(path, cache=False, fingerprint=fingerprint)
+        except Exception:
+            continue  # left to the JSON loader to report
+        record(path, semester, fingerprint, defer=True)
+    flush(folder)
+    return len(snap.records)
+
+
+def verify(folder: Optional[Path] = None) -> List[str]:
+    """
+    Check every semester file of `folder` (default saves_dir()) against the snapshot: its
+    record must be current and decode to exactly what the JSON file (with its journal)
+    loads as, and encoding that must give the same record back. Returns the problems found.
+    """
+    try:
+        from .classes import Semester
+    except ImportError:
+        from classes import Semester
+
+    folder = utils.saves_dir() if folder is None else Path(folder)
+    found = utils.scan_semester_files(folder)
+    snap = Snapshot(folder)  # what is on disk, not what this process holds
+    problems = []
+    for path, fingerprint in found.items():
+        record_ = snap.records.get(path.name)
+        if record_ is None:
+            problems.append(f"{path.name}: no snapshot record")
+            continue
+        if record_[0] != fingerprint:
+            problems.append(f"{path.name}: snapshot record is stale")
+            continue
+        try:
+            expected = utils.load_semester_file(path, cache=False, fingerprint=fingerprint).to_dict()
+        except Exception as e:
+            problems.append(f"{path.name}: {utils.summarize_error(e)}")
+            continue
+        try:
+            decoded = decode_semester(record_[1])
+            rebuilt = Semester.from_trusted_dict(decoded).to_dict()
+        except Exception as e:
+            problems.append(f"{path.name}: snapshot record does not decode ({type(e).__name__}: {e})")
+            continue
+        if rebuilt != expected:
+            fields = sorted(k for k in expected.keys() | rebuilt.keys() if expected.get(k) != rebuilt.get(k))
+            problems.append(f"{path.name}: snapshot differs from the JSON file ({', '.join(fields)})")
+        elif decode_semester(encode_semester(expected)) != expected:
+            problems.append(f"{path.name}: JSON data does not round-trip through the snapshot encoding")
+    for name in sorted(set(snap.records) - {p.name for p in found}):
+        problems.append(f"{name}: snapshot record without a JSON file")
+    return problems
@@ -0,0 +1,363 @@
+# Storage backends for semesters
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .utils import saves_dir, load_json_semesters, load_semester_file, forget_semester, remember_semester
+    from .journal import append_ops, discard_journal, COMPACT_EVERY
+except Exception:
+    from utils import saves_dir, load_json_semesters, load_semester_file, forget_semester, remember_semester
+    from journal import append_ops, discard_journal, COMPACT_EVERY
+
+BACKEND_ENV = "STUDENT_PLANNER_BACKEND"
+DB_NAME = "planner.db"  # not *.json, so the JSON loader never picks it up
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS semesters (
+    id INTEGER PRIMARY KEY,
+    file_path TEXT NOT NULL UNIQUE,
+    year TEXT,
+    season TEXT,
+    gpa REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS subjects (
+    id INTEGER PRIMARY KEY,
+    semester_id INTEGER NOT NULL REFERENCES semesters(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    credit REAL NOT NULL,
+    course_code TEXT
+);
+CREATE TABLE IF NOT EXISTS assignments (
+    id INTEGER PRIMARY KEY,
+    semester_id INTEGER NOT NULL REFERENCES semesters(id) ON DELETE CASCADE,
+    subject_id INTEGER NOT NULL REFERENCES subjects(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    max_score REAL NOT NULL,
+    current_score REAL NOT NULL DEFAULT 0,
+    deadline TEXT,
+    deadline_ts REAL,
+    isDone INTEGER NOT NULL DEFAULT 0,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_subjects_semester ON subjects(semester_id, position);
+CREATE INDEX IF NOT EXISTS idx_assignments_semester ON assignments(semester_id);
+CREATE INDEX IF NOT EXISTS idx_assignments_subject ON assignments(subject_id, position);
+CREATE INDEX IF NOT EXISTS idx_assignments_deadline ON assignments(deadline_ts);
+CREATE INDEX IF NOT EXISTS idx_assignments_status ON assignments(isDone, status);
+"""
+
+
+class JsonBackend:
+    """
+    One JSON file per semester in saves_dir() (the original layout).
+    Edits that come with journal records are appended to the semester's journal and
+    compacted into the snapshot every COMPACT_EVERY records.
+    """
+
+    name = "json"
+
+    def load_all(self) -> List[object]:
+        return load_json_semesters()
+
+    def load_one(self, file_path: str) -> Optional[object]:
+        """Load just the semester saved as `file_path` (e.g. "2025_Fall.json"), or None if there is none."""
+        path = saves_dir() / file_path
+        if not path.exists():
+            return None
+        return load_semester_file(path)
+
+    @staticmethod
+    def _journal_target(semester) -> Optional[Path]:
+        """Snapshot path that journal records for `semester` can go to, or None if it needs a full save."""
+        if not semester.file_path:
+            return None
+        if semester.year and semester.season and semester.file_path != f"{semester.year}_{semester.season}.json":
+            return None  # renamed since the last snapshot
+        path = saves_dir() / semester.file_path
+        return path if path.exists() else None
+
+    def save(self, semester, *ops: dict) -> None:
+        path = self._journal_target(semester) if ops else None
+        if path is None:
+            semester.to_json()
+            return
+        if append_ops(path, semester, list(ops)) >= COMPACT_EVERY:
+            semester.to_json()
+        else:
+            remember_semester(path, semester, full=False)
+
+    def append(self, semester, *ops: dict) -> Optional[int]:
+        """
+        Append journal records without ever rewriting the snapshot (safe to call from a
+        background flush). Returns the journal length, or None if a full save is needed.
+        """
+        path = self._journal_target(semester)
+        if path is None:
+            return None
+        count = append_ops(path, semester, list(ops))
+        remember_semester(path, semester, full=False)
+        return count
+
+    def delete(self, semester) -> None:
+        target = saves_dir() / semester.file_path if semester.file_path else None
+        if target and target.exists():
+            target.unlink()
+        if target:
+            discard_journal(target)
+            forget_semester(target)
+
+
+class SqliteBackend:
+    """
+    Semesters, subjects and assignments in a single SQLite database.
+
+    Rows are tracked against the objects they were loaded from or saved as, so save()
+    only writes rows whose values changed: one score edit updates one assignment row
+    (plus the semester's gpa).
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else saves_dir() / DB_NAME
+        import sqlite3  # only the SQLite backend needs it
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        # id(obj) -> (obj, rowid, last written values)
+        self._rows: Dict[int, Tuple[object, int, tuple]] = {}
+        # semester rowid -> {(table, rowid)} of its subject/assignment rows
+        self._children: Dict[int, set] = {}
+        # semester rowid -> loaded Semester; reused until another connection writes the db
+        self._semesters: Dict[int, object] = {}
+        self._data_version: Optional[int] = None
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ---- row tracking ---- #
+
+    def _known(self, obj) -> Optional[Tuple[int, tuple]]:
+        entry = self._rows.get(id(obj))
+        if entry and entry[0] is obj:
+            return entry[1], entry[2]
+        return None
+
+    def _track(self, obj, rowid: int, values: tuple) -> None:
+        self._rows[id(obj)] = (obj, rowid, values)
+
+    def _upsert(self, table: str, columns: Tuple[str, ...], obj, values: tuple) -> int:
+        known = self._known(obj)
+        if known is None:
+            cur = self.conn.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values,
+            )
+            rowid = cur.lastrowid
+        else:
+            rowid, old = known
+            if old != values:
+                self.conn.execute(
+                    f"UPDATE {table} SET {', '.join(c + ' = ?' for c in columns)} WHERE id = ?",
+                    values + (rowid,),
+                )
+        self._track(obj, rowid, values)
+        return rowid
+
+    def _file_path_for(self, semester) -> str:
+        # same naming as Semester.to_json(), so both backends agree on semester keys
+        if semester.year and semester.season:
+            return f"{semester.year}_{semester.season}.json"
+        if semester.file_path:
+            return semester.file_path
+        i = 1
+        while self.conn.execute("SELECT 1 FROM semesters WHERE file_path = ?", (f"Semester_{i}.json",)).fetchone():
+            i += 1
+        return f"Semester_{i}.json"
+
+    # ---- backend API ---- #
+
+    def _db_data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def load_all(self) -> List[object]:
+        version = self._db_data_version()
+        if self._data_version == version:
+            return [self._semesters[k] for k in sorted(self._semesters)]
+
+        try:
+            from .classes import Semester, Subject, Assignment
+        except ImportError:
+            from classes import Semester, Subject, Assignment
+
+        assignments: Dict[int, List[Tuple[int, tuple]]] = {}
+        for row in self.conn.execute(
+            "SELECT id, subject_id, name, max_score, current_score, deadline, isDone, status "
+            "FROM assignments ORDER BY subject_id, position"
+        ):
+            assignments.setdefault(row[1], []).append((row[0], row[2:]))
+
+        subjects: Dict[int, List[Tuple[int, tuple]]] = {}
+        for row in self.conn.execute(
+            "SELECT id, semester_id, name, credit, course_code FROM subjects ORDER BY semester_id, position"
+        ):
+            subjects.setdefault(row[1], []).append((row[0], row[2:]))
+
+        out = []
+        self._rows.clear()
+        self._children.clear()
+        self._semesters.clear()
+        for sem_id, file_path, year, season, gpa in self.conn.execute(
+            "SELECT id, file_path, year, season, gpa FROM semesters ORDER BY id"
+        ):
+            children = set()
+            subject_objs = []
+            for pos, (sub_id, (name, credit, course_code)) in enumerate(subjects.get(sem_id, [])):
+                assignment_objs = []
+                for apos, (a_id, (a_name, max_score, current_score, deadline, is_done, status)) in enumerate(assignments.get(sub_id, [])):
+                    a = Assignment(name=a_name, max_score=max_score, current_score=current_score,
+                                   deadline=deadline, isDone=bool(is_done), status=status)
+                    self._track(a, a_id, self._assignment_values(a, sem_id, sub_id, apos))
+                    children.add(("assignments", a_id))
+                    assignment_objs.append(a)
+                subject = Subject(name=name, credit=credit, course_code=course_code, assignments=assignment_objs)
+                self._track(subject, sub_id, (sem_id, pos, name, credit, course_code))
+                children.add(("subjects", sub_id))
+                subject_objs.append(subject)
+            semester = Semester(year=year, season=season, subjects=subject_objs, gpa=gpa, file_path=file_path)
+            self._track(semester, sem_id, (file_path, year, season, gpa))
+            self._children[sem_id] = children
+            self._semesters[sem_id] = semester
+            out.append(semester)
+        self._data_version = version
+        return out
+
+    def load_one(self, file_path: str) -> Optional[object]:
+        """The semester stored under `file_path`, or None (one database, so this reuses load_all's cache)."""
+        for semester in self.load_all():
+            if semester.file_path == file_path:
+                return semester
+        return None
+
+    @staticmethod
+    def _assignment_values(a, semester_id: int, subject_id: int, position: int) -> tuple:
+        return (semester_id, subject_id, position, a.name, a.max_score, a.current_score,
+                a.deadline, a.deadline_ts, int(a.isDone), a.status)
+
+    def save(self, semester, *ops: dict) -> None:
+        # every row is diffed against what was last written, so journal records are not needed
+        semester.update_gpa()
+        semester.file_path = self._file_path_for(semester)
+        with self.conn:
+            if self._known(semester) is None:
+                # saving a new object under an existing name overwrites it, like the JSON backend
+                row = self.conn.execute("SELECT id FROM semesters WHERE file_path = ?", (semester.file_path,)).fetchone()
+                if row:
+                    self.conn.execute("DELETE FROM semesters WHERE id = ?", (row[0],))
+                    self._children.pop(row[0], None)
+                    self._semesters.pop(row[0], None)
+            sem_id = self._upsert("semesters", ("file_path", "year", "season", "gpa"), semester,
+                                  (semester.file_path, semester.year, semester.season, semester.gpa))
+            children = set()
+            for pos, subject in enumerate(semester.subjects):
+                sub_id = self._upsert("subjects", ("semester_id", "position", "name", "credit", "course_code"), subject,
+                                      (sem_id, pos, subject.name, subject.credit, subject.course_code))
+                children.add(("subjects", sub_id))
+                for apos, a in enumerate(subject.assignments):
+                    a.update_deadline_status()
+                    a_id = self._upsert(
+                        "assignments",
+                        ("semester_id", "subject_id", "position", "name", "max_score", "current_score",
+                         "deadline", "deadline_ts", "isDone", "status"),
+                        a, self._assignment_values(a, sem_id, sub_id, apos),
+                    )
+                    children.add(("assignments", a_id))
+            for table, rowid in self._children.get(sem_id, set()) - children:
+                self.conn.execute(f"DELETE FROM {table} WHERE id = ?", (rowid,))
+            self._children[sem_id] = children
+            self._semesters[sem_id] = semester
+
+    def delete(self, semester) -> None:
+        known = self._known(semester)
+        with self.conn:
+            if known is None and semester.file_path:
+                row = self.conn.execute("SELECT id FROM semesters WHERE file_path = ?", (semester.file_path,)).fetchone()
+                known = (row[0], ()) if row else None
+            if known is not None:
+                self.conn.execute("DELETE FROM semesters WHERE id = ?", (known[0],))
+                self._children.pop(known[0], None)
+                self._semesters.pop(known[0], None)
+        self._rows.pop(id(semester), None)
+        for subject in semester.subjects:
+            self._rows.pop(id(subject), None)
+            for a in subject.assignments:
+                self._rows.pop(id(a), None)
+
+
+def load_directory(directory: Path) -> List[object]:
+    """
+    Load the semesters of a save folder other than saves_dir() without caching them:
+    its *.json files, or its planner.db when it has no JSON saves.
+    """
+    if not any(directory.glob("*.json")) and (directory / DB_NAME).exists():
+        backend = SqliteBackend(directory / DB_NAME)
+        try:
+            return backend.load_all()
+        finally:
+            backend.close()
+    return load_json_semesters(directory, cache=False)
+
+
+BACKENDS = {"json": JsonBackend, "sqlite": SqliteBackend}
+_backend = None
+
+
+def get_backend():
+    """
+    Return the active storage backend.
+    Chosen by the STUDENT_PLANNER_BACKEND environment variable ("json" or "sqlite"), default "json".
+    """
+    global _backend
+    if _backend is None:
+        set_backend(os.environ.get(BACKEND_ENV, "json"))
+    return _backend
+
+
+def set_backend(name: str):
+    """Select the storage backend by name and return it."""
+    global _backend
+    key = name.lower().strip()
+    if key not in BACKENDS:
+        raise ValueError(f"Unknown storage backend {name!r}, expected one of {sorted(BACKENDS)}")
+    if _backend is not None and hasattr(_backend, "close"):
+        _backend.close()
+    _backend = BACKENDS[key]()
+    return _backend
+
+
+def migrate_json_to_sqlite(db_path: Optional[Path] = None) -> int:
+    """
+    One-shot copy of every saves_dir()/*.json semester into the SQLite database.
+    Semesters already present in the database (same file name) are left untouched.
+
+    Returns:
+        int: number of semesters migrated
+    """
+    backend = SqliteBackend(db_path)
+    try:
+        existing = {row[0] for row in backend.conn.execute("SELECT file_path FROM semesters")}
+        migrated = 0
+        for semester in load_json_semesters():
+            if semester.file_path in existing:
+                continue
+            backend.save(semester)
+            existing.add(semester.file_path)
+            migrated += 1
+        return migrated
+    finally:
+        backend.close()
@@ -0,0 +1,237 @@
+# Target-grade solver: the fewest remaining points that reach a letter grade, GPA or GPAX
+#
+# A subject's score is the sum of its done assignments (Subject.score); its unfinished
+# assignments can still add up to the sum of their max scores. Each grade band of the
+# grading scale (gradecal.get_grading_scale(), by default get_default_thresholds()) whose
+# minimum is reachable is one option, costing the points still missing to its minimum.
+# For a GPA or GPAX target, a dynamic program over the credit-weighted grade points picks
+# one band per subject so the target is met with the fewest points in total; subjects
+# with nothing left to do stay at their current grade.
+
+import math
+from bisect import bisect_right
+from fractions import Fraction
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    from .gradecal import GradingScale, get_grading_scale
+except Exception:
+    from gradecal import GradingScale, get_grading_scale
+
+MAX_UNITS = 1000  # finest grade-point resolution per credit-weighted unit the solver uses
+GPA_TOLERANCE = 1e-9  # a plan within this of the target reaches it (float sums of grade points)
+
+
+class GradeOption:
+    """One reachable grade band of a subject and the points still needed for it."""
+
+    __slots__ = ("letter", "grade_point", "min_score", "needed")
+
+    def __init__(self, letter: str, grade_point: float, min_score: float, needed: float):
+        self.letter = letter
+        self.grade_point = grade_point
+        self.min_score = min_score
+        self.needed = needed
+
+    def __repr__(self) -> str:
+        return f"GradeOption({self.letter!r}, needs {self.needed:g})"
+
+
+class SubjectTarget:
+    """The band chosen for one subject and what it takes on its unfinished assignments."""
+
+    __slots__ = ("subject", "semester", "option", "score", "remaining")
+
+    def __init__(self, subject, semester, option: GradeOption, score: float, remaining: float):
+        self.subject = subject
+        self.semester = semester
+        self.option = option
+        self.score = score            # current score (done assignments)
+        self.remaining = remaining    # points the unfinished assignments can still add
+
+    @property
+    def needed(self) -> float:
+        return self.option.needed
+
+    @property
+    def fraction(self) -> float:
+        """Share of the remaining points needed (0 when nothing more is needed)."""
+        return self.needed / self.remaining if self.remaining > 0 else 0.0
+
+    def per_assignment(self) -> List[Tuple[object, float]]:
+        """(assignment, score) for each unfinished assignment, asking the same share of each max score."""
+        share = self.fraction
+        return [(a, a.max_score * share) for a in self.subject.assignments if not a.isDone]
+
+    def to_dict(self) -> dict:
+        return {"subject": self.subject.name, "course_code": self.subject.course_code,
+                "credit": self.subject.credit, "score": self.score, "remaining": self.remaining,
+                "grade": self.option.letter, "grade_point": self.option.grade_point,
+                "min_score": self.option.min_score, "needed": self.needed}
+
+
+class TargetPlan:
+    """The cheapest grade per subject that reaches `target` (feasible False: it can not be reached)."""
+
+    def __init__(self, target: float, feasible: bool, subjects: List[SubjectTarget], gpa: float):
+        self.target = target
+        self.feasible = feasible
+        self.subjects = subjects
+        self.gpa = gpa  # what the chosen grades give (the best reachable GPA when not feasible)
+
+    @property
+    def needed(self) -> float:
+        return sum(s.needed for s in self.subjects)
+
+    def to_dict(self) -> dict:
+        return {"target": self.target, "feasible": self.feasible, "gpa": self.gpa, "needed": self.needed,
+                "subjects": [s.to_dict() for s in self.subjects]}
+
+
+def remaining_points(subject) -> float:
+    """What the subject's unfinished assignments can still add to its score."""
+    return sum(a.max_score for a in subject.assignments if not a.isDone)
+
+
+def grade_options(subject, scale: Optional[GradingScale] = None) -> List[GradeOption]:
+    """
+    The grade bands `subject` can still end in, lowest first: its current band (needing
+    nothing) and every higher band whose minimum the unfinished assignments can reach.
+    """
+    scale = scale or get_grading_scale()
+    score = subject.score
+    best = score + remaining_points(subject)
+    point, letter = scale.lookup(score)
+    i = bisect_right(scale.mins, score) - 1
+    options = [GradeOption(letter, point, scale.mins[i] if i >= 0 else 0.0, 0.0)]
+    for min_score, point, letter in zip(scale.mins[i + 1:], scale.points[i + 1:], scale.letters[i + 1:]):
+        if min_score <= best and point > options[-1].grade_point:
+            options.append(GradeOption(letter, point, min_score, min_score - score))
+    return options
+
+
+def subject_target(subject, letter: str, semester=None, scale: Optional[GradingScale] = None) -> Optional[SubjectTarget]:
+    """What `subject` needs for at least grade `letter`; None when that can not be reached any more."""
+    scale = scale or get_grading_scale()
+    if letter not in scale.letters:
+        raise ValueError(f"No grade {letter!r} in grading scale {scale.name!r}")
+    wanted = scale.points[scale.letters.index(letter)]
+    for option in grade_options(subject, scale):
+        if option.grade_point >= wanted:
+            return SubjectTarget(subject, semester, option, subject.score, remaining_points(subject))
+    return None
+
+
+def _resolution(values: Sequence[float]) -> int:
+    """Smallest factor turning every value into an integer (at most MAX_UNITS; then values are rounded)."""
+    scale = 1
+    for v in values:
+        scale = math.lcm(scale, Fraction(v).limit_denominator(MAX_UNITS).denominator)
+        if scale > MAX_UNITS:
+            return MAX_UNITS
+    return scale
+
+
+def check_target(target: float, scale: Optional[GradingScale] = None) -> float:
+    """Return `target` if it is a GPA the scale can give (0 up to its top grade point), else raise ValueError."""
+    scale = scale or get_grading_scale()
+    top = max(scale.points)
+    if not math.isfinite(target) or not 0 <= target <= top:
+        raise ValueError(f"Target must be a number from 0 to {top:g}, got {target:g}")
+    return target
+
+
+def solve(subjects: Sequence[Tuple[object, object]], target: float,
+          scale: Optional[GradingScale] = None) -> TargetPlan:
+    """
+    Choose a grade band for each (semester, subject) pair so that the credit-weighted
+    grade point average reaches `target` with the fewest points still to earn.
+
+    Minimum-cost covering knapsack over grade points x credits in integer units: the
+    table holds, for every total below the goal (totals at or above it share one entry),
+    the cheapest way to get there, so it costs subjects x bands x goal steps. The chosen
+    grades' own average decides whether the target is reached.
+    """
+    scale = scale or get_grading_scale()
+    check_target(target, scale)
+    entries = []
+    for semester, subject in subjects:
+        credit = subject.credit or 0.0
+        entries.append((semester, subject, credit, grade_options(subject, scale), remaining_points(subject)))
+    total_credit = sum(e[2] for e in entries)
+    if total_credit == 0:
+        return TargetPlan(target, target <= 0, [SubjectTarget(s, sem, o[0], s.score, r)
+                                                for sem, s, _, o, r in entries], 0.0)
+
+    unit = _resolution([o.grade_point * e[2] for e in entries for o in e[3]])
+    choices = [e for e in entries if len(e[3]) > 1]
+
+    def make_plan(chosen: List[int]) -> Tuple[List[SubjectTarget], float]:
+        pick = {id(e[1]): i for e, i in zip(choices, chosen)}
+        plan = [SubjectTarget(s, sem, options[pick.get(id(s), 0)], s.score, r)
+                for sem, s, credit, options, r in entries]
+        return plan, sum(t.option.grade_point * (t.subject.credit or 0.0) for t in plan) / total_credit
+
+    # nearest units give the cheapest plan; when the resolution is capped they can overstate
+    # a GPA, so a plan short of the target is solved again with units rounded down
+    roundings = [round, math.floor] if unit == MAX_UNITS else [round]
+    for rounding in roundings:
+        chosen = _cheapest(entries, choices, target * total_credit, unit, rounding)
+        if chosen is not None:
+            plan, gpa = make_plan(chosen)
+            if gpa >= target - GPA_TOLERANCE:
+                return TargetPlan(target, True, plan, gpa)
+    plan, gpa = make_plan([len(e[3]) - 1 for e in choices])  # the best each subject can still do
+    return TargetPlan(target, gpa >= target - GPA_TOLERANCE, plan, gpa)
+
+
+def _cheapest(entries, choices, goal_points: float, unit: int, rounding) -> Optional[List[int]]:
+    """
+    Option index per choice subject reaching `goal_points` (grade points x credits) at the
+    least cost, with every option counted as rounding(grade point * credit * unit) units;
+    None when no combination gets there.
+    """
+    def units(option: GradeOption, credit: float) -> int:
+        return rounding(option.grade_point * credit * unit)
+
+    # the current grades are free: start from them and only pay for the increases
+    base = sum(units(e[3][0], e[2]) for e in entries)
+    goal = max(0, math.ceil(goal_points * unit - 1e-9) - base)
+
+    inf = float("inf")
+    cost = [inf] * (goal + 1)  # cost[g]: fewest points that add g units (g == goal: at least goal)
+    cost[0] = 0.0
+    picks: List[List[Tuple[int, int]]] = []  # per choice subject: g -> (previous g, option index)
+    for _, _, credit, options, _ in choices:
+        gains = [(units(o, credit) - units(options[0], credit), o.needed) for o in options]
+        new = cost[:]
+        back = [(g, 0) for g in range(goal + 1)]
+        for g, c in enumerate(cost):
+            if c == inf:
+                continue
+            for i in range(1, len(gains)):
+                gain, needed = gains[i]
+                h = min(goal, g + gain)
+                if c + needed < new[h]:
+                    new[h] = c + needed
+                    back[h] = (g, i)
+        cost = new
+        picks.append(back)
+
+    if cost[goal] == inf:
+        return None
+    chosen = [0] * len(choices)
+    g = goal
+    for k in range(len(choices) - 1, -1, -1):
+        g, chosen[k] = picks[k][g]
+    return chosen
+
+
+def solve_gpa(semester, target: float, scale: Optional[GradingScale] = None) -> TargetPlan:
+    """The cheapest grades in `semester` that give it a GPA of at least `target`."""
+    return solve([(semester, s) for s in semester.subjects], target, scale)
+
+
+def solve_gpax(semesters: Sequence[object], target: float, scale: Optional[GradingScale] = None) -> TargetPlan:
+    """The cheapest grades over all `semesters` that give a GPAX of at least `target`."""
+    return solve([(semester, s) for semester in semesters for s in semester.subjects], target, scale)
@@ -0,0 +1,204 @@
+# Terminal front-ends for the menus: plain line mode and an optional curses full screen
+#
+# The menus only ever clear the screen, print, read a line and pause, so both front-ends
+# implement just those. In full-screen mode everything printed between two clear() calls
+# is one frame; when the frame is shown, only the rows that differ from what is already on
+# screen are rewritten, and clearing never runs a subprocess.
+
+import locale
+import os
+import sys
+import time
+from typing import List, Optional
+
+try:
+    import curses
+except ImportError:  # e.g. Windows without windows-curses
+    curses = None
+
+try:
+    from .instrument import waiting
+except ImportError:
+    from instrument import waiting
+
+TUI_ENV = "STUDENT_PLANNER_TUI"
+ANSI_CLEAR = "\033[H\033[2J\033[3J"
+
+
+def _enable_vt_mode() -> bool:
+    """
+    Let the Windows console interpret ANSI escapes (ENABLE_VIRTUAL_TERMINAL_PROCESSING).
+
+    Returns:
+        bool: False when the console does not support it (Windows before 10, or not a console)
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return False
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = wintypes.DWORD()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
+    vt = 0x0004  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    return bool(mode.value & vt or kernel32.SetConsoleMode(handle, mode.value | vt))
+
+
+class LineTerminal:
+    """The classic interface: print to stdout, read with input()."""
+
+    def __init__(self):
+        self._ansi = os.name != "nt" or _enable_vt_mode()
+
+    def clear(self) -> None:
+        if self._ansi:
+            sys.stdout.write(ANSI_CLEAR)
+            sys.stdout.flush()
+        else:
+            os.system("cls")  # legacy console without escape sequences
+
+    def read_line(self, prompt: str = "") -> str:
+        return input(prompt)
+
+    def pause(self, seconds: float) -> None:
+        sys.stdout.flush()
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        pass
+
+
+class _FrameWriter:
+    """Stand-in for sys.stdout while the curses screen is active; collects the current frame."""
+
+    def __init__(self, term: "CursesTerminal"):
+        self.term = term
+
+    def write(self, text: str) -> int:
+        self.term._buffer.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+class CursesTerminal:
+    """
+    Full-screen front-end. print() output is buffered into a frame and drawn when the
+    menu asks for input or pauses; rows identical to the ones already on screen are left alone.
+    """
+
+    def __init__(self):
+        locale.setlocale(locale.LC_ALL, "")
+        self._stdout = sys.stdout
+        self._screen = curses.initscr()
+        curses.cbreak()
+        self._screen.keypad(True)
+        self._buffer: List[str] = []
+        self._shown: List[Optional[str]] = []
+        self._cursor = (0, 0)
+        sys.stdout = _FrameWriter(self)
+
+    def _frame_rows(self) -> List[str]:
+        height, width = self._screen.getmaxyx()
+        width = max(1, width - 1)  # writing the bottom-right cell makes curses raise
+        rows = []
+        for line in "".join(self._buffer).expandtabs().split("\n"):
+            line = line.replace(ANSI_CLEAR, "")
+            while len(line) > width:
+                rows.append(line[:width])
+                line = line[width:]
+            rows.append(line)
+        return rows[-height:]  # like a terminal, keep the bottom of the frame visible
+
+    def _draw(self) -> None:
+        rows = self._frame_rows()
+        cursor = (len(rows) - 1, len(rows[-1]))
+        height = self._screen.getmaxyx()[0]
+        rows += [""] * (height - len(rows))
+        shown = self._shown + [""] * (height - len(self._shown))
+        for y, (old, new) in enumerate(zip(shown, rows)):
+            if old != new:
+                self._screen.move(y, 0)
+                self._screen.clrtoeol()
+                self._screen.addstr(y, 0, new)
+        self._shown = rows
+        self._cursor = cursor
+        self._screen.move(*cursor)
+        self._screen.refresh()
+
+    def clear(self) -> None:
+        self._buffer = []
+
+    def read_line(self, prompt: str = "") -> str:
+        self._buffer.append(prompt)
+        self._draw()
+        curses.echo()
+        try:
+            raw = self._screen.getstr()
+        finally:
+            curses.noecho()
+        line = raw.decode(errors="replace")
+        self._buffer.append(line + "\n")
+        self._shown[self._cursor[0]] = None  # the prompt row now also holds the echoed input
+        return line
+
+    def pause(self, seconds: float) -> None:
+        self._draw()
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        sys.stdout = self._stdout
+        self._screen.keypad(False)
+        curses.nocbreak()
+        curses.echo()
+        curses.endwin()
+
+
+_active = LineTerminal()
+
+
+def tui_requested(argv: Optional[List[str]] = None) -> bool:
+    """True when --tui is in `argv` or STUDENT_PLANNER_TUI is set to a non-zero value."""
+    return "--tui" in (argv or []) or os.environ.get(TUI_ENV, "") not in ("", "0")
+
+
+def start_tui() -> bool:
+    """
+    Switch to the full-screen front-end.
+
+    Returns:
+        bool: False (staying in line mode) when curses is missing or stdin/stdout is not a terminal
+    """
+    global _active
+    if curses is None or not (sys.stdin.isatty() and sys.stdout.isatty()):
+        return False
+    if not isinstance(_active, CursesTerminal):
+        _active = CursesTerminal()
+    return True
+
+
+def stop_tui() -> None:
+    """Restore the terminal and go back to line mode."""
+    global _active
+    _active.close()
+    _active = LineTerminal()
+
+
+def clear() -> None:
+    _active.clear()
+
+
+@waiting
+def read_line(prompt: str = "") -> str:
+    return _active.read_line(prompt)
+
+
+@waiting
+def pause(seconds: float) -> None:
+    _active.pause(seconds)
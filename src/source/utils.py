@@ -1,48 +1,351 @@
+import gc
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from platformdirs import user_data_dir
 from datetime import datetime as dt, timedelta
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from . import terminal as _terminal
+    from .instrument import timed
+    from .jsonio import loads
+except ImportError:
+    import terminal as _terminal
+    from instrument import timed
+    from jsonio import loads
+
+JOURNAL_SUFFIX = ".journal"
+TRUST_ENV = "STUDENT_PLANNER_TRUSTED_CACHE"
+TRUSTED_CACHE = os.environ.get(TRUST_ENV, "") not in ("", "0")
+TRUST_FILE = ".validated"  # not *.json, so the loader's glob never picks it up
+TRUST_FORMAT = 2  # files listed under an older format may hold lax-typed data
+SNAPSHOT_ENV = "STUDENT_PLANNER_SNAPSHOT"
+SNAPSHOTS = os.environ.get(SNAPSHOT_ENV, "") not in ("", "0")  # see snapshot.py
+LOAD_WORKERS = 8  # threads used to read semester files concurrently
+
+# Process-wide semester cache: path -> (fingerprint, Semester).
+# Lets check_path() re-read only the files that changed since the last call.
+_SEMESTER_CACHE: Dict[Path, Tuple[tuple, object]] = {}
+# saves_dir(), resolved (and created) on first use.
+_SAVES_DIR: Optional[Path] = None
+# Files skipped by the last load_json_semesters() call, as (path, reason).
+_LOAD_ERRORS: List[Tuple[Path, str]] = []
+# Per save folder, the snapshots known to validate (see load_semester_file's trusted mode).
+_TRUSTED: Dict[Path, dict] = {}
 
 def clear() -> None:
-    """Clear the terminal in a cross-platform way."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal (or start a new frame in full-screen mode) without spawning a shell."""
+    _terminal.clear()
 
 def saves_dir() -> Path:
     """
     Return Path to Saves directory, creating it if necessary.
     Uses the OS user-data dir so the path is writable and stable across runs,
     and works both when running from source and when packaged with PyInstaller.
+    Resolved once per process; platformdirs is only imported then.
+    """
+    global _SAVES_DIR
+    if _SAVES_DIR is None:
+        from platformdirs import user_data_dir
+
+        appname = "Student_Planner"
+        appauthor = "Teerathap"   # optional: shows vendor folder on Windows
+        save_dir = Path(user_data_dir(appname, appauthor)) / "Saves"
+        save_dir.mkdir(parents=True, exist_ok=True)
+        _SAVES_DIR = save_dir
+    return _SAVES_DIR
+
+def journal_path(path: Path) -> Path:
+    """Return the append-only edit journal that belongs to a semester snapshot file."""
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write text to path via a temp file and os.replace, so a crash mid-write
+    leaves either the old file or the new one, never a truncated file.
     """
-    appname = "Student_Planner"
-    appauthor = "Teerathap"   # optional: shows vendor folder on Windows
-    base = Path(user_data_dir(appname, appauthor))
-    save_dir = base / "Saves"
-    save_dir.mkdir(parents=True, exist_ok=True)
-    return save_dir
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
-def check_path() -> List[object]:
+def _fingerprint(path: Path) -> tuple:
     """
-    Load all semester JSON files from Saves directory and return list of Semester objects.
+    Return (st_mtime_ns, st_size) of a snapshot file plus those of its journal (or None),
+    the key used by the semester cache.
     """
+    st = path.stat()
     try:
-        from classes import Semester
+        jst = journal_path(path).stat()
+        journal = (jst.st_mtime_ns, jst.st_size)
+    except OSError:
+        journal = None
+    return st.st_mtime_ns, st.st_size, journal
+
+def scan_semester_files(folder: Path) -> Dict[Path, tuple]:
+    """
+    path -> _fingerprint() of every *.json snapshot in `folder`, in file name order, from
+    one os.scandir pass (the stat data of a snapshot's journal comes from the same scan).
+    """
+    stats: Dict[str, os.stat_result] = {}
+    with os.scandir(folder) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith(".json") or name.endswith(".json" + JOURNAL_SUFFIX):
+                try:
+                    if entry.is_file():
+                        stats[name] = entry.stat()
+                except OSError:
+                    continue  # removed while scanning
+    out: Dict[Path, tuple] = {}
+    for name in sorted(n for n in stats if n.endswith(".json")):
+        st = stats[name]
+        jst = stats.get(name + JOURNAL_SUFFIX)
+        out[folder / name] = (st.st_mtime_ns, st.st_size, (jst.st_mtime_ns, jst.st_size) if jst else None)
+    return out
+
+def _snapshot_module():
+    try:
+        from . import snapshot
     except ImportError:
-        from .classes import Semester
+        import snapshot
+    return snapshot
 
-    out: List[Semester] = []
-    for p in saves_dir().glob("*.json"):
+def remember_semester(path: Path, semester: object, full: bool = True) -> None:
+    """
+    Record a freshly written semester so the next check_path() reuses it instead of re-reading.
+    After a full snapshot write (`full`, also what journal compaction does) its header in the
+    saves folder's manifest and its binary snapshot record are refreshed too. Journal appends
+    pass full=False: they may run on the save timer thread while the menus edit the model,
+    and the manifest rebuilds a header whose file changed the next time semesters are listed.
+    """
+    try:
+        fingerprint = _fingerprint(path)
+        _SEMESTER_CACHE[path] = (fingerprint, semester)
+    except OSError:
+        fingerprint = None
+        _SEMESTER_CACHE.pop(path, None)
+    if not full:
+        return
+    try:
+        from .manifest import record
+    except ImportError:
+        from manifest import record
+    record(path, semester)
+    if SNAPSHOTS and fingerprint is not None:
+        _snapshot_module().record(path, semester, fingerprint)
+
+def forget_semester(path: Path) -> None:
+    """Drop a cache entry and manifest header, e.g. after its file has been deleted."""
+    try:
+        from .manifest import forget
+    except ImportError:
+        from manifest import forget
+    _SEMESTER_CACHE.pop(path, None)
+    forget(path)
+    if SNAPSHOTS:
+        _snapshot_module().forget(path)
+
+@timed
+def check_path(directory: Optional[Path] = None) -> List[object]:
+    """
+    Load all semesters from the active storage backend and return list of Semester objects.
+    The JSON backend (default) reads saves_dir()/*.json, see load_json_semesters().
+
+    With `directory`, load another save folder instead (e.g. an exported student folder):
+    its *.json files, or its planner.db when it has no JSON saves.
+    """
+    try:
+        from .storage import get_backend, load_directory
+    except ImportError:
+        from storage import get_backend, load_directory
+    if directory is not None:
+        return load_directory(Path(directory))
+    return get_backend().load_all()
+
+def load_json_semesters(directory: Optional[Path] = None, cache: bool = True) -> List[object]:
+    """
+    Load all semester JSON files from Saves directory (or `directory`) and return list of Semester objects,
+    in file name order.
+
+    Pending edits in each file's journal are replayed on top of the snapshot. Files are
+    read and decoded by up to LOAD_WORKERS threads, which mostly hides per-file latency on
+    network or synced folders. A file that can not be loaded is skipped and reported by
+    last_load_errors(), as is a loaded file whose journal had records that were not applied.
+
+    Files are cached by (path, st_mtime_ns, st_size) of the snapshot and its journal:
+    unchanged files return the same Semester object as the previous call, changed files
+    are re-read and entries for deleted files are dropped. Pass cache=False for one-off
+    loads (e.g. batch reports) that should not keep the semesters alive.
+    """
+    folder = saves_dir() if directory is None else Path(directory)
+    found = scan_semester_files(folder)
+    paths = list(found)
+    if cache and TRUSTED_CACHE:
+        _trusted_files(folder)  # read the sidecar once, before the worker threads need it
+
+    def load(p: Path):
         try:
-            with p.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            loaded = Semester.from_dict(data)
-            out.append(loaded)
-        except Exception:
-            # don't crash on a bad file; skip it
-            continue
+            return load_semester_file(p, cache, _defer_trust=True, fingerprint=found[p]), None
+        except Exception as e:
+            return None, summarize_error(e)
+
+    with gc_paused():
+        if len(paths) > 1 and LOAD_WORKERS > 1:
+            from concurrent.futures import ThreadPoolExecutor  # pulls in logging; only needed here
+
+            with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(paths))) as pool:
+                results = list(pool.map(load, paths))
+        else:
+            results = [load(p) for p in paths]
+
+    out: List[object] = []
+    errors: List[Tuple[Path, str]] = []
+    for p, (semester, error) in zip(paths, results):
+        if error is None:
+            out.append(semester)
+        else:
+            # don't crash on a bad file; skip it and report it
+            _SEMESTER_CACHE.pop(p, None)
+            errors.append((p, error))
+    set_load_errors(errors + journal_problems(p for p, (_, error) in zip(paths, results) if error is None))
+    _save_trusted(folder)
+    if cache and SNAPSHOTS:
+        _snapshot_module().flush(folder)
+    if cache:
+        seen = set(paths)
+        for stale in [p for p in _SEMESTER_CACHE if p.parent == folder and p not in seen]:
+            del _SEMESTER_CACHE[stale]
     return out
 
+def last_load_errors() -> List[Tuple[Path, str]]:
+    """
+    (path, reason) of every file the last load of the saves folder had to skip, or could
+    only load without some of its journal records.
+    """
+    return list(_LOAD_ERRORS)
+
+def journal_problems(paths) -> List[Tuple[Path, str]]:
+    """(path, reason) for the loaded files whose journal replay skipped records."""
+    try:
+        from .journal import skipped_records
+    except ImportError:
+        from journal import skipped_records
+    return [(p, reason) for p in paths if (reason := skipped_records(p))]
+
+def set_load_errors(errors: List[Tuple[Path, str]]) -> None:
+    _LOAD_ERRORS[:] = errors
+
+def summarize_error(e: Exception) -> str:
+    """One-line reason a semester file could not be loaded."""
+    from pydantic import ValidationError  # already loaded by whatever raised `e`
+
+    if isinstance(e, ValidationError):
+        err = e.errors()[0]
+        where = ".".join(str(x) for x in err["loc"])
+        return f"invalid semester data: {where + ': ' if where else ''}{err['msg']}"
+    return f"{type(e).__name__}: {e}"
+
+@contextmanager
+def gc_paused():
+    """
+    Suspend the cyclic garbage collector while building many objects at once. Loading
+    allocates tens of thousands of models that all stay alive, so the collections it
+    would trigger find nothing to free.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def _trusted_files(folder: Path) -> Dict[str, list]:
+    """file name -> [st_mtime_ns, st_size] of the snapshots in `folder` that passed validation as they are."""
+    try:
+        from .classes import version
+    except ImportError:
+        from classes import version
+    entry = _TRUSTED.get(folder)
+    if entry is None:
+        try:
+            data = loads((folder / TRUST_FILE).read_bytes())
+        except (OSError, ValueError):
+            data = {}
+        # a different version of the models may validate differently, so start over
+        current = isinstance(data, dict) and data.get("version") == version and data.get("format") == TRUST_FORMAT
+        files = data.get("files", {}) if current else {}
+        entry = _TRUSTED[folder] = {"version": version, "files": files, "dirty": False}
+    return entry["files"]
+
+def _save_trusted(folder: Path) -> None:
+    entry = _TRUSTED.get(folder)
+    if not entry or not entry["dirty"]:
+        return
+    entry["dirty"] = False
+    try:
+        data = {"version": entry["version"], "format": TRUST_FORMAT, "files": entry["files"]}
+        atomic_write_text(folder / TRUST_FILE, json.dumps(data))
+    except OSError:
+        pass  # only a cache
+
+@timed
+def load_semester_file(p: Path, cache: bool = True, trusted: Optional[bool] = None, _defer_trust: bool = False,
+                       fingerprint: Optional[tuple] = None):
+    """
+    Load one semester JSON file with its journal replayed, going through the same cache
+    as load_json_semesters(). Raises on a missing or invalid file. `fingerprint` saves
+    the stat calls when the caller already scanned the folder (see scan_semester_files).
+
+    The file's bytes are validated directly by pydantic's JSON parser. In trusted mode
+    (`trusted`, default: STUDENT_PLANNER_TRUSTED_CACHE) snapshots that already passed
+    validation and have not changed since are rebuilt without validating them again.
+    With STUDENT_PLANNER_SNAPSHOT on, an unchanged file is rebuilt from its record in the
+    binary snapshot instead (see snapshot.py), and a changed one refreshes that record.
+    """
+    try:  # package import first: a failed top-level import is retried (and searched for) on every call
+        from .classes import Semester
+        from .journal import replay_journal
+    except ImportError:
+        from classes import Semester
+        from journal import replay_journal
+
+    if fingerprint is None:
+        fingerprint = _fingerprint(p)
+    cached = _SEMESTER_CACHE.get(p) if cache else None
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    snapshot = _snapshot_module() if cache and SNAPSHOTS else None
+    recorded = snapshot.lookup(p, fingerprint) if snapshot else None
+    if recorded is not None:  # the journal is already applied in the record
+        loaded = Semester.from_trusted_dict(recorded)
+        _SEMESTER_CACHE[p] = (fingerprint, loaded)
+        return loaded
+    data = p.read_bytes()
+    known = _trusted_files(p.parent) if cache and (TRUSTED_CACHE if trusted is None else trusted) else None
+    if known is not None and known.get(p.name) == list(fingerprint[:2]):
+        loaded = Semester.from_trusted_dict(loads(data))
+    else:
+        loaded = Semester.from_json_bytes(data)
+        # only trusted when rebuilding it unvalidated gives the same semester (no lax coercions)
+        if known is not None and Semester.has_model_types(loads(data)):
+            known[p.name] = list(fingerprint[:2])
+            _TRUSTED[p.parent]["dirty"] = True
+            if not _defer_trust:
+                _save_trusted(p.parent)
+    if not loaded.file_path:
+        loaded.file_path = p.name
+    replay_journal(p, loaded)
+    if cache:
+        _SEMESTER_CACHE[p] = (fingerprint, loaded)
+    if snapshot:
+        snapshot.record(p, loaded, fingerprint, defer=_defer_trust)
+    return loaded
+
 def compare_time(assignment_datetime: dt) -> timedelta:
     """
     Return timedelta between the given assignment datetime and now: (deadline - now).
@@ -64,6 +367,7 @@ def format_timedelta(td: timedelta) -> tuple[str, List[int]]:
     s = f"{days} day/days | {hours} hour/hours | {minutes} minute/minutes"
     return s, [int(days), int(hours), int(minutes)]
 
+@timed
 def deadline_report(semesters: List[object]) -> None:
     """
     Format deadline notice into a readable string
@@ -71,30 +375,25 @@ def deadline_report(semesters: List[object]) -> None:
     Returns:
         deadlineReport (str): Formatted string deadline notice
     """
-    from datetime import datetime as dt
+    try:
+        from .deadlines import deadline_index
+    except ImportError:
+        from deadlines import deadline_index
 
     if not semesters:
         print("No semesters loaded.")
         return
 
+    deadline_index.sync(semesters)
     notices = []
-    for semester in semesters:
-        for subject in semester.subjects:
-            for assignment in subject.assignments:
-                if not assignment.deadline or assignment.status == "Done":
-                    continue
-                try:
-                    deadline_dt = dt.strptime(assignment.deadline, "%m/%d/%y %H:%M:%S")
-                except Exception:
-                    continue
-                diff = compare_time(deadline_dt)
-                # near deadline = between 0 and 7 days remaining
-                if 0 < diff.total_seconds() <= 7 * 24 * 3600:
-                    _, info = format_timedelta(diff)
-                    notices.append(
-                        f"  --> Semester : {semester.season} {semester.year} | Class : {subject.name} | "
-                        f"Name : {assignment.name}\n    Remaining -> Day: {info[0]} | Hour: {info[1]} | Minute: {info[2]}\n"
-                    )
+    # near deadline = between 0 and 7 days remaining
+    for entry in deadline_index.due_within(timedelta(days=7)):
+        diff = compare_time(entry.deadline_dt)
+        _, info = format_timedelta(diff)
+        notices.append(
+            f"  --> Semester : {entry.semester.season} {entry.semester.year} | Class : {entry.subject.name} | "
+            f"Name : {entry.assignment.name}\n    Remaining -> Day: {info[0]} | Hour: {info[1]} | Minute: {info[2]}\n"
+        )
 
     if notices:
         print("\nAssignments that are near the deadline\n")
@@ -0,0 +1,116 @@
+# Vectorized GPA/GPAX calculation over many semesters or students (optional, needs numpy)
+#
+# Results match calculate_gpa/calculate_gpax exactly: subject scores come from Subject.score,
+# grade points from the active GradingScale, and credit-weighted totals are accumulated
+# left to right with np.cumsum (the same order as the scalar loops) rather than np.sum's
+# pairwise summation.
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency: pip install student-planner[fast]
+    np = None
+
+try:
+    from .gradecal import get_grading_scale
+except Exception:
+    from gradecal import get_grading_scale
+
+
+def available() -> bool:
+    """True when numpy is installed and the vectorized path can be used."""
+    return np is not None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for the vectorized GPA engine (pip install numpy)")
+
+
+def subject_columns(semesters: Sequence[object]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Flatten the subjects of `semesters` into columns.
+
+    Returns:
+        (scores, credits, owner): float64 score and credit per subject, and the index of the
+        semester in `semesters` each subject belongs to.
+    """
+    _require_numpy()
+    scores, credits, owner = [], [], []
+    for i, semester in enumerate(semesters):
+        for subject in semester.subjects:
+            scores.append(subject.score)
+            credits.append(subject.credit or 0.0)
+            owner.append(i)
+    return (np.asarray(scores, dtype=np.float64), np.asarray(credits, dtype=np.float64),
+            np.asarray(owner, dtype=np.intp))
+
+
+def grade_point_array(scores, scale=None) -> "np.ndarray":
+    """Grade point for every score, same rules as GradingScale.lookup (NaN or below the lowest cutoff -> 0.0)."""
+    _require_numpy()
+    scale = scale or get_grading_scale()
+    scores = np.asarray(scores, dtype=np.float64)
+    mins = np.asarray(scale.mins, dtype=np.float64)
+    points = np.append(np.asarray(scale.points, dtype=np.float64), 0.0)
+    idx = np.searchsorted(mins, scores, side="right") - 1  # -1 (below all cutoffs) picks the trailing 0.0
+    gp = points[idx]
+    gp[np.isnan(scores)] = 0.0
+    return gp
+
+
+def _grouped_sequential_sum(values: "np.ndarray", owner: "np.ndarray", n_groups: int) -> "np.ndarray":
+    """Sum `values` per group, adding left to right within each group like a Python loop would."""
+    out = np.zeros(n_groups, dtype=np.float64)
+    if values.size == 0:
+        return out
+    order = np.argsort(owner, kind="stable")
+    values, owner = values[order], owner[order]
+    counts = np.bincount(owner, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    col = np.arange(values.size) - starts[owner]
+    grid = np.zeros((n_groups, int(counts.max())), dtype=np.float64)
+    grid[owner, col] = values
+    # padding zeros sit after each group's values, so they never change the running total
+    totals = np.cumsum(grid, axis=1)[:, -1]
+    out[counts > 0] = totals[counts > 0]
+    return out
+
+
+def _weighted_gpa(scores, credits, owner, n_groups: int, scale=None) -> "np.ndarray":
+    gp = grade_point_array(scores, scale)
+    total_grade_points = _grouped_sequential_sum(gp * credits, owner, n_groups)
+    total_credits = _grouped_sequential_sum(credits, owner, n_groups)
+    out = np.zeros(n_groups, dtype=np.float64)
+    nonzero = total_credits != 0
+    out[nonzero] = total_grade_points[nonzero] / total_credits[nonzero]
+    return out
+
+
+def calculate_gpa_many(semesters: Sequence[object], scale=None) -> "np.ndarray":
+    """GPA of every semester in one pass; element i equals calculate_gpa(semesters[i])."""
+    scores, credits, owner = subject_columns(semesters)
+    return _weighted_gpa(scores, credits, owner, len(semesters), scale)
+
+
+def calculate_gpax_many(students: Sequence[Sequence[object]], scale=None) -> "np.ndarray":
+    """GPAX of every student (a list of semesters each); element i equals calculate_gpax(students[i])."""
+    _require_numpy()
+    flat: List[object] = []
+    student_of: List[int] = []
+    for i, semesters in enumerate(students):
+        flat.extend(semesters)
+        student_of.extend([i] * len(semesters))
+    scores, credits, owner = subject_columns(flat)
+    student_of = np.asarray(student_of, dtype=np.intp)
+    owner = student_of[owner] if owner.size else owner
+    return _weighted_gpa(scores, credits, owner, len(students), scale)
+
+
+def calculate_gpa_vectorized(semester, scale=None) -> float:
+    return float(calculate_gpa_many([semester], scale)[0])
+
+
+def calculate_gpax_vectorized(all_semesters: list, scale=None) -> float:
+    return float(calculate_gpax_many([all_semesters], scale)[0])
@@ -0,0 +1,169 @@
+# Change detection for edits made to the saves folder by other programs
+#
+# Sync tools and a second copy of the planner write semester files behind our back.
+# SaveWatcher compares one os.scandir pass of the folder (see utils.scan_semester_files)
+# with what this process has loaded, and reloads only the files that really changed;
+# files this process wrote itself already match the cache and are left alone. On Linux
+# an inotify watch tells it when the previous scan is still current, so most polls make
+# no system calls at all.
+
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from . import utils
+except Exception:
+    import utils
+
+# inotify(7) events that can mean a semester file was added, changed or removed
+_IN_EVENTS = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200  # MODIFY ATTRIB CLOSE_WRITE MOVED_* CREATE DELETE
+
+
+class SaveChanges:
+    """Semester files added, modified (snapshot or journal) or removed since the last poll."""
+
+    __slots__ = ("added", "modified", "removed")
+
+    def __init__(self, added=(), modified=(), removed=()):
+        self.added: List[Path] = list(added)
+        self.modified: List[Path] = list(modified)
+        self.removed: List[Path] = list(removed)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    def __repr__(self) -> str:
+        return f"SaveChanges(added={self.added}, modified={self.modified}, removed={self.removed})"
+
+
+class _Inotify:
+    """Minimal non-blocking inotify watch on one directory (Linux only, via libc)."""
+
+    def __init__(self, folder: Path):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(str(folder)), _IN_EVENTS) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"cannot watch {folder}")
+        self.fd = fd
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def drain(self) -> bool:
+        """Consume queued events; True if there were any (including a queue overflow)."""
+        seen = False
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return seen
+            if not data:
+                return seen
+            seen = True
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class SaveWatcher:
+    """
+    Finds semester files in `folder` (default saves_dir()) that changed since they were
+    loaded, and reloads just those. refresh() is cheap enough to call before every redraw:
+    with inotify it only scans the folder after something happened in it.
+    """
+
+    def __init__(self, folder: Optional[Path] = None, use_inotify: bool = True):
+        self._folder = Path(folder) if folder is not None else None
+        self._use_inotify = use_inotify
+        self._inotify: Optional[_Inotify] = None
+        self._known: Optional[Dict[Path, tuple]] = None  # the previous scan
+        self._started = False
+
+    @property
+    def folder(self) -> Path:
+        return self._folder if self._folder is not None else utils.saves_dir()
+
+    def _start(self) -> None:
+        self._started = True
+        if self._use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify(self.folder)
+            except (OSError, AttributeError):  # no inotify (or libc without it): scan every time
+                self._inotify = None
+
+    def fileno(self) -> Optional[int]:
+        """inotify descriptor that becomes readable on changes (None when scanning is the only way)."""
+        if not self._started:
+            self._start()
+        return self._inotify.fileno() if self._inotify is not None else None
+
+    def poll(self) -> SaveChanges:
+        """
+        What changed on disk compared with the loaded semesters (or, for files never
+        loaded, with the previous poll). The first poll only takes a baseline of those.
+        """
+        if not self._started:
+            self._start()
+        folder = self.folder
+        if self._inotify is not None and self._known is not None and not self._inotify.drain():
+            current = self._known  # nothing happened in the folder since the last scan
+        else:
+            current = utils.scan_semester_files(folder)
+        known, self._known = self._known, current
+        cache = dict(utils._SEMESTER_CACHE)  # one copy: the notifier polls while another thread loads
+        changes = SaveChanges()
+        for path, fingerprint in current.items():
+            cached = cache.get(path)
+            if cached is not None:
+                if cached[0] != fingerprint:
+                    changes.modified.append(path)
+            elif known is not None and known.get(path) != fingerprint:
+                (changes.modified if path in known else changes.added).append(path)
+        for path in cache:
+            if path.parent == folder and path not in current:
+                changes.removed.append(path)
+        if known is not None:
+            changes.removed += [p for p in known if p not in current and p not in cache]
+        return changes
+
+    def refresh(self) -> Dict[Path, Optional[object]]:
+        """
+        Reload the semesters whose files changed on disk. Returns path -> the newly loaded
+        Semester (None when the file was removed or can not be read any more) for the
+        files that were loaded before; files never loaded are only noted.
+        """
+        changes = self.poll()
+        updated: Dict[Path, Optional[object]] = {}
+        for path in changes.removed:
+            if utils._SEMESTER_CACHE.pop(path, None) is not None:
+                updated[path] = None
+        for path in changes.modified:
+            if path not in utils._SEMESTER_CACHE:
+                continue
+            try:
+                updated[path] = utils.load_semester_file(path, fingerprint=self._known.get(path))
+            except Exception:
+                utils._SEMESTER_CACHE.pop(path, None)
+                updated[path] = None
+        return updated
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._started = False
+
+
+# process-wide watcher of saves_dir(), used by the menus
+save_watcher = SaveWatcher()
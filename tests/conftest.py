@@ -0,0 +1,51 @@
+# Shared fixtures: every test gets its own empty saves folder, never the user's real one.
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+# before anything imports source: settings read at import time, and a throw-away data dir
+for _name in [n for n in os.environ if n.startswith("STUDENT_PLANNER_")]:
+    del os.environ[_name]
+os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="planner-tests-")
+
+from source import journal, storage, utils  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def saves(tmp_path, monkeypatch):
+    """The saves folder of this test (what utils.saves_dir() returns)."""
+    folder = tmp_path / "Saves"
+    folder.mkdir()
+    monkeypatch.setattr(utils, "_SAVES_DIR", folder)
+    monkeypatch.setattr(storage, "_backend", None)
+    utils._SEMESTER_CACHE.clear()
+    utils.set_load_errors([])
+    journal._STATE.clear()
+    journal._SKIPPED.clear()
+    yield folder
+    utils._SEMESTER_CACHE.clear()
+
+
+@pytest.fixture
+def make_semester():
+    """Build a small Semester: make_semester([(credit, [(score, max_score, done), ...]), ...])."""
+    from source import Assignment, Semester, Subject
+
+    def make(subjects, year="2025", season="Fall"):
+        semester = Semester(year=year, season=season)
+        for i, (credit, assignments) in enumerate(subjects):
+            subject = Subject(name=f"Class {i}", credit=credit, course_code=f"C{i:03d}")
+            for j, (score, max_score, done) in enumerate(assignments):
+                subject.assignments.append(Assignment(name=f"Work {j}", max_score=max_score,
+                                                      current_score=score, isDone=done))
+            semester.subjects.append(subject)
+        return semester
+    return make
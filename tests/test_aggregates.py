@@ -0,0 +1,101 @@
+import copy
+import math
+import random
+
+import pytest
+
+from source import Assignment, Subject, aggregates
+from source.gradecal import calculate_gpa
+
+
+def _random_semester(make_semester, rng):
+    return make_semester([(rng.choice([0.5, 1.0, 1.5, 3.0, rng.uniform(0.1, 4.0)]),
+                           [(rng.uniform(0, 30), 30.0, rng.random() < 0.7) for _ in range(rng.randint(0, 6))])
+                          for _ in range(rng.randint(1, 8))])
+
+
+def test_gpa_is_exactly_calculate_gpa(make_semester):
+    rng = random.Random(10)
+    for _ in range(300):
+        semester = _random_semester(make_semester, rng)
+        assert semester._running_gpa() == calculate_gpa(semester)
+        for _ in range(5):
+            subject = rng.choice(semester.subjects)
+            if subject.assignments:
+                a = rng.choice(subject.assignments)
+                a.current_score = rng.uniform(0, 30)
+                a.isDone = rng.random() < 0.7
+            else:
+                subject.credit = rng.uniform(0.1, 4.0)
+            assert semester._running_gpa() == calculate_gpa(semester)
+
+
+@pytest.mark.parametrize("duplicate", [copy.deepcopy, lambda m: m.model_copy(deep=True), copy.copy])
+def test_copies_keep_their_totals_linked(make_semester, duplicate):
+    semester = make_semester([(3.0, [(50.0, 100.0, True)]), (2.0, [(90.0, 100.0, True)])])
+    copied = duplicate(semester)
+    original_gpa = semester._running_gpa()
+    assert copied._running_gpa() == original_gpa
+
+    subject = copied.subjects[0]
+    subject.assignments.append(Assignment(name="Extra", max_score=40.0, current_score=40.0, isDone=True))
+    assert subject.score == 90.0
+    assert copied._running_gpa() == calculate_gpa(copied) == 4.0
+    copied.subjects.append(Subject(name="New", credit=1.0))
+    assert copied._running_gpa() == calculate_gpa(copied)
+    # the copy's list is its own; a shallow copy shares the subjects, so both GPAs follow them
+    assert len(semester.subjects) == 2 and semester._running_gpa() == calculate_gpa(semester)
+
+    deep = copy.deepcopy(semester)
+    deep.subjects[1].assignments[0].current_score = 10.0
+    assert deep.subjects[1].score == 10.0
+    assert deep._running_gpa() == calculate_gpa(deep)
+    assert semester.subjects[1].score == 90.0
+
+
+def test_copied_assignment_is_not_linked_to_the_subject(make_semester):
+    semester = make_semester([(3.0, [(50.0, 100.0, True)])])
+    subject = semester.subjects[0]
+    loose = copy.copy(subject.assignments[0])
+    loose.current_score = 0.0
+    assert subject.score == 50.0
+
+
+def test_check_mode_compares_with_a_full_recompute(make_semester, monkeypatch):
+    monkeypatch.setattr(aggregates, "CHECK_AGGREGATES", True)
+    semester = make_semester([(3.0, [(70.0, 100.0, True)]), (1.5, [(55.5, 100.0, True)])])
+    semester.subjects[1].assignments[0].current_score = 81.0
+    assert semester._running_gpa() == calculate_gpa(semester)
+    semester._totals.gpa = 1.0  # a stale cache must be caught
+    with pytest.raises(aggregates.AggregateMismatch):
+        semester._running_gpa()
+
+
+def test_reordering_and_repeating_children(make_semester, monkeypatch):
+    monkeypatch.setattr(aggregates, "CHECK_AGGREGATES", True)
+    rng = random.Random(3)
+    for _ in range(200):  # find a semester whose GPA depends on the subject order in the last bit
+        semester = _random_semester(make_semester, rng)
+        backwards = list(reversed(semester.subjects))
+        if calculate_gpa(semester) != calculate_gpa(type(semester)(subjects=backwards)):
+            break
+    else:
+        pytest.fail("no order-dependent semester found")
+    assert semester._running_gpa() == calculate_gpa(semester)
+    semester.subjects.reverse()
+    assert semester._running_gpa() == calculate_gpa(semester)
+    semester.subjects.sort(key=lambda s: s.credit)
+    assert semester._running_gpa() == calculate_gpa(semester)
+
+    subject = semester.subjects[0]
+    subject.assignments.append(Assignment(name="Extra", max_score=10.0, current_score=4.0, isDone=True))
+    before = subject.score
+    subject.assignments *= 2
+    assert subject.score == math.fsum(a.current_score for a in subject.assignments if a.isDone)
+    assert subject.score >= before
+    subject.assignments.sort(key=lambda a: a.current_score)
+    subject.assignments[0].current_score += 1.0
+    assert subject.score == math.fsum(a.current_score for a in subject.assignments if a.isDone)
+    subject.assignments *= 0
+    assert subject.score == 0.0 and subject.assignments == []
+    assert semester._running_gpa() == calculate_gpa(semester)
@@ -0,0 +1,126 @@
+import json
+from datetime import datetime as dt, timedelta
+
+import pytest
+
+from source import cli, journal, utils
+from source.classes import DEADLINE_FORMAT
+from source.gradecal import calculate_gpa, calculate_gpax
+from source.utils import check_path
+
+
+@pytest.fixture
+def semester(make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, True), (0.0, 10.0, False)]), (1.0, [(9.0, 10.0, True)])])
+    semester.subjects[0].assignments[1].deadline = (dt.now() + timedelta(days=2)).strftime(DEADLINE_FORMAT)
+    semester.to_json()
+    return semester
+
+
+def reload():
+    """The saved semesters as a fresh process would read them (snapshot plus journal)."""
+    utils._SEMESTER_CACHE.clear()
+    journal._STATE.clear()
+    return check_path()
+
+
+def test_add_assignment(semester, capsys):
+    code = cli.main(["add-assignment", "2025 Fall", "c000", "Quiz", "--max-score", "5", "--score", "4", "--done"])
+    assert code == cli.EXIT_OK
+    assert "Added Quiz to Class 0" in capsys.readouterr().out
+    [saved] = reload()
+    quiz = saved.subjects[0].assignments[-1]
+    assert (quiz.name, quiz.max_score, quiz.current_score, quiz.isDone) == ("Quiz", 5.0, 4.0, True)
+
+    assert cli.main(["add-assignment", "2025_Fall", "Class 0", "quiz", "--max-score", "5"]) == cli.EXIT_ERROR
+    assert "already exists" in capsys.readouterr().err
+    assert cli.main(["add-assignment", "2025_Fall", "C000", "Late", "--max-score", "5",
+                     "--deadline", "tomorrow"]) == cli.EXIT_ERROR
+    assert "Invalid deadline" in capsys.readouterr().err
+    assert len(reload()[0].subjects[0].assignments) == 3
+
+
+def test_set_score(semester, capsys):
+    assert cli.main(["set-score", "2025_Fall.json", "C000", "work 1", "8", "--done"]) == cli.EXIT_OK
+    assert capsys.readouterr().out.strip() == "Class 0 / Work 1: 8.0/10.0 (done)"
+    [saved] = reload()
+    work = saved.subjects[0].assignments[1]
+    assert (work.current_score, work.isDone) == (8.0, True)
+    assert saved.subjects[0].score == 13.0
+
+    assert cli.main(["set-score", "2025_Fall", "C000", "Work 1", "7", "--not-done"]) == cli.EXIT_OK
+    assert reload()[0].subjects[0].assignments[1].isDone is False
+
+
+def test_list_deadlines_json(semester, capsys):
+    assert cli.main(["list-deadlines", "--json"]) == cli.EXIT_OK
+    [entry] = json.loads(capsys.readouterr().out)
+    assert entry["semester"] == "2025 Fall"
+    assert (entry["subject"], entry["course_code"], entry["assignment"]) == ("Class 0", "C000", "Work 1")
+
+    assert cli.main(["list-deadlines", "--json", "--days", "1"]) == cli.EXIT_OK
+    assert json.loads(capsys.readouterr().out) == []
+    assert cli.main(["list-deadlines", "--json", "--overdue", "--semester", "2025 Fall"]) == cli.EXIT_OK
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_gpax_json(semester, make_semester, capsys):
+    make_semester([(2.0, [(7.0, 10.0, True)])], year="2026", season="Spring").to_json()
+    assert cli.main(["gpax", "--json"]) == cli.EXIT_OK
+    report = json.loads(capsys.readouterr().out)
+    semesters = reload()
+    assert report["gpax"] == calculate_gpax(semesters)
+    assert sorted((s["semester"], s["gpa"], s["credits"]) for s in report["semesters"]) == sorted(
+        (cli.semester_label(s), calculate_gpa(s), sum(x.credit for x in s.subjects)) for s in semesters)
+
+    assert cli.main(["gpax"]) == cli.EXIT_OK
+    assert capsys.readouterr().out.strip() == f"{report['gpax']:.2f}"
+
+
+def test_import(semester, tmp_path, capsys):
+    feed = tmp_path / "feed.csv"
+    feed.write_text("course,name,points,score,done\n"
+                    "C001,Lab,20,15,yes\n"
+                    "C999,Lost,10,,\n"
+                    "C000,Work 0,10,6,\n", encoding="utf-8")
+
+    assert cli.main(["import", str(feed), "--json"]) == cli.EXIT_ERROR  # one row rejected, the rest saved
+    result = json.loads(capsys.readouterr().out)
+    assert (result["added"], result["updated"], result["semesters"]) == (1, 1, ["2025_Fall.json"])
+    assert [r["line"] for r in result["rejected"]] == [3]
+    [saved] = reload()
+    assert saved.subjects[1].assignments[-1].name == "Lab" and saved.subjects[1].score == 24.0
+    assert saved.subjects[0].assignments[0].current_score == 6.0
+
+    feed.write_text("course,name,points\nC000,Extra,10\n", encoding="utf-8")
+    assert cli.main(["import", str(feed), "--dry-run"]) == cli.EXIT_OK
+    assert "1 added, 0 updated, 0 rejected; would save 2025 Fall" in capsys.readouterr().out
+    assert [a.name for a in reload()[0].subjects[0].assignments] == ["Work 0", "Work 1"]
+
+    assert cli.main(["import", str(tmp_path / "missing.csv")]) == cli.EXIT_ERROR
+    assert "No such file" in capsys.readouterr().err
+
+
+def test_exit_codes(semester, capsys):
+    assert cli.main([]) == cli.EXIT_USAGE
+    assert "No command given." in capsys.readouterr().err
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["set-score", "2025_Fall", "C000", "Work 0", "lots"])
+    assert exc.value.code == cli.EXIT_USAGE
+    assert "invalid float value: 'lots'" in capsys.readouterr().err
+
+    assert cli.main(["set-score", "1999 Summer", "C000", "Work 0", "1"]) == cli.EXIT_ERROR
+    assert capsys.readouterr().err.strip() == "No semester '1999 Summer'"
+    assert cli.main(["set-score", "2025_Fall", "XYZ", "Work 0", "1"]) == cli.EXIT_ERROR
+    assert capsys.readouterr().err.strip() == "No class 'xyz' in semester 2025 Fall"
+    assert cli.main(["set-score", "2025_Fall", "C000", "Nope", "1"]) == cli.EXIT_ERROR
+    assert capsys.readouterr().err.strip() == "No assignment 'nope' in class Class 0"
+
+
+def test_command_error_is_reported_not_raised(monkeypatch, capsys):
+    def fail(args):
+        raise cli.CommandError("something went wrong")
+    monkeypatch.setattr(cli, "cmd_gpax", fail)
+    assert cli.main(["gpax"]) == cli.EXIT_ERROR
+    captured = capsys.readouterr()
+    assert (captured.out, captured.err) == ("", "something went wrong\n")
@@ -0,0 +1,65 @@
+import json
+import random
+from datetime import datetime as dt, timedelta
+
+from source import utils
+from source.classes import DEADLINE_FORMAT
+from source.columnar import ColumnarStore
+from source.gradecal import calculate_gpa, calculate_gpax
+from source.journal import set_op
+from source.storage import JsonBackend
+
+
+def _write_semesters(folder, rng, count=6):
+    now = dt.now().replace(microsecond=0)
+    for i in range(count):
+        subjects = []
+        for j in range(rng.randint(0, 5)):
+            assignments = []
+            for k in range(rng.randint(0, 6)):
+                when = now + timedelta(hours=rng.randint(-500, 500))
+                assignments.append({"name": f"Work {k}", "max_score": rng.choice([10, 25.0, 100]),
+                                    "current_score": rng.uniform(0, 25), "isDone": rng.random() < 0.6,
+                                    "deadline": rng.choice([when.strftime(DEADLINE_FORMAT), None, "not a date"])})
+            subjects.append({"name": f"Class {j}", "credit": rng.choice([1, 1.5, 3.0, rng.uniform(0.5, 4)]),
+                             "course_code": rng.choice([f"C{j:03d}", None]), "assignments": assignments})
+        name = f"{2020 + i}_Fall.json"
+        (folder / name).write_text(json.dumps({"year": str(2020 + i), "season": "Fall", "file_path": name,
+                                               "subjects": subjects}))
+
+
+def _assert_same(store, semesters):
+    assert len(store.semesters) == len(semesters)
+    assert calculate_gpax(store.semesters) == calculate_gpax(semesters)
+    for view, model in zip(store.semesters, semesters):
+        assert (view.year, view.season, view.file_path) == (model.year, model.season, model.file_path)
+        assert view.gpa == calculate_gpa(view) == calculate_gpa(model)
+        for sv, sm in zip(view.subjects, model.subjects, strict=True):
+            assert (sv.name, sv.course_code, sv.credit, sv.score, sv.grade) == \
+                   (sm.name, sm.course_code, sm.credit, sm.score, sm.grade)
+            for av, am in zip(sv.assignments, sm.assignments, strict=True):
+                assert (av.name, av.current_score, av.max_score, av.isDone, av.deadline_ts) == \
+                       (am.name, am.current_score, am.max_score, am.isDone, am.deadline_ts)
+    now = dt.now().timestamp()
+    overdue = sum(1 for s in semesters for sub in s.subjects for a in sub.assignments
+                  if not a.isDone and a.deadline_ts is not None and a.deadline_ts < now)
+    assert store.count_overdue(now) == overdue
+
+
+def test_columnar_store_matches_the_models(saves):
+    _write_semesters(saves, random.Random(24))
+    # one file the fast path must hand to the models (lax types), one with a journal to replay
+    lax = json.loads((saves / "2020_Fall.json").read_text())
+    lax["subjects"].append({"name": "Lax", "credit": "2", "assignments": [
+        {"name": "Quiz", "max_score": "10", "current_score": "9.5", "isDone": "true"}]})
+    (saves / "2020_Fall.json").write_text(json.dumps(lax))
+    semester = utils.load_semester_file(saves / "2021_Fall.json")
+    a = next(a for s in semester.subjects for a in s.assignments)
+    a.current_score, a.isDone = 12.5, True
+    assert JsonBackend().append(semester, set_op(semester, a, current_score=12.5, isDone=True)) == 1
+    utils._SEMESTER_CACHE.clear()
+
+    semesters = utils.load_json_semesters()
+    _assert_same(ColumnarStore.load(saves), semesters)
+    _assert_same(ColumnarStore.from_semesters(semesters), semesters)
+    assert ColumnarStore.load(saves).errors == []
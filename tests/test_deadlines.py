@@ -0,0 +1,116 @@
+import contextlib
+import io
+from datetime import datetime as dt, timedelta
+
+import pytest
+
+from source import deadlines, utils
+from source.classes import DEADLINE_FORMAT, Assignment
+from source.deadlines import deadline_index
+
+NOW = dt(2025, 10, 1, 12, 0, 0)
+
+
+class _FrozenDatetime(dt):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+@pytest.fixture
+def frozen(monkeypatch):
+    monkeypatch.setattr(utils, "dt", _FrozenDatetime)
+    monkeypatch.setattr(deadlines, "dt", _FrozenDatetime)
+    deadline_index.sync([])
+    yield
+    deadline_index.sync([])
+
+
+def _due(hours):
+    return (NOW + timedelta(hours=hours)).strftime(DEADLINE_FORMAT)
+
+
+def _baseline_notices(semesters):
+    """The original deadline_report scan: every assignment, in file order."""
+    notices = []
+    for semester in semesters:
+        for subject in semester.subjects:
+            for a in subject.assignments:
+                if not a.deadline or a.status == "Done":
+                    continue
+                try:
+                    diff = dt.strptime(a.deadline, DEADLINE_FORMAT) - NOW
+                except ValueError:
+                    continue
+                if 0 < diff.total_seconds() <= 7 * 24 * 3600:
+                    _, info = utils.format_timedelta(diff)
+                    notices.append(f"  --> Semester : {semester.season} {semester.year} | Class : {subject.name} | "
+                                   f"Name : {a.name}\n    Remaining -> Day: {info[0]} | Hour: {info[1]} | "
+                                   f"Minute: {info[2]}\n")
+    return notices
+
+
+def _report(semesters):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        utils.deadline_report(semesters)
+    return out.getvalue()
+
+
+def _check(semesters):
+    for s in semesters:
+        for subject in s.subjects:
+            for a in subject.assignments:
+                a.update_deadline_status()
+    report = _report(semesters)
+    notices = _baseline_notices(semesters)
+    if not notices:
+        assert report == "\nNo assignments are near deadline.\n\n"
+        return
+    blocks = report.split("\n\n")[1:]  # after the heading: one block per notice, soonest first
+    assert sorted(b.strip("\n") for b in blocks if b.strip()) == sorted(n.strip("\n") for n in notices)
+
+
+def test_report_matches_the_baseline_scan_after_edits(frozen, make_semester):
+    first = make_semester([(3.0, [(0.0, 10.0, False)] * 4), (1.0, [(0.0, 10.0, False)] * 2)])
+    second = make_semester([(2.0, [(0.0, 10.0, False)] * 3)], year="2026", season="Spring")
+    hours = iter([5, -3, 200, 30, 1, 100, 48, 169, 2])
+    for s in (first, second):
+        for subject in s.subjects:
+            for a in subject.assignments:
+                a.deadline = _due(next(hours))
+    first.subjects[0].assignments[3].deadline = "not a date"
+    semesters = [first, second]
+    _check(semesters)
+    assert len(deadline_index) == 8
+
+    # done flag, moved deadline, new and removed assignments, removed subject and semester
+    subject = first.subjects[0]
+    subject.assignments[0].isDone = True
+    subject.assignments[2].deadline = _due(12)
+    deadline_index.update(subject.assignments[2], subject, first)
+    new = Assignment(name="Extra", max_score=5.0, deadline=_due(3))
+    first.subjects[1].assignments.append(new)
+    deadline_index.update(new, first.subjects[1], first)
+    _check(semesters)
+
+    gone = first.subjects[1].assignments[0]
+    deadline_index.discard(gone)
+    first.subjects[1].assignments.remove(gone)
+    deadline_index.discard_subject(second.subjects[0])
+    second.subjects.pop(0)
+    _check(semesters)
+    _check([first])
+    assert _report([]) == "No semesters loaded.\n"
+
+
+def test_queries(frozen, make_semester):
+    semester = make_semester([(3.0, [(0.0, 10.0, False)] * 4)])
+    a, b, c, d = semester.subjects[0].assignments
+    a.deadline, b.deadline, c.deadline, d.deadline = _due(-5), _due(-1), _due(2), _due(50)
+    deadline_index.sync([semester])
+    assert [e.assignment for e in deadline_index.overdue()] == [a, b]
+    assert [e.assignment for e in deadline_index.due_within(timedelta(days=1))] == [c]
+    assert [e.assignment for e in deadline_index.next_due(5)] == [c, d]
+    c.isDone = True
+    assert [e.assignment for e in deadline_index.next_due(1)] == [d]
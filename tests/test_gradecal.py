@@ -0,0 +1,24 @@
+from source.gradecal import DEFAULT_SCALE, GradingScale, get_grade_point, set_grading_scale
+
+
+def test_scale_change_refreshes_rendered_grades(make_semester):
+    semester = make_semester([(3.0, [(72.0, 100.0, True)])])
+    subject = semester.subjects[0]
+    assert "Grade : B" in subject.show()
+    strict = GradingScale({"A": 90, "B": 80, "C": 70, "F": 0},
+                          {"A": 4.0, "B": 3.0, "C": 2.0, "F": 0.0}, name="strict")
+    try:
+        set_grading_scale(strict)
+        assert "Grade : C" in subject.show()
+        assert "Grade : C" in semester.show()
+        assert semester.gpa == 2.0
+    finally:
+        set_grading_scale(DEFAULT_SCALE)
+    assert "Grade : B " in subject.show()
+
+
+def test_default_boundaries():
+    assert get_grade_point(80) == (4.0, "A")
+    assert get_grade_point(79.99) == (3.5, "B+")
+    assert get_grade_point(-1) == (0.0, "F")
+    assert get_grade_point(float("nan")) == (0.0, "F")
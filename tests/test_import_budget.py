@@ -0,0 +1,25 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS = Path(__file__).resolve().parent.parent / "benchmarks"
+if str(BENCHMARKS) not in sys.path:
+    sys.path.insert(0, str(BENCHMARKS))
+
+import import_budget  # noqa: E402
+
+# wall-clock budgets depend on the machine; opt in with PLANNER_BENCHMARKS=1
+timing = pytest.mark.skipif(not os.environ.get("PLANNER_BENCHMARKS"), reason="set PLANNER_BENCHMARKS=1 to run")
+
+
+def test_app_import_defers_heavy_modules():
+    result = import_budget.measure(1)
+    assert result["loaded"] == [], "imported at startup but should be deferred: " + ", ".join(result["loaded"])
+
+
+@timing
+def test_app_import_stays_within_budget():
+    result = import_budget.measure(import_budget.DEFAULT_RUNS)
+    assert result["median_ms"] <= import_budget.DEFAULT_BUDGET_MS, result
@@ -0,0 +1,46 @@
+from datetime import datetime as dt
+
+import pytest
+
+from source.classes import DEADLINE_FORMAT
+from source.importer import import_assignments, read_ics
+
+zoneinfo = pytest.importorskip("zoneinfo")
+
+
+def test_ics_quoted_parameters(tmp_path):
+    feed = tmp_path / "feed.ics"
+    feed.write_text("BEGIN:VCALENDAR\r\n"
+                    "BEGIN:VTODO\r\n"
+                    "SUMMARY:Essay: draft [ENG101]\r\n"
+                    'DUE;TZID="America/New_York";X-NOTE="a;b:c":20250310T170000\r\n'
+                    "END:VTODO\r\n"
+                    "END:VCALENDAR\r\n", encoding="utf-8")
+    try:
+        zone = zoneinfo.ZoneInfo("America/New_York")
+    except zoneinfo.ZoneInfoNotFoundError:
+        pytest.skip("no time zone database")
+    expected = dt(2025, 3, 10, 17, 0, tzinfo=zone).astimezone().replace(tzinfo=None)
+
+    [record] = list(read_ics(feed))
+    assert record.error is None
+    assert record.course == "ENG101"
+    assert record.fields["name"] == "Essay: draft"
+    assert record.fields["deadline"] == expected.strftime(DEADLINE_FORMAT)
+
+
+def test_dry_run_leaves_the_semesters_alone(tmp_path, make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, True)])])
+    feed = tmp_path / "feed.csv"
+    feed.write_text("course,name,points,score\nC000,Work 0,10,9\nC000,Quiz,5,\n", encoding="utf-8")
+    before = semester.model_dump()
+
+    result = import_assignments(feed, [semester], dry_run=True)
+    assert (result.added, result.updated, result.rejected) == (1, 1, [])
+    assert semester.model_dump() == before and semester.subjects[0].score == 5.0
+    [copy] = result.semesters
+    assert copy is not semester and [a.name for a in copy.subjects[0].assignments] == ["Work 0", "Quiz"]
+    assert copy.subjects[0].score == 9.0
+
+    result = import_assignments(feed, [semester])
+    assert result.semesters == [semester] and semester.subjects[0].score == 9.0
@@ -0,0 +1,50 @@
+from source import set_op
+from source.journal import append_ops, read_journal
+from source import journal, utils
+from source.utils import check_path, journal_path, last_load_errors
+
+
+def test_appends_from_two_planners_get_distinct_seqs(saves, make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, False)])])
+    semester.to_json()
+    path = saves / semester.file_path
+    assignment = semester.subjects[0].assignments[0]
+
+    journal.last_seq(path, semester)
+    before = dict(journal._STATE)  # what a second planner knows: it loaded the file before this append
+    append_ops(path, semester, [set_op(semester, assignment, current_score=6.0)])
+    journal._STATE.clear()
+    journal._STATE.update(before)
+    append_ops(path, semester, [set_op(semester, assignment, current_score=7.0)])
+
+    assert [r["seq"] for r in read_journal(path)] == [1, 2]
+    assert check_path()[0].subjects[0].assignments[0].current_score == 7.0
+
+
+def test_records_that_do_not_apply_are_reported(saves, make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, False)])])
+    semester.to_json()
+    path = saves / semester.file_path
+    append_ops(path, semester, [{"op": "set", "at": [4, 0], "fields": {"current_score": 1.0}}])
+
+    assert len(check_path()) == 1
+    [(reported, reason)] = last_load_errors()
+    assert reported == path
+    assert "could not be applied" in reason and "#1" in reason
+
+
+def test_records_left_behind_by_a_compaction_are_not_reported(saves, make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, False)])])
+    semester.to_json()
+    path = saves / semester.file_path
+    assignment = semester.subjects[0].assignments[0]
+    assignment.current_score = 8.0
+    append_ops(path, semester, [set_op(semester, assignment, current_score=8.0)])
+    leftover = journal_path(path).read_bytes()
+    semester.to_json()  # folds record 1 into the snapshot ...
+    journal_path(path).write_bytes(leftover)  # ... but "crashes" before the journal is discarded
+    utils._SEMESTER_CACHE.clear()
+
+    [loaded] = check_path()
+    assert loaded.subjects[0].assignments[0].current_score == 8.0
+    assert last_load_errors() == []
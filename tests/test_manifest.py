@@ -0,0 +1,27 @@
+from source import manifest
+from source.journal import set_op
+from source.storage import JsonBackend
+
+
+def test_journal_appends_leave_the_manifest_alone(saves, make_semester, monkeypatch):
+    semester = make_semester([(3.0, [(50.0, 100.0, True)]), (1.0, [(90.0, 100.0, True)])])
+    semester.to_json()
+    manifest_file = saves / manifest.MANIFEST_NAME
+    written = manifest_file.read_bytes()
+    writes = []
+    monkeypatch.setattr(manifest, "_write", lambda folder, real=manifest._write: writes.append(folder) or real(folder))
+
+    assignment = semester.subjects[0].assignments[0]
+    assignment.current_score = 95.0
+    assert JsonBackend().append(semester, set_op(semester, assignment, current_score=95.0)) == 1
+    assert writes == [] and manifest_file.read_bytes() == written
+
+    # the file changed since its header was written, so listing rebuilds it once
+    [header] = manifest.semester_headers(saves)
+    assert header.gpa == semester._running_gpa() == 4.0
+    assert writes == [saves]
+    manifest.semester_headers(saves)
+    assert writes == [saves]
+
+    semester.to_json()  # a full write refreshes the header directly
+    assert len(writes) == 2
@@ -0,0 +1,30 @@
+import asyncio
+import sys
+
+import pytest
+
+from source import notifier
+
+
+def test_command_sink_reaps_a_hook_that_times_out(monkeypatch):
+    procs = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def exec_and_keep(*args, **kwargs):
+        procs.append(await real_exec(*args, **kwargs))
+        return procs[-1]
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", exec_and_keep)
+    sink = notifier.CommandSink(f'"{sys.executable}" -c "import time; time.sleep(30)"', timeout=0.2)
+    note = type("Note", (), {"to_dict": lambda self: {"subject": "Class 0"}, "message": lambda self: "due soon"})()
+    asyncio.run(sink.emit(note))
+    assert procs and procs[0].returncode is not None
+
+
+def test_run_reports_a_failed_watch(saves, monkeypatch):
+    async def broken_watch(self):
+        raise OSError("watch failed")
+
+    monkeypatch.setattr(notifier.DeadlineNotifier, "_watch", broken_watch)
+    with pytest.raises(OSError, match="watch failed"):
+        asyncio.run(asyncio.wait_for(notifier.DeadlineNotifier([]).run(), 5))
@@ -0,0 +1,91 @@
+import json
+import time
+
+import pytest
+
+from source import storage
+from source.journal import read_journal, set_op
+from source.savemanager import SaveManager
+from source.storage import DB_NAME, SqliteBackend
+from source.utils import journal_path
+
+
+def _wait_until(condition, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+def _edit(semester, score):
+    assignment = semester.subjects[0].assignments[0]
+    assignment.current_score = score
+    return set_op(semester, assignment, current_score=score)
+
+
+def test_edits_of_the_same_field_coalesce(saves, make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, True)])])
+    semester.to_json()
+    manager = SaveManager(delay=None)
+    manager.mark(semester, _edit(semester, 6.0))
+    manager.mark(semester, _edit(semester, 7.0))
+    assert manager._pending[id(semester)].ops == [set_op(semester, semester.subjects[0].assignments[0],
+                                                         current_score=7.0)]
+    manager.close()
+    assert [r["fields"] for r in read_journal(saves / semester.file_path)] == [{"current_score": 7.0}]
+    assert not manager.is_dirty()
+
+
+def test_full_save_replaces_pending_records(saves, make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, True)])])
+    semester.to_json()
+    manager = SaveManager(delay=None)
+    manager.mark(semester, _edit(semester, 6.0))
+    semester.season = "Spring"
+    manager.mark(semester)
+    assert manager._pending[id(semester)].full and not manager._pending[id(semester)].ops
+    manager.close()
+    saved = json.loads((saves / "2025_Spring.json").read_text())
+    assert saved["subjects"][0]["assignments"][0]["current_score"] == 6.0
+
+
+def test_timer_appends_journal_records_but_never_rewrites_the_file(saves, make_semester):
+    semester = make_semester([(3.0, [(5.0, 10.0, True)])])
+    semester.to_json()
+    path = saves / semester.file_path
+    written = path.read_bytes()
+    manager = SaveManager(delay=0.05)
+    manager.mark(semester, _edit(semester, 9.0))
+    assert _wait_until(lambda: not manager.is_dirty())
+    assert path.read_bytes() == written
+    assert [r["fields"] for r in read_journal(path)] == [{"current_score": 9.0}]
+    manager.close()
+    assert journal_path(path).exists()  # nothing left to write, so close() did not compact
+
+
+@pytest.fixture
+def sqlite_backend(saves, monkeypatch):
+    backend = storage.set_backend("sqlite")
+    yield backend
+    backend.close()
+
+
+def test_sqlite_edits_wait_for_flush(sqlite_backend, make_semester, saves):
+    semester = make_semester([(3.0, [(5.0, 10.0, True)])])
+    semester.save()
+    manager = SaveManager(delay=0.05)
+    manager.mark(semester, _edit(semester, 9.0))
+    time.sleep(0.2)  # the timer has fired: SQLite has no journal, so it leaves the edit pending
+    assert manager.is_dirty(semester)
+
+    def saved_score():
+        other = SqliteBackend(saves / DB_NAME)
+        try:
+            return other.load_all()[0].subjects[0].assignments[0].current_score
+        finally:
+            other.close()
+
+    assert saved_score() == 5.0
+    manager.close()
+    assert not manager.is_dirty()
+    assert saved_score() == 9.0
@@ -0,0 +1,46 @@
+import json
+
+from source import cli, snapshot, utils
+from source.journal import set_op
+from source.storage import JsonBackend
+
+
+def test_snapshot_verify_round_trip(saves, make_semester, monkeypatch, capsys):
+    monkeypatch.setattr(utils, "SNAPSHOTS", True)
+    monkeypatch.setattr(snapshot, "_SNAPSHOTS", {})
+    semesters = [make_semester([(3.0, [(50.0, 100.0, True), (7.25, 10.0, False)]), (1.5, [])]),
+                 make_semester([(2.0, [(19.0, 20.0, True)])], year="2026", season="Spring")]
+    for semester in semesters:
+        semester.to_json()
+    assert snapshot.verify(saves) == []
+    assert cli.main(["snapshot", "verify", "--dir", str(saves)]) == cli.EXIT_OK
+
+    # a journal append does not rewrite the snapshot, so that record is stale until reloaded
+    written = (saves / snapshot.SNAPSHOT_FILE).read_bytes()
+    semester = semesters[0]
+    assignment = semester.subjects[0].assignments[1]
+    assignment.isDone = True
+    JsonBackend().append(semester, set_op(semester, assignment, isDone=True))
+    assert (saves / snapshot.SNAPSHOT_FILE).read_bytes() == written
+    assert snapshot.verify(saves) == [f"{semester.file_path}: snapshot record is stale"]
+    utils._SEMESTER_CACHE.clear()
+    reloaded = utils.load_semester_file(saves / semester.file_path)
+    assert reloaded.subjects[0].score == 57.25
+    assert snapshot.verify(saves) == []
+
+    # the next start is served from the records and gives the same semesters
+    utils._SEMESTER_CACHE.clear()
+    assert [s.to_dict() for s in utils.load_json_semesters()] == [s.to_dict() for s in semesters]
+
+    # a record that does not match its JSON file is reported
+    path = saves / semesters[1].file_path
+    data = json.loads(path.read_text())
+    blob = snapshot.encode_semester(dict(data, subjects=[]))
+    snap = snapshot.Snapshot(saves)
+    snap.put(path.name, snap.records[path.name][0], blob)
+    snap.write()
+    assert snapshot.verify(saves) == [f"{path.name}: snapshot differs from the JSON file (subjects)"]
+    capsys.readouterr()
+    assert cli.main(["snapshot", "verify", "--dir", str(saves)]) == cli.EXIT_ERROR
+    assert path.name in capsys.readouterr().err
+    assert snapshot.build(saves) == 2 and snapshot.verify(saves) == []
@@ -0,0 +1,103 @@
+from source.classes import Assignment
+from source.storage import DB_NAME, SqliteBackend, migrate_json_to_sqlite
+
+
+def _dump(semesters):
+    return sorted((s.to_dict() for s in semesters), key=lambda d: d["file_path"])
+
+
+def _writes(backend):
+    statements = []
+    backend.conn.set_trace_callback(
+        lambda sql: statements.append(sql.split()[0]) if sql.split()[0] in ("INSERT", "UPDATE", "DELETE") else None)
+    return statements
+
+
+def test_round_trip(saves, make_semester):
+    semesters = [make_semester([(3.0, [(50.0, 100.0, True), (7.5, 10.0, False)]), (1.5, [])]),
+                 make_semester([(2.0, [(19.0, 20.0, True)])], year="2026", season="Spring")]
+    backend = SqliteBackend()
+    for semester in semesters:
+        backend.save(semester)
+    backend.close()
+
+    other = SqliteBackend(saves / DB_NAME)
+    try:
+        assert _dump(other.load_all()) == _dump(semesters)
+    finally:
+        other.close()
+
+
+def test_one_edit_writes_one_assignment_row(saves, make_semester):
+    backend = SqliteBackend()
+    backend.save(make_semester([(3.0, [(50.0, 100.0, True), (10.0, 100.0, True)]), (1.0, [(90.0, 100.0, True)])]))
+    backend.close()
+    backend = SqliteBackend()
+    try:
+        [semester] = backend.load_all()
+        writes = _writes(backend)
+        backend.save(semester)
+        assert writes == []  # nothing changed
+
+        semester.subjects[0].assignments[1].current_score = 20.0
+        backend.save(semester)
+        assert writes == ["UPDATE", "UPDATE"]  # the assignment and the semester's gpa
+        assert backend.conn.execute("SELECT current_score FROM assignments WHERE name = 'Work 1' "
+                                    "AND position = 1").fetchone() == (20.0,)
+
+        del writes[:]
+        semester.subjects[1].assignments.append(Assignment(name="Late", max_score=5.0))
+        semester.subjects[0].assignments.pop(0)
+        backend.save(semester)
+        # new row, removed row, Work 1 moved up, and the gpa
+        assert sorted(writes) == ["DELETE", "INSERT", "UPDATE", "UPDATE"]
+        assert backend.conn.execute("SELECT COUNT(*) FROM assignments").fetchone() == (3,)
+    finally:
+        backend.close()
+
+
+def test_delete(saves, make_semester):
+    backend = SqliteBackend()
+    try:
+        keep = make_semester([(3.0, [(50.0, 100.0, True)])], year="2026", season="Spring")
+        gone = make_semester([(2.0, [(19.0, 20.0, True)])])
+        backend.save(keep)
+        backend.save(gone)
+        backend.delete(gone)
+        assert [s.file_path for s in backend.load_all()] == [keep.file_path]
+        assert backend.conn.execute("SELECT COUNT(*) FROM subjects").fetchone() == (1,)
+        assert backend.conn.execute("SELECT COUNT(*) FROM assignments").fetchone() == (1,)
+    finally:
+        backend.close()
+
+
+def test_migrating_twice_copies_each_semester_once(saves, make_semester):
+    semesters = [make_semester([(3.0, [(50.0, 100.0, True)])]),
+                 make_semester([(2.0, [(19.0, 20.0, True)])], year="2026", season="Spring")]
+    for semester in semesters:
+        semester.to_json()
+    assert migrate_json_to_sqlite() == 2
+    assert migrate_json_to_sqlite() == 0
+    backend = SqliteBackend()
+    try:
+        assert _dump(backend.load_all()) == _dump(semesters)
+    finally:
+        backend.close()
+
+
+def test_reload_after_another_connection_writes(saves, make_semester):
+    first, second = SqliteBackend(), SqliteBackend()
+    try:
+        first.save(make_semester([(3.0, [(50.0, 100.0, True)])]))
+        [loaded] = second.load_all()
+        assert second.load_all()[0] is loaded  # unchanged database: the cached models
+
+        [mine] = first.load_all()
+        mine.subjects[0].assignments[0].current_score = 70.0
+        first.save(mine)
+        [reloaded] = second.load_all()
+        assert reloaded is not loaded
+        assert reloaded.subjects[0].score == 70.0
+    finally:
+        first.close()
+        second.close()
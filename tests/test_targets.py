@@ -0,0 +1,65 @@
+import itertools
+import random
+
+import pytest
+
+from source import cli
+from source.gradecal import get_grading_scale
+from source.targets import check_target, grade_options, solve_gpa, solve_gpax
+
+
+def _brute_force(semesters, target):
+    """Fewest points reaching `target` by trying every combination of reachable bands (None: unreachable)."""
+    subjects = [s for semester in semesters for s in semester.subjects]
+    total_credit = sum(s.credit for s in subjects)
+    best = None
+    for combo in itertools.product(*(grade_options(s) for s in subjects)):
+        points = sum(o.grade_point * s.credit for o, s in zip(combo, subjects))
+        if points >= target * total_credit - 1e-9:
+            cost = sum(o.needed for o in combo)
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+def test_solver_matches_brute_force(make_semester):
+    rng = random.Random(25)
+    for case in range(400):
+        semesters = [make_semester([(float(rng.choice([1, 2, 3, 4])),
+                                     [(float(rng.randint(0, 40)), 40.0, rng.random() < 0.5)
+                                      for _ in range(rng.randint(1, 3))])
+                                    for _ in range(rng.randint(1, 3))])
+                     for _ in range(rng.randint(1, 2))]
+        target = rng.randint(0, 80) / 20
+        plan = solve_gpa(semesters[0], target) if len(semesters) == 1 else solve_gpax(semesters, target)
+        expected = _brute_force(semesters, target)
+        assert plan.feasible == (expected is not None), case
+        if expected is not None:
+            assert plan.needed == pytest.approx(expected), case
+            assert plan.gpa >= target - 1e-9, case
+
+
+def test_rounded_units_never_overstate_the_gpa(make_semester):
+    rng = random.Random(1)
+    for case in range(300):  # credits in sevenths, elevenths and thirteenths cap the resolution
+        semester = make_semester([(rng.choice([1, 2, 3]) / d, [(float(rng.randint(50, 80)), 100.0, True),
+                                                                 (0.0, rng.choice([0.0, 10.0]), False)])
+                                  for d in (7, 11, 13)])
+        current, best = solve_gpa(semester, 0.0).gpa, solve_gpa(semester, 4.0).gpa
+        target = min(4.0, rng.choice([current, best]) + rng.choice([0.0, 1e-5, 2e-4]))
+        plan = solve_gpa(semester, target)
+        assert plan.feasible == (_brute_force([semester], target) is not None), case
+        assert plan.feasible == (plan.gpa >= target - 1e-9), case
+
+
+@pytest.mark.parametrize("goal", [float("nan"), float("inf"), -0.5, 4.01])
+def test_unreachable_targets_are_rejected(goal, make_semester):
+    with pytest.raises(ValueError):
+        check_target(goal)
+    with pytest.raises(ValueError):
+        solve_gpa(make_semester([(3.0, [(10.0, 40.0, False)])]), goal)
+
+
+@pytest.mark.parametrize("goal", ["nan", "inf", "-1", "9"])
+def test_cli_rejects_bad_goals(goal, capsys):
+    assert cli.main(["target", "--", goal]) == cli.EXIT_ERROR
+    assert f"from 0 to {max(get_grading_scale().points):g}" in capsys.readouterr().err
@@ -0,0 +1,45 @@
+import json
+
+from source import utils
+from source.classes import Semester
+
+
+def _write(folder, is_done):
+    path = folder / "2025_Fall.json"
+    path.write_text(json.dumps({"year": "2025", "season": "Fall", "file_path": path.name, "subjects": [
+        {"name": "Class 0", "credit": 3, "assignments": [
+            {"name": "Work 0", "max_score": 10, "current_score": 8, "isDone": is_done}]}]}))
+    return path
+
+
+def _load_twice(path):
+    first = utils.load_semester_file(path, trusted=True)
+    utils._SEMESTER_CACHE.clear()
+    return first, utils.load_semester_file(path, trusted=True)
+
+
+def test_lax_typed_file_is_never_trusted(saves, monkeypatch):
+    monkeypatch.setattr(utils, "_TRUSTED", {})
+    path = _write(saves, "false")
+    first, second = _load_twice(path)
+    assert path.name not in utils._trusted_files(saves)
+    assert first.subjects[0].assignments[0].isDone is False
+    assert second.subjects[0].assignments[0].isDone is False
+    assert second.subjects[0].score == 0.0
+
+
+def test_plain_file_is_trusted_and_rebuilt_the_same(saves, monkeypatch):
+    monkeypatch.setattr(utils, "_TRUSTED", {})
+    path = _write(saves, True)
+    first, second = _load_twice(path)
+    assert path.name in utils._trusted_files(saves)
+    assert second.to_dict() == first.to_dict()
+    assert type(second.subjects[0].credit) is float
+
+
+def test_has_model_types():
+    assert Semester.has_model_types({"subjects": [{"name": "A", "credit": 1, "assignments": []}]})
+    assert not Semester.has_model_types({"subjects": [{"name": "A", "credit": "1"}]})
+    assert not Semester.has_model_types({"gpa": True})
+    assert not Semester.has_model_types({"journal_seq": 2.0})
+    assert not Semester.has_model_types({"subjects": "none"})
@@ -0,0 +1,79 @@
+import io
+import json
+import random
+
+import pytest
+
+from source import batch
+from source.gradecal import DEFAULT_SCALE, GradingScale, calculate_gpa, calculate_gpax, set_grading_scale
+
+vectorized = pytest.importorskip("source.vectorized")
+if not vectorized.available():
+    pytest.skip("numpy is not installed", allow_module_level=True)
+
+
+def _random_semesters(make_semester, rng, count):
+    semesters = []
+    for _ in range(count):
+        subjects = []
+        for _ in range(rng.randint(0, 9)):
+            credit = rng.choice([0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, rng.uniform(0.1, 5.0)])
+            work = [(rng.choice([rng.uniform(0, 40), float(rng.randint(0, 40))]), 40.0, rng.random() < 0.8)
+                    for _ in range(rng.randint(0, 5))]
+            subjects.append((credit, work))
+        semesters.append(make_semester(subjects))
+    return semesters
+
+
+@pytest.mark.parametrize("scale", [DEFAULT_SCALE,
+                                   GradingScale({"A": 85, "B": 72.5, "C": 60, "D": 50, "F": 0},
+                                                {"A": 4.0, "B": 3.1, "C": 2.2, "D": 1.3, "F": 0.0}, name="odd")])
+def test_matches_scalar_gpa_exactly(make_semester, scale):
+    rng = random.Random(8)
+    semesters = _random_semesters(make_semester, rng, 300)
+    set_grading_scale(scale)
+    try:
+        assert vectorized.calculate_gpa_many(semesters).tolist() == [calculate_gpa(s) for s in semesters]
+        students = [semesters[i:i + rng.randint(1, 12)] for i in range(0, len(semesters), 12)]
+        assert vectorized.calculate_gpax_many(students).tolist() == [calculate_gpax(s) for s in students]
+        assert vectorized.calculate_gpax_vectorized([]) == calculate_gpax([]) == 0.0
+    finally:
+        set_grading_scale(DEFAULT_SCALE)
+
+
+def test_batch_report_vectorizes_across_students(make_semester, tmp_path, monkeypatch):
+    rng = random.Random(1)
+    root = tmp_path / "students"
+    expected = {}
+    for i in range(40):  # a realistic 10 or so subjects each, far below the threshold per student
+        folder = root / f"student{i:02d}"
+        folder.mkdir(parents=True)
+        semesters = _random_semesters(make_semester, rng, 2)
+        for year, semester in enumerate(semesters):
+            semester.year, semester.file_path = str(2020 + year), f"{2020 + year}_Fall.json"
+            (folder / semester.file_path).write_text(json.dumps(semester.to_dict()))
+        expected[folder.name] = round(calculate_gpax(semesters), 4)
+    calls = []
+    real = vectorized.calculate_gpax_many
+    monkeypatch.setattr(vectorized, "calculate_gpax_many", lambda students, scale=None: calls.append(len(students))
+                        or real(students, scale))
+
+    out = io.StringIO()
+    assert batch.batch_report(root, out, fmt="jsonl", workers=1) == 40
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert {r["student"]: r["gpax"] for r in rows} == expected
+    # the first chunk is big enough for numpy; the 8 students left over use the scalar loops
+    assert calls == [batch.CHUNK_SIZE]
+
+
+def test_batch_row_names_the_files_it_could_not_read(make_semester, tmp_path):
+    folder = tmp_path / "student00"
+    folder.mkdir()
+    semester = make_semester([(3.0, [(80.0, 100.0, True)])])
+    semester.file_path = "2025_Fall.json"
+    (folder / semester.file_path).write_text(json.dumps(semester.to_dict()))
+    (folder / "2026_Spring.json").write_text("{not json")
+
+    row = batch.summarize_student(str(folder))
+    assert row["semesters"] == 1 and row["gpax"] == round(calculate_gpax([semester]), 4)
+    assert row["error"].startswith("2026_Spring.json: ")
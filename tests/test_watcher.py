@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from source import utils
+from source.watcher import SaveWatcher
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_reports_and_reloads_outside_changes(saves, make_semester, use_inotify):
+    semester = make_semester([(3.0, [(50.0, 100.0, True)])])
+    semester.to_json()
+    path = saves / semester.file_path
+    watcher = SaveWatcher(saves, use_inotify=use_inotify)
+    try:
+        assert not watcher.poll()  # baseline; our own save already matches the cache
+        assert not watcher.poll()
+
+        # another program edits the loaded file
+        data = json.loads(path.read_text())
+        data["subjects"][0]["assignments"][0]["current_score"] = 75.5
+        path.write_text(json.dumps(data))
+        updated = watcher.refresh()
+        assert list(updated) == [path]
+        assert updated[path].subjects[0].score == 75.5
+        assert not watcher.poll()
+
+        # a file appears that was never loaded
+        other = saves / "2026_Spring.json"
+        other.write_text(json.dumps(dict(data, year="2026", season="Spring", file_path=other.name)))
+        changes = watcher.poll()
+        assert changes.added == [other] and not changes.modified and not changes.removed
+        assert watcher.refresh() == {}
+
+        # both are deleted; only the loaded one has a semester to drop
+        path.unlink()
+        other.unlink()
+        changes = watcher.poll()
+        assert sorted(changes.removed) == sorted([path, other]) and not changes.added
+        assert watcher.refresh() == {path: None}
+        assert path not in utils._SEMESTER_CACHE
+        assert not watcher.poll()
+    finally:
+        watcher.close()
+
+
+def test_poll_survives_a_load_on_another_thread(saves, make_semester, monkeypatch):
+    make_semester([(3.0, [(50.0, 100.0, True)])]).to_json()
+    elsewhere = saves.parent / "Other"
+
+    class Loading(type(saves)):
+        @property
+        def parent(self):  # the notifier's loader thread adds a semester while poll() looks
+            utils._SEMESTER_CACHE[elsewhere / f"{len(utils._SEMESTER_CACHE)}.json"] = (None, None)
+            return elsewhere
+
+    utils._SEMESTER_CACHE[Loading(elsewhere / "2025_Fall.json")] = (None, None)
+    watcher = SaveWatcher(saves, use_inotify=False)
+    try:
+        assert not watcher.poll()
+    finally:
+        watcher.close()